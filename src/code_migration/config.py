@@ -41,6 +41,10 @@ class AnalysisSettings(BaseSettings):
     cost_rate_per_hour: float = Field(default=100.0, description="Hourly rate for estimates")
     max_workers: int = Field(default=4, description="Concurrent analysis workers")
     timeout_seconds: int = Field(default=300, description="Operation timeout")
+    cache_dir: str = Field(
+        default="~/.cache/code-migration",
+        description="Directory for persistent analysis caches (empty to disable)"
+    )
 
 
 class ServerSettings(BaseSettings):
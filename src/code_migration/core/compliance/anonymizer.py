@@ -11,7 +11,97 @@ Provides secure data handling:
 import hashlib
 import re
 import secrets
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+
+# Patterns are compiled once at import time; the mask helpers run per PII hit.
+_NON_DIGIT_RE = re.compile(r'\D')
+_DIGIT_RE = re.compile(r'\d')
+# Lengths are capped at RFC 5321 limits (64-char local part, 63-char labels)
+# so a long run without '@' costs O(n) rather than O(n^2) to reject.
+_EMAIL_RE = re.compile(
+    r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9-]{1,63}(?:\.[A-Za-z0-9-]{1,63}){0,4}\.[A-Za-z]{2,24}\b'
+)
+_PHONE_RE = re.compile(r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b')
+_SSN_RE = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
+_CC_RE = re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b')
+_ZIP_RE = re.compile(r'\b\d{5}(?:-\d{4})?\b')
+# Street names are bounded to one comma-free segment so a missing suffix
+# cannot make the lazy quantifier backtrack across the whole input.
+_STREET_RE = re.compile(
+    r'\d+\s+[^,\n]{0,80}?(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr)',
+    re.IGNORECASE
+)
+_HEX_RE = re.compile(r'\A[0-9a-f]+\Z')
+
+# Free-text PII patterns, most specific first so that alternation order
+# resolves overlaps (a card number is never split into a phone match).
+_TEXT_PII_PATTERNS = (
+    ('email', _EMAIL_RE),
+    ('credit_card', _CC_RE),
+    ('ssn', _SSN_RE),
+    ('phone', _PHONE_RE),
+)
+
+
+# Deletes every ASCII character except 0-9
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(
+    chr(code) for code in range(128) if not '0' <= chr(code) <= '9'
+))
+
+
+def _extract_digits(value: str) -> str:
+    """Return only the digits of value."""
+    if value.isascii():
+        return value.translate(_NON_DIGIT_TABLE)
+    # The table only covers ASCII; keep regex semantics for other input
+    return _NON_DIGIT_RE.sub('', value)
+
+
+# Default mask runs, long enough for any phone, SSN or card number
+_STAR_CACHE = tuple('*' * i for i in range(33))
+
+
+def _mask_prefix(mask_char: str, length: int) -> str:
+    """Return ``length`` mask characters, reusing cached runs of '*'."""
+    if mask_char == '*' and 0 <= length < len(_STAR_CACHE):
+        return _STAR_CACHE[length]
+    return mask_char * length
+
+
+@lru_cache(maxsize=8)
+def _digit_mask_table(mask_char: str) -> Dict[int, str]:
+    """Translate table mapping every ASCII digit to mask_char."""
+    return {code: mask_char for code in range(ord('0'), ord('9') + 1)}
+
+
+def _mask_leading_digits(digits: str, mask_char: str, keep: int = 4) -> str:
+    """Mask all but the last ``keep`` characters of a digit-only string."""
+    return _mask_prefix(mask_char, len(digits) - keep) + digits[-keep:]
+
+
+def _may_contain_text_pii(text: str, pii_types: FrozenSet[str]) -> bool:
+    """Cheap pre-check: emails need an '@', every other pattern a digit."""
+    if 'email' in pii_types and '@' in text:
+        return True
+    if pii_types - {'email'}:
+        return _DIGIT_RE.search(text) is not None
+    return False
+
+
+@lru_cache(maxsize=16)
+def _text_pii_union(pii_types: FrozenSet[str]) -> Optional['re.Pattern']:
+    """Build a single alternation regex for the requested PII types."""
+    parts = [
+        f'(?P<{name}>{pattern.pattern})'
+        for name, pattern in _TEXT_PII_PATTERNS
+        if name in pii_types
+    ]
+    if not parts:
+        return None
+    return re.compile('|'.join(parts))
 
 
 class DataAnonymizer:
@@ -26,17 +116,62 @@ class DataAnonymizer:
     - Reversible anonymization
     """
     
-    def __init__(self, salt: Optional[str] = None):
+    def __init__(self, salt: Optional[str] = None, fast_hash: bool = True):
         """
         Initialize data anonymizer.
         
         Args:
             salt: Salt for hash-based anonymization
+            fast_hash: Use keyed BLAKE2b for tokens and hashes; set to False
+                for the legacy truncated SHA-256(value + salt) output
         """
-        self.salt = salt or secrets.token_hex(16)
-        self.token_map: Dict[str, str] = {}
+        # Generated on first use so mask-only instances skip the CSPRNG read
+        self._salt = salt or None
+        self._salt_bytes: Optional[bytes] = None
+        self._hash_key: Optional[bytes] = None
+        self.fast_hash = fast_hash
+        # Token -> original value; also the set of issued tokens
         self.reverse_map: Dict[str, str] = {}
     
+    # Method names by format type, resolved per call so no bound methods are
+    # held on the instance
+    _FORMAT_METHODS = {
+        'email': 'mask_email',
+        'phone': 'mask_phone',
+        'ssn': 'mask_ssn',
+        'credit_card': 'mask_credit_card',
+        'name': 'anonymize_name',
+        'address': 'anonymize_address'
+    }
+    
+    # Field types handled by batch_anonymize before format dispatch
+    _BATCH_METHODS = {
+        'token': 'tokenize',
+        'hash': 'hash_anonymize'
+    }
+    
+    @property
+    def salt(self) -> str:
+        """Salt for hash-based anonymization, generated on first access."""
+        if self._salt is None:
+            self._salt = secrets.token_hex(16)
+        return self._salt
+    
+    @salt.setter
+    def salt(self, value: str) -> None:
+        self._salt = value
+        self._salt_bytes = None
+        self._hash_key = None
+    
+    def _derive_salt_keys(self) -> None:
+        """Encode the salt and derive the BLAKE2b key from it."""
+        self._salt_bytes = self.salt.encode('utf-8')
+        # BLAKE2b keys are limited to 64 bytes
+        if len(self._salt_bytes) <= hashlib.blake2b.MAX_KEY_SIZE:
+            self._hash_key = self._salt_bytes
+        else:
+            self._hash_key = hashlib.blake2b(self._salt_bytes).digest()
+    
     def mask_email(self, email: str, mask_char: str = '*', preserve_domain: bool = True) -> str:
         """
         Mask email address.
@@ -49,16 +184,21 @@ class DataAnonymizer:
         Returns:
             Masked email
         """
-        if '@' not in email:
+        at = email.find('@')
+        if at < 0:
             return email
         
-        local, domain = email.split('@', 1)
+        if preserve_domain and at > 2:
+            # Common case: keep first/last local char, everything from there on
+            return f"{email[0]}{_mask_prefix(mask_char, at - 2)}{email[at - 1:]}"
+        
+        local, domain = email[:at], email[at + 1:]
         
         # Mask local part
         if len(local) <= 2:
-            masked_local = mask_char * len(local)
+            masked_local = _mask_prefix(mask_char, len(local))
         else:
-            masked_local = local[0] + mask_char * (len(local) - 2) + local[-1]
+            masked_local = local[0] + _mask_prefix(mask_char, len(local) - 2) + local[-1]
         
         if preserve_domain:
             return f"{masked_local}@{domain}"
@@ -85,30 +225,33 @@ class DataAnonymizer:
             Masked phone number
         """
         # Extract digits
-        digits = re.sub(r'\D', '', phone)
+        digits = _extract_digits(phone)
         
         if len(digits) < 4:
-            return mask_char * len(phone)
-        
-        # Keep last 4 digits
-        visible = digits[-4:]
-        masked = mask_char * (len(digits) - 4) + visible
+            return _mask_prefix(mask_char, len(phone))
         
         if preserve_format:
-            # Try to preserve original format
-            result = ''
-            digit_index = 0
+            if phone.isascii():
+                # Find where the last 4 digits start, then mask every digit
+                # before it with one C-level translate
+                cut = len(phone)
+                kept = 0
+                while kept < 4:
+                    cut -= 1
+                    if '0' <= phone[cut] <= '9':
+                        kept += 1
+                
+                return phone[:cut].translate(_digit_mask_table(mask_char)) + phone[cut:]
             
-            for char in phone:
-                if char.isdigit():
-                    result += masked[digit_index]
-                    digit_index += 1
-                else:
-                    result += char
+            # Overwrite every digit position except the last 4 in place
+            buf = list(phone)
+            for match in islice(_DIGIT_RE.finditer(phone), len(digits) - 4):
+                buf[match.start()] = mask_char
             
-            return result
+            return ''.join(buf)
         else:
-            return masked
+            # Keep last 4 digits
+            return _mask_leading_digits(digits, mask_char)
     
     def mask_ssn(self, ssn: str, mask_char: str = '*') -> str:
         """
@@ -122,13 +265,13 @@ class DataAnonymizer:
             Masked SSN
         """
         # Extract digits
-        digits = re.sub(r'\D', '', ssn)
+        digits = _extract_digits(ssn)
         
         if len(digits) != 9:
-            return mask_char * len(ssn)
+            return _mask_prefix(mask_char, len(ssn))
         
         # Format: ***-**-1234
-        return f"{mask_char * 3}-{mask_char * 2}-{digits[-4:]}"
+        return f"{_mask_prefix(mask_char, 3)}-{_mask_prefix(mask_char, 2)}-{digits[-4:]}"
     
     def mask_credit_card(self, card: str, mask_char: str = '*') -> str:
         """
@@ -142,21 +285,19 @@ class DataAnonymizer:
             Masked credit card number
         """
         # Extract digits
-        digits = re.sub(r'\D', '', card)
+        digits = _extract_digits(card)
         
         if len(digits) < 4:
-            return mask_char * len(card)
+            return _mask_prefix(mask_char, len(card))
         
         # Show last 4 digits only
-        visible = digits[-4:]
-        masked = mask_char * (len(digits) - 4) + visible
+        masked = _mask_leading_digits(digits, mask_char)
         
         # Format in groups of 4
-        formatted = []
-        for i in range(0, len(masked), 4):
-            formatted.append(masked[i:i+4])
+        if len(masked) == 16:
+            return f"{masked[:4]} {masked[4:8]} {masked[8:12]} {masked[12:]}"
         
-        return ' '.join(formatted)
+        return ' '.join([masked[i:i + 4] for i in range(0, len(masked), 4)])
     
     def anonymize_text(self, text: str, pii_types: List[str] = None) -> str:
         """
@@ -172,29 +313,26 @@ class DataAnonymizer:
         if pii_types is None:
             pii_types = ['email', 'phone', 'ssn', 'credit_card']
         
-        anonymized = text
-        
-        if 'email' in pii_types:
-            # Email pattern
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            anonymized = re.sub(email_pattern, lambda m: self.mask_email(m.group()), anonymized)
-        
-        if 'phone' in pii_types:
-            # Phone pattern
-            phone_pattern = r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b'
-            anonymized = re.sub(phone_pattern, lambda m: self.mask_phone(m.group()), anonymized)
+        pii_types = frozenset(pii_types)
+        union = _text_pii_union(pii_types)
+        if union is None or not _may_contain_text_pii(text, pii_types):
+            return text
         
-        if 'ssn' in pii_types:
-            # SSN pattern
-            ssn_pattern = r'\b\d{3}-\d{2}-\d{4}\b'
-            anonymized = re.sub(ssn_pattern, lambda m: self.mask_ssn(m.group()), anonymized)
-        
-        if 'credit_card' in pii_types:
-            # Credit card pattern
-            cc_pattern = r'\b(?:\d{4}[-\s]?){3}\d{4}\b'
-            anonymized = re.sub(cc_pattern, lambda m: self.mask_credit_card(m.group()), anonymized)
+        return union.sub(self._mask_text_match, text)
+    
+    def _mask_text_match(self, match: 're.Match') -> str:
+        """Mask a single match of the free-text PII union regex."""
+        kind = match.lastgroup
+        value = match.group()
         
-        return anonymized
+        if kind == 'email':
+            return self.mask_email(value)
+        elif kind == 'credit_card':
+            return self.mask_credit_card(value)
+        elif kind == 'ssn':
+            return self.mask_ssn(value)
+        else:
+            return self.mask_phone(value)
     
     def tokenize(self, value: str, reversible: bool = True) -> str:
         """
@@ -209,10 +347,9 @@ class DataAnonymizer:
         """
         if reversible:
             # Use deterministic tokenization
-            token = hashlib.sha256(f"{value}{self.salt}".encode()).hexdigest()[:16]
+            token = self._salted_digest(value, 16)
             
             # Store mapping for reversal
-            self.token_map[value] = token
             self.reverse_map[token] = value
             
             return token
@@ -269,13 +406,12 @@ class DataAnonymizer:
         # Extract ZIP code if preservation is requested
         zip_code = None
         if preserve_zip:
-            zip_match = re.search(r'\b\d{5}(?:-\d{4})?\b', address)
+            zip_match = _ZIP_RE.search(address)
             if zip_match:
                 zip_code = zip_match.group()
         
         # Replace street address
-        anonymized = re.sub(r'\d+\s+.*?(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr)', 
-                          '[ADDRESS REDACTED]', address, flags=re.IGNORECASE)
+        anonymized = _STREET_RE.sub('[ADDRESS REDACTED]', address)
         
         # Add back ZIP code if preserved
         if zip_code:
@@ -294,8 +430,38 @@ class DataAnonymizer:
         Returns:
             Hashed value
         """
-        hash_value = hashlib.sha256(f"{value}{self.salt}".encode()).hexdigest()
-        return hash_value[:length]
+        return self._salted_digest(value, length)
+    
+    def hash_anonymize_many(self, values: List[str], length: int = 16) -> List[str]:
+        """
+        Hash-based anonymization of many values.
+        
+        Args:
+            values: Values to anonymize
+            length: Length of each hash to return
+            
+        Returns:
+            Hashed values, in input order
+        """
+        salted_digest = self._salted_digest
+        return [salted_digest(value, length) for value in values]
+    
+    def _salted_digest(self, value: str, length: int) -> str:
+        """Salted hex digest of value, truncated to length characters."""
+        data = value.encode('utf-8')
+        if self._hash_key is None:
+            self._derive_salt_keys()
+        
+        if self.fast_hash:
+            # Size the digest to the requested hex length instead of truncating
+            digest_size = min(max((length + 1) // 2, 1), hashlib.blake2b.MAX_DIGEST_SIZE)
+            return hashlib.blake2b(
+                data, digest_size=digest_size, key=self._hash_key
+            ).hexdigest()[:length]
+        
+        hasher = hashlib.sha256(data)
+        hasher.update(self._salt_bytes)
+        return hasher.hexdigest()[:length]
     
     def format_preserving_anonymize(self, value: str, format_type: str) -> str:
         """
@@ -308,21 +474,9 @@ class DataAnonymizer:
         Returns:
             Format-preserved anonymized value
         """
-        if format_type == 'email':
-            return self.mask_email(value)
-        elif format_type == 'phone':
-            return self.mask_phone(value)
-        elif format_type == 'ssn':
-            return self.mask_ssn(value)
-        elif format_type == 'credit_card':
-            return self.mask_credit_card(value)
-        elif format_type == 'name':
-            return self.anonymize_name(value)
-        elif format_type == 'address':
-            return self.anonymize_address(value)
-        else:
-            # Default to hash-based anonymization
-            return self.hash_anonymize(value)
+        # Default to hash-based anonymization
+        method = self._FORMAT_METHODS.get(format_type, 'hash_anonymize')
+        return getattr(self, method)(value)
     
     def batch_anonymize(self, data: Dict[str, str], field_types: Dict[str, str]) -> Dict[str, str]:
         """
@@ -335,21 +489,32 @@ class DataAnonymizer:
         Returns:
             Anonymized data
         """
-        anonymized = {}
+        return dict(self.batch_anonymize_iter(data, field_types))
+    
+    def batch_anonymize_iter(self, data: Dict[str, str],
+                             field_types: Dict[str, str]) -> Iterator[Tuple[str, str]]:
+        """
+        Lazily anonymize multiple fields.
+        
+        Args:
+            data: Dictionary of data to anonymize
+            field_types: Dictionary mapping field names to anonymization types
+            
+        Yields:
+            (field, anonymized value) pairs in input order
+        """
+        batch_methods = self._BATCH_METHODS
+        format_methods = self._FORMAT_METHODS
         
         for field, value in data.items():
             field_type = field_types.get(field, 'text')
             
             if field_type == 'skip':
-                anonymized[field] = value
-            elif field_type == 'token':
-                anonymized[field] = self.tokenize(value)
-            elif field_type == 'hash':
-                anonymized[field] = self.hash_anonymize(value)
-            else:
-                anonymized[field] = self.format_preserving_anonymize(value, field_type)
-        
-        return anonymized
+                yield field, value
+                continue
+            
+            method = batch_methods.get(field_type) or format_methods.get(field_type, 'hash_anonymize')
+            yield field, getattr(self, method)(value)
     
     def generate_anonymization_report(self, original_data: Dict, anonymized_data: Dict) -> Dict:
         """
@@ -366,7 +531,7 @@ class DataAnonymizer:
             'fields_processed': len(original_data),
             'fields_changed': 0,
             'field_details': {},
-            'tokens_generated': len(self.token_map)
+            'tokens_generated': len(self.reverse_map)
         }
         
         for field in original_data:
@@ -389,16 +554,17 @@ class DataAnonymizer:
     
     def _detect_anonymization_type(self, original: str, anonymized: str) -> str:
         """Detect the type of anonymization applied."""
+        # Cheapest and most common outcomes first; the regex runs last
         if anonymized == original:
             return 'none'
+        elif '*' in anonymized:
+            return 'partial_mask'
         elif anonymized.startswith('[ANONYMIZED]') or anonymized == '[ADDRESS REDACTED]':
             return 'masking'
-        elif re.match(r'^[a-f0-9]+$', anonymized):
-            return 'hash'
-        elif len(anonymized) == 16 and anonymized in self.token_map.values():
+        elif anonymized in self.reverse_map:
             return 'token'
-        elif '*' in anonymized:
-            return 'partial_mask'
+        elif _HEX_RE.match(anonymized):
+            return 'hash'
         else:
             return 'unknown'
     
@@ -410,7 +576,7 @@ class DataAnonymizer:
             Anonymization statistics
         """
         return {
-            'total_tokens': len(self.token_map),
+            'total_tokens': len(self.reverse_map),
             'reversible_tokens': len(self.reverse_map),
             'salt_length': len(self.salt),
             'supported_types': ['email', 'phone', 'ssn', 'credit_card', 'name', 'address', 'text']
@@ -8,13 +8,478 @@ Generates comprehensive audit reports:
 - Security audit trails
 """
 
+import html
 import json
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from code_migration.config import settings
 
 from ..security import SecurityAuditLogger
 
+# Use orjson for report export when installed
+try:
+    import orjson
+    
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def _freeze(value):
+    """Recursively wrap a constant table in read-only views."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Recursively copy read-only views back into plain dicts and lists."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Constant assessment tables, built once and shared read-only by every report;
+# reports hand callers plain copies (see _thaw).
+_SOC2_INCIDENT_RESPONSE = _freeze({
+    'compliant': True,  # Simplified
+    'score': 90,
+    'evidence': 'Automated logging and monitoring'
+})
+
+_SOC2_RISK_MANAGEMENT = _freeze({
+    'compliant': True,
+    'score': 85,
+    'evidence': 'Security controls implemented'
+})
+
+_SOC2_AVAILABILITY = _freeze({
+    'service_availability': {
+        'compliant': True,
+        'score': 95,
+        'uptime_percentage': 99.9
+    },
+    'disaster_recovery': {
+        'compliant': True,
+        'score': 80,
+        'backup_frequency': 'Automatic'
+    }
+})
+
+_SOC2_PROCESSING_INTEGRITY = _freeze({
+    'data_accuracy': {
+        'compliant': True,
+        'score': 90,
+        'validation_checks': 'Implemented'
+    },
+    'processing_completeness': {
+        'compliant': True,
+        'score': 85,
+        'error_handling': 'Comprehensive'
+    }
+})
+
+_SOC2_DATA_ENCRYPTION = _freeze({
+    'compliant': True,
+    'score': 95,
+    'encryption_standards': 'AES-256'
+})
+
+_SOC2_PRIVACY = _freeze({
+    'privacy_policy': {
+        'compliant': True,
+        'score': 90,
+        'policy_available': True
+    },
+    'consent_management': {
+        'compliant': True,
+        'score': 85,
+        'consent_tracking': 'Implemented'
+    }
+})
+
+_GDPR_ARTICLE_5 = _freeze({
+    'lawfulness': {'compliant': True, 'score': 90},
+    'fairness': {'compliant': True, 'score': 90},
+    'transparency': {'compliant': True, 'score': 85},
+    'purpose_limitation': {'compliant': True, 'score': 85},
+    'data_minimization': {'compliant': True, 'score': 80},
+    'accuracy': {'compliant': True, 'score': 90},
+    'storage_limitation': {'compliant': True, 'score': 85},
+    'security': {'compliant': True, 'score': 90}
+})
+
+_GDPR_ARTICLE_25 = _freeze({
+    'privacy_by_design': {'compliant': True, 'score': 85},
+    'privacy_by_default': {'compliant': True, 'score': 85}
+})
+
+_GDPR_ARTICLE_32 = _freeze({
+    'technical_measures': {'compliant': True, 'score': 90},
+    'organizational_measures': {'compliant': True, 'score': 85}
+})
+
+_GDPR_ARTICLE_33 = _freeze({
+    'notification_procedure': {'compliant': True, 'score': 85},
+    'timeline': {'compliant': True, 'score': 90}
+})
+
+_GDPR_ARTICLE_35 = _freeze({
+    'dpia_process': {'compliant': True, 'score': 80},
+    'documentation': {'compliant': True, 'score': 85}
+})
+
+_GDPR_PROCESSING_PURPOSES = ('Migration analysis', 'Security scanning')
+
+_GDPR_DATA_SUBJECT_REQUESTS = _freeze({
+    'total_requests': 0,
+    'requests_processed': 0,
+    'average_response_time': 'N/A'
+})
+
+_GDPR_RECOMMENDATIONS = (
+    "Maintain comprehensive privacy documentation",
+    "Regular privacy impact assessments",
+    "Data breach response procedures"
+)
+
+_HIPAA_PRIVACY_RULE = _freeze({
+    'phi_protection': {'compliant': True, 'score': 90},
+    'minimum_necessary': {'compliant': True, 'score': 85},
+    'patient_rights': {'compliant': True, 'score': 85}
+})
+
+_HIPAA_SECURITY_RULE = _freeze({
+    'administrative_safeguards': {'compliant': True, 'score': 85},
+    'physical_safeguards': {'compliant': True, 'score': 80},
+    'technical_safeguards': {'compliant': True, 'score': 90}
+})
+
+_HIPAA_BREACH_RULE = _freeze({
+    'breach_detection': {'compliant': True, 'score': 85},
+    'notification_procedure': {'compliant': True, 'score': 85}
+})
+
+_HIPAA_ENFORCEMENT_RULE = _freeze({
+    'compliance_program': {'compliant': True, 'score': 85},
+    'policies_procedures': {'compliant': True, 'score': 85}
+})
+
+_HIPAA_PHI_TYPES = ('Medical records', 'Patient information')
+
+_HIPAA_SECURITY_MEASURES = _freeze({
+    'access_control': 'Implemented',
+    'encryption': 'AES-256',
+    'audit_logging': 'Comprehensive',
+    'authentication': 'Multi-factor'
+})
+
+_HIPAA_RECOMMENDATIONS = (
+    "Maintain HIPAA security policies",
+    "Regular security training",
+    "Business associate agreements"
+)
+
+_SECURITY_DATA_PROTECTION = _freeze({
+    'data_encrypted': True,
+    'backup_frequency': 'Daily',
+    'retention_policy': '90 days'
+})
+
+_SECURITY_VULNERABILITY_MANAGEMENT = _freeze({
+    'vulnerabilities_scanned': True,
+    'patch_management': 'Automated',
+    'security_updates': 'Current'
+})
+
+_SECURITY_MITIGATION_STRATEGIES = (
+    'Regular security audits',
+    'Employee training',
+    'Incident response planning'
+)
+
+_SECURITY_SCORE = _freeze({
+    'overall_score': 85,
+    'grade': 'B',
+    'status': 'GOOD'
+})
+
+_SECURITY_RECOMMENDATIONS = (
+    "Implement multi-factor authentication",
+    "Regular security training",
+    "Enhanced monitoring and alerting"
+)
+
+_COMPLIANCE_FRAMEWORKS = ('SOC2', 'GDPR', 'HIPAA')
+
+
+# Score thresholds, highest first: (minimum score, grade)
+_GRADE_THRESHOLDS = ((90, 'A'), (80, 'B'))
+_COMPLIANT_THRESHOLD = 80
+
+
+def _mean_score(sections: Dict) -> float:
+    """Average the 'score' of every control in a two-level scorecard."""
+    total = 0
+    count = 0
+    for controls in sections.values():
+        for control in controls.values():
+            total += control.get('score', 0)
+            count += 1
+    return total / count if count else 0
+
+
+def _grade(score: float) -> str:
+    """Map an overall score to a letter grade."""
+    for minimum, grade in _GRADE_THRESHOLDS:
+        if score >= minimum:
+            return grade
+    return 'C'
+
+
+def _compliance_status(score: float) -> str:
+    """Map an overall score to a compliance status."""
+    return 'COMPLIANT' if score >= _COMPLIANT_THRESHOLD else 'NEEDS_IMPROVEMENT'
+
+
+
+def _json_default(value):
+    """Serialize the datetimes found in reports."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+# Invariant HTML report chunks; only the header fields and recommendations vary
+_HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>%(report_type)s Compliance Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .header { background: #f5f5f5; padding: 20px; border-radius: 5px; }
+        .section { margin: 20px 0; }
+        .score { font-size: 24px; font-weight: bold; color: #2E7D32; }
+        .recommendation { background: #FFF3E0; padding: 10px; margin: 5px 0; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>%(report_type)s Compliance Report</h1>
+        <p>Generated: %(generated)s</p>
+    </div>
+    
+    <div class="section">
+        <h2>Compliance Score</h2>
+        <div class="score">%(score)s/100</div>
+    </div>
+    
+    <div class="section">
+        <h2>Recommendations</h2>
+        """
+
+_EMPTY_SECTION = MappingProxyType({})
+
+_HTML_RECOMMENDATION = '<div class="recommendation">%s</div>'
+
+_HTML_TAIL = """
+    </div>
+</body>
+</html>
+        """
+
+@lru_cache(maxsize=256)
+def _is_auth_action(action: str) -> bool:
+    """Classify an audit action as authentication-related."""
+    # Logs use a handful of distinct actions, so each is lowered only once
+    return 'auth' in action.lower()
+
+
+# Number of (window, filter) tallies kept per reporter
+STATS_CACHE_SIZE = 8
+
+# Most events tallied into one report
+REPORT_EVENT_LIMIT = 10000
+
+
+@dataclass
+class EventStats:
+    """Per-report tallies of audit events, built in a single pass."""
+    total_events: int = 0
+    by_type: Counter = field(default_factory=Counter)
+    by_result: Counter = field(default_factory=Counter)
+    pii_events: int = 0
+    phi_events: int = 0
+    auth_attempts: int = 0
+    auth_successes: int = 0
+    auth_failures: int = 0
+    critical_incidents: int = 0
+    
+    def add(self, event: Dict) -> None:
+        """Fold one audit event into the tallies."""
+        event_type = event.get('event_type')
+        result = event.get('result')
+        
+        self.total_events += 1
+        self.by_type[event_type] += 1
+        self.by_result[result] += 1
+        
+        # Read the compliance block once; entries without one skip both probes
+        compliance = event.get('compliance')
+        if compliance:
+            if compliance.get('gdpr_pii_processed', False):
+                self.pii_events += 1
+            if compliance.get('hipaa_phi_accessed', False):
+                self.phi_events += 1
+        
+        if _is_auth_action(event.get('action') or ''):
+            self.auth_attempts += 1
+            if result == 'SUCCESS':
+                self.auth_successes += 1
+            elif result == 'FAILURE':
+                self.auth_failures += 1
+        
+        if event_type == 'SECURITY_VIOLATION' and event.get('details', {}).get('severity') == 'CRITICAL':
+            self.critical_incidents += 1
+
+@dataclass(frozen=True)
+class ReportSpec:
+    """Layout of one report type for AuditReporter._build_report."""
+    report_type: str
+    default_days: int
+    # Only tally events with any of these compliance flags set
+    compliance_flags: Tuple[str, ...]
+    # Constant sections copied in after the report period
+    static_sections: Mapping[str, Mapping]
+    # Report key holding the assessor results, and (name, method) pairs
+    assessment_key: str
+    assessors: Tuple[Tuple[str, str], ...]
+    # Derived sections as (report key, method, inputs); inputs name
+    # 'stats' and/or 'assessment'
+    sections: Tuple[Tuple[str, str, Tuple[str, ...]], ...]
+
+
+SOC2_SPEC = ReportSpec(
+    report_type='SOC2',
+    default_days=90,
+    compliance_flags=(),
+    static_sections=_freeze({
+        'organization': {
+            'name': 'Code Migration Assistant',
+            'description': 'Enterprise code migration tool'
+        }
+    }),
+    # SOC2 Trust Services Criteria
+    assessment_key='trust_services_criteria',
+    assessors=(
+        ('security', '_assess_security_criteria'),
+        ('availability', '_assess_availability_criteria'),
+        ('processing_integrity', '_assess_processing_integrity'),
+        ('confidentiality', '_assess_confidentiality_criteria'),
+        ('privacy', '_assess_privacy_criteria')
+    ),
+    sections=(
+        ('compliance_score', '_calculate_soc2_score', ('assessment',)),
+        ('summary', '_generate_soc2_summary', ('stats', 'assessment')),
+        ('recommendations', '_generate_soc2_recommendations', ('assessment',)),
+        ('evidence', '_collect_soc2_evidence', ('stats',))
+    )
+)
+
+GDPR_SPEC = ReportSpec(
+    report_type='GDPR',
+    default_days=90,
+    # Only PII-processing events feed the GDPR assessment
+    compliance_flags=('gdpr_pii_processed',),
+    static_sections=_freeze({
+        'data_controller': {
+            'name': 'Code Migration Assistant',
+            'contact': 'privacy@example.com'
+        }
+    }),
+    assessment_key='gdpr_articles',
+    assessors=(
+        ('article_5_data_principles', '_assess_gdpr_article_5'),
+        ('article_25_privacy_by_design', '_assess_gdpr_article_25'),
+        ('article_32_security_of_processing', '_assess_gdpr_article_32'),
+        ('article_33_breach_notification', '_assess_gdpr_article_33'),
+        ('article_35_dpia', '_assess_gdpr_article_35')
+    ),
+    sections=(
+        ('pii_processing', '_analyze_pii_processing', ('stats',)),
+        ('compliance_score', '_calculate_gdpr_score', ('assessment',)),
+        ('recommendations', '_generate_gdpr_recommendations', ('assessment',)),
+        ('data_subject_requests', '_analyze_data_subject_requests', ('stats',))
+    )
+)
+
+HIPAA_SPEC = ReportSpec(
+    report_type='HIPAA',
+    default_days=90,
+    # Only PHI-access events feed the HIPAA assessment
+    compliance_flags=('hipaa_phi_accessed',),
+    static_sections=_freeze({
+        'covered_entity': {
+            'name': 'Code Migration Assistant',
+            'type': 'Business Associate'
+        }
+    }),
+    assessment_key='hipaa_rules',
+    assessors=(
+        ('privacy_rule', '_assess_hipaa_privacy_rule'),
+        ('security_rule', '_assess_hipaa_security_rule'),
+        ('breach_notification_rule', '_assess_hipaa_breach_rule'),
+        ('enforcement_rule', '_assess_hipaa_enforcement_rule')
+    ),
+    sections=(
+        ('phi_processing', '_analyze_phi_processing', ('stats',)),
+        ('compliance_score', '_calculate_hipaa_score', ('assessment',)),
+        ('recommendations', '_generate_hipaa_recommendations', ('assessment',)),
+        ('security_measures', '_assess_security_measures', ('stats',))
+    )
+)
+
+SECURITY_AUDIT_SPEC = ReportSpec(
+    report_type='SECURITY_AUDIT',
+    default_days=30,
+    compliance_flags=(),
+    static_sections=_freeze({}),
+    assessment_key='security_analysis',
+    assessors=(
+        ('authentication_events', '_analyze_authentication_events'),
+        ('access_control', '_analyze_access_control'),
+        ('data_protection', '_analyze_data_protection'),
+        ('security_incidents', '_analyze_security_incidents'),
+        ('vulnerability_management', '_analyze_vulnerability_management')
+    ),
+    sections=(
+        ('risk_assessment', '_perform_risk_assessment', ('stats', 'assessment')),
+        ('security_score', '_calculate_security_score', ('assessment',)),
+        ('recommendations', '_generate_security_recommendations', ('assessment',)),
+        ('compliance_status', '_assess_overall_compliance', ('stats',))
+    )
+)
+
+
+REPORT_SPECS = (SOC2_SPEC, GDPR_SPEC, HIPAA_SPEC, SECURITY_AUDIT_SPEC)
+
+
+# Shared tallies for an empty or missing audit log; never mutated
+_NO_EVENTS = EventStats()
+
 
 class AuditReporter:
     """
@@ -40,6 +505,10 @@ class AuditReporter:
         # Initialize audit logger
         log_dir = self.project_path / '.migration-logs'
         self.audit_logger = SecurityAuditLogger(log_dir)
+        
+        # Tallies per (window, filter, log state), reused across reports
+        self._stats_cache: Dict[tuple, EventStats] = {}
+        self._stats_lock = threading.Lock()
     
     def close(self):
         """Close audit reporter and release resources."""
@@ -67,48 +536,7 @@ class AuditReporter:
         Returns:
             SOC2 compliance report
         """
-        if end_date is None:
-            end_date = datetime.now(timezone.utc)
-        if start_date is None:
-            start_date = end_date - timedelta(days=90)
-        
-        # Get audit events
-        events = self.audit_logger.search_logs(
-            start_time=start_date,
-            end_time=end_date,
-            limit=10000
-        )
-        
-        # SOC2 Trust Services Criteria
-        soc2_criteria = {
-            'security': self._assess_security_criteria(events),
-            'availability': self._assess_availability_criteria(events),
-            'processing_integrity': self._assess_processing_integrity(events),
-            'confidentiality': self._assess_confidentiality_criteria(events),
-            'privacy': self._assess_privacy_criteria(events)
-        }
-        
-        # Calculate compliance score
-        compliance_score = self._calculate_soc2_score(soc2_criteria)
-        
-        report = {
-            'report_type': 'SOC2',
-            'report_period': {
-                'start': start_date.isoformat(),
-                'end': end_date.isoformat()
-            },
-            'organization': {
-                'name': 'Code Migration Assistant',
-                'description': 'Enterprise code migration tool'
-            },
-            'trust_services_criteria': soc2_criteria,
-            'compliance_score': compliance_score,
-            'summary': self._generate_soc2_summary(events, soc2_criteria),
-            'recommendations': self._generate_soc2_recommendations(soc2_criteria),
-            'evidence': self._collect_soc2_evidence(events)
-        }
-        
-        return report
+        return self._build_report(SOC2_SPEC, start_date, end_date)
     
     def generate_gdpr_report(
         self,
@@ -125,48 +553,7 @@ class AuditReporter:
         Returns:
             GDPR compliance report
         """
-        if end_date is None:
-            end_date = datetime.now(timezone.utc)
-        if start_date is None:
-            start_date = end_date - timedelta(days=90)
-        
-        # Get audit events
-        events = self.audit_logger.search_logs(
-            start_time=start_date,
-            end_time=end_date,
-            limit=10000
-        )
-        
-        # GDPR Articles assessment
-        gdpr_articles = {
-            'article_5_data_principles': self._assess_gdpr_article_5(events),
-            'article_25_privacy_by_design': self._assess_gdpr_article_25(events),
-            'article_32_security_of_processing': self._assess_gdpr_article_32(events),
-            'article_33_breach_notification': self._assess_gdpr_article_33(events),
-            'article_35_dpia': self._assess_gdpr_article_35(events)
-        }
-        
-        # PII processing analysis
-        pii_analysis = self._analyze_pii_processing(events)
-        
-        report = {
-            'report_type': 'GDPR',
-            'report_period': {
-                'start': start_date.isoformat(),
-                'end': end_date.isoformat()
-            },
-            'data_controller': {
-                'name': 'Code Migration Assistant',
-                'contact': 'privacy@example.com'
-            },
-            'gdpr_articles': gdpr_articles,
-            'pii_processing': pii_analysis,
-            'compliance_score': self._calculate_gdpr_score(gdpr_articles),
-            'recommendations': self._generate_gdpr_recommendations(gdpr_articles),
-            'data_subject_requests': self._analyze_data_subject_requests(events)
-        }
-        
-        return report
+        return self._build_report(GDPR_SPEC, start_date, end_date)
     
     def generate_hipaa_report(
         self,
@@ -183,47 +570,7 @@ class AuditReporter:
         Returns:
             HIPAA compliance report
         """
-        if end_date is None:
-            end_date = datetime.now(timezone.utc)
-        if start_date is None:
-            start_date = end_date - timedelta(days=90)
-        
-        # Get audit events
-        events = self.audit_logger.search_logs(
-            start_time=start_date,
-            end_time=end_date,
-            limit=10000
-        )
-        
-        # HIPAA Rules assessment
-        hipaa_rules = {
-            'privacy_rule': self._assess_hipaa_privacy_rule(events),
-            'security_rule': self._assess_hipaa_security_rule(events),
-            'breach_notification_rule': self._assess_hipaa_breach_rule(events),
-            'enforcement_rule': self._assess_hipaa_enforcement_rule(events)
-        }
-        
-        # PHI analysis
-        phi_analysis = self._analyze_phi_processing(events)
-        
-        report = {
-            'report_type': 'HIPAA',
-            'report_period': {
-                'start': start_date.isoformat(),
-                'end': end_date.isoformat()
-            },
-            'covered_entity': {
-                'name': 'Code Migration Assistant',
-                'type': 'Business Associate'
-            },
-            'hipaa_rules': hipaa_rules,
-            'phi_processing': phi_analysis,
-            'compliance_score': self._calculate_hipaa_score(hipaa_rules),
-            'recommendations': self._generate_hipaa_recommendations(hipaa_rules),
-            'security_measures': self._assess_security_measures(events)
-        }
-        
-        return report
+        return self._build_report(HIPAA_SPEC, start_date, end_date)
     
     def generate_security_audit_report(
         self,
@@ -240,44 +587,85 @@ class AuditReporter:
         Returns:
             Security audit report
         """
-        if end_date is None:
-            end_date = datetime.now(timezone.utc)
-        if start_date is None:
-            start_date = end_date - timedelta(days=30)
+        return self._build_report(SECURITY_AUDIT_SPEC, start_date, end_date)
+    
+    def _build_report(self, spec: ReportSpec, start_date: datetime, end_date: datetime) -> Dict:
+        """
+        Build a report from its spec over one shared pass of event tallies.
         
-        # Get audit events
-        events = self.audit_logger.search_logs(
-            start_time=start_date,
-            end_time=end_date,
-            limit=10000
+        Args:
+            spec: Report layout and assessors
+            start_date: Report start date, or None for the spec's default window
+            end_date: Report end date, or None for now
+            
+        Returns:
+            Report data
+        """
+        start_date, end_date, report_period = self._resolve_period(
+            start_date, end_date, days=spec.default_days
         )
+        stats = self._load_stats(start_date, end_date, compliance_flags=spec.compliance_flags)
         
-        # Security analysis
-        security_analysis = {
-            'authentication_events': self._analyze_authentication_events(events),
-            'access_control': self._analyze_access_control(events),
-            'data_protection': self._analyze_data_protection(events),
-            'security_incidents': self._analyze_security_incidents(events),
-            'vulnerability_management': self._analyze_vulnerability_management(events)
+        assessment = {
+            name: getattr(self, method)(stats)
+            for name, method in spec.assessors
         }
-        
-        # Risk assessment
-        risk_assessment = self._perform_risk_assessment(events, security_analysis)
+        inputs = {'stats': stats, 'assessment': assessment}
         
         report = {
-            'report_type': 'SECURITY_AUDIT',
-            'report_period': {
-                'start': start_date.isoformat(),
-                'end': end_date.isoformat()
-            },
-            'security_analysis': security_analysis,
-            'risk_assessment': risk_assessment,
-            'security_score': self._calculate_security_score(security_analysis),
-            'recommendations': self._generate_security_recommendations(security_analysis),
-            'compliance_status': self._assess_overall_compliance(events)
+            'report_type': spec.report_type,
+            'report_period': report_period
         }
+        report.update(spec.static_sections)
+        report[spec.assessment_key] = assessment
+        for key, method, args in spec.sections:
+            report[key] = getattr(self, method)(*(inputs[arg] for arg in args))
+        
+        # Callers may serialize, copy or edit the report, so no shared tables leak out
+        return _thaw(report)
+    
+    def generate_all_reports(
+        self,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Dict]:
+        """
+        Generate the SOC2, GDPR, HIPAA and security audit reports together.
+        
+        Args:
+            start_date: Report start date (each report's default window if None)
+            end_date: Report end date (now if None, shared by all reports)
+            max_workers: Worker threads (defaults to the analysis max_workers
+                setting; 1 generates serially)
+            
+        Returns:
+            Reports keyed by report type
+        """
+        if end_date is None:
+            end_date = datetime.now(timezone.utc)
+        if max_workers is None:
+            max_workers = settings.analysis.max_workers
+        
+        # Tally every report's window and filter in one log scan up front
+        windows = []
+        for spec in REPORT_SPECS:
+            window_start, window_end, _period = self._resolve_period(start_date, end_date, days=spec.default_days)
+            windows.append((window_start, window_end, spec.compliance_flags))
+        self._load_stats_many(windows)
         
-        return report
+        if max_workers <= 1:
+            return {
+                spec.report_type: self._build_report(spec, start_date, end_date)
+                for spec in REPORT_SPECS
+            }
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(REPORT_SPECS))) as executor:
+            futures = {
+                spec.report_type: executor.submit(self._build_report, spec, start_date, end_date)
+                for spec in REPORT_SPECS
+            }
+            return {name: future.result() for name, future in futures.items()}
     
     def export_report(self, report: Dict, output_path: Path, format: str = 'json') -> bool:
         """
@@ -296,12 +684,18 @@ class AuditReporter:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
             if format == 'json':
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(report, f, indent=2)
+                if _ORJSON_AVAILABLE:
+                    output_path.write_bytes(orjson.dumps(
+                        report,
+                        default=_json_default,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ))
+                else:
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        json.dump(report, f, indent=2, default=_json_default)
             elif format == 'html':
-                html_content = self._generate_html_report(report)
                 with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
+                    f.writelines(self._iter_html_report(report))
             else:
                 raise ValueError(f"Unsupported format: {format}")
             
@@ -310,159 +704,221 @@ class AuditReporter:
         except (IOError, OSError):
             return False
     
+    @staticmethod
+    def _resolve_period(start_date: datetime, end_date: datetime, days: int):
+        """
+        Fill in default report bounds and format them once.
+        
+        Args:
+            start_date: Requested start date, or None
+            end_date: Requested end date, or None for now (UTC)
+            days: Default window length when start_date is None
+            
+        Returns:
+            Tuple of (start_date, end_date, report_period dict)
+        """
+        if end_date is None:
+            end_date = datetime.now(timezone.utc)
+        if start_date is None:
+            start_date = end_date - timedelta(days=days)
+        
+        report_period = {
+            'start': start_date.isoformat(),
+            'end': end_date.isoformat()
+        }
+        return start_date, end_date, report_period
+    
+    def _load_stats(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        compliance_flags: Iterable[str] = ()
+    ) -> EventStats:
+        """
+        Tally audit events for a window, reusing earlier tallies.
+        
+        Reports over the same window share one log scan until the audit
+        log changes.
+        
+        Args:
+            start_date: Window start
+            end_date: Window end
+            compliance_flags: Only tally events with any of these flags set
+            
+        Returns:
+            Event tallies for the window
+        """
+        return self._load_stats_many([(start_date, end_date, compliance_flags)])[0]
+    
+    def _load_stats_many(
+        self,
+        windows: List[Tuple[datetime, datetime, Iterable[str]]]
+    ) -> List[EventStats]:
+        """
+        Tally audit events for several windows and filters, scanning the log at most once.
+        
+        Args:
+            windows: (start date, end date, compliance flags) per tally
+            
+        Returns:
+            Event tallies in the order of windows
+        """
+        signature = self._log_signature()
+        if signature is None or signature[1] == 0:
+            # Fresh installs have no audit log yet; skip opening and scanning it
+            return [_NO_EVENTS] * len(windows)
+        
+        keys = [
+            (start_date, end_date, tuple(flags), self.audit_logger.version, signature)
+            for start_date, end_date, flags in windows
+        ]
+        results = [self._stats_cache.get(key) for key in keys]
+        missing = {key: None for key, stats in zip(keys, results) if stats is None}
+        if not missing:
+            return results
+        
+        if len(missing) == 1:
+            # Let the logger pre-filter lines for a single window
+            (start_date, end_date, flags, _version, _signature), = missing
+            events = self.audit_logger.iter_logs(
+                start_time=start_date,
+                end_time=end_date,
+                limit=REPORT_EVENT_LIMIT,
+                compliance_flags=flags
+            )
+            missing = {key: self._bucketize(events) for key in missing}
+        else:
+            missing = self._bucketize_windows(list(missing))
+        
+        with self._stats_lock:
+            for key, stats in missing.items():
+                if len(self._stats_cache) >= STATS_CACHE_SIZE:
+                    del self._stats_cache[next(iter(self._stats_cache))]
+                self._stats_cache[key] = stats
+        
+        return [missing[key] if stats is None else stats for key, stats in zip(keys, results)]
+    
+    def _bucketize_windows(self, keys: List[tuple]) -> Dict[tuple, EventStats]:
+        """Tally one scan of the widest window into every (window, filter) key."""
+        tallies = {key: EventStats() for key in keys}
+        events = self.audit_logger.iter_logs(
+            start_time=min(key[0] for key in keys),
+            end_time=max(key[1] for key in keys),
+            # Each tally stops at its own limit instead
+            limit=sys.maxsize
+        )
+        
+        open_tallies = len(tallies)
+        for event in events:
+            event_time = datetime.fromisoformat(event['timestamp_utc'])
+            compliance = event.get('compliance') or {}
+            for (start_date, end_date, flags, _version, _signature), stats in tallies.items():
+                if stats.total_events >= REPORT_EVENT_LIMIT:
+                    continue
+                if not start_date <= event_time < end_date:
+                    continue
+                if flags and not any(compliance.get(flag) for flag in flags):
+                    continue
+                stats.add(event)
+                if stats.total_events == REPORT_EVENT_LIMIT:
+                    open_tallies -= 1
+            if not open_tallies:
+                break
+        
+        return tallies
+    
+    def _log_signature(self):
+        """Identify the current audit log contents by size and mtime."""
+        try:
+            stat = self.audit_logger.log_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _bucketize(self, events: Iterable[Dict]) -> EventStats:
+        """Tally audit events in one pass for the assessment helpers."""
+        stats = EventStats()
+        for event in events:
+            stats.add(event)
+        return stats
+    
     # SOC2 assessment methods
-    def _assess_security_criteria(self, events: List[Dict]) -> Dict:
+    def _assess_security_criteria(self, stats: EventStats) -> Dict:
         """Assess SOC2 Security criteria."""
-        security_events = [e for e in events if e.get('event_type') == 'SECURITY_VIOLATION']
-        file_access_events = [e for e in events if e.get('event_type') == 'FILE_ACCESS']
+        security_events = stats.by_type['SECURITY_VIOLATION']
         
         return {
             'access_control': {
-                'compliant': len(security_events) == 0,
-                'score': 100 if len(security_events) == 0 else 50,
-                'evidence': len(file_access_events)
+                'compliant': security_events == 0,
+                'score': 100 if security_events == 0 else 50,
+                'evidence': stats.by_type['FILE_ACCESS']
             },
-            'incident_response': {
-                'compliant': True,  # Simplified
-                'score': 90,
-                'evidence': 'Automated logging and monitoring'
-            },
-            'risk_management': {
-                'compliant': True,
-                'score': 85,
-                'evidence': 'Security controls implemented'
-            }
+            'incident_response': _SOC2_INCIDENT_RESPONSE,
+            'risk_management': _SOC2_RISK_MANAGEMENT
         }
     
-    def _assess_availability_criteria(self, events: List[Dict]) -> Dict:
+    def _assess_availability_criteria(self, stats: EventStats) -> Dict:
         """Assess SOC2 Availability criteria."""
-        migration_events = [e for e in events if e.get('event_type') == 'MIGRATION_EVENT']
-        
-        return {
-            'service_availability': {
-                'compliant': True,
-                'score': 95,
-                'uptime_percentage': 99.9
-            },
-            'disaster_recovery': {
-                'compliant': True,
-                'score': 80,
-                'backup_frequency': 'Automatic'
-            }
-        }
+        return _SOC2_AVAILABILITY
     
-    def _assess_processing_integrity(self, events: List[Dict]) -> Dict:
+    def _assess_processing_integrity(self, stats: EventStats) -> Dict:
         """Assess SOC2 Processing Integrity criteria."""
-        return {
-            'data_accuracy': {
-                'compliant': True,
-                'score': 90,
-                'validation_checks': 'Implemented'
-            },
-            'processing_completeness': {
-                'compliant': True,
-                'score': 85,
-                'error_handling': 'Comprehensive'
-            }
-        }
+        return _SOC2_PROCESSING_INTEGRITY
     
-    def _assess_confidentiality_criteria(self, events: List[Dict]) -> Dict:
+    def _assess_confidentiality_criteria(self, stats: EventStats) -> Dict:
         """Assess SOC2 Confidentiality criteria."""
-        pii_events = [e for e in events if e.get('compliance', {}).get('gdpr_pii_processed', False)]
-        
         return {
-            'data_encryption': {
-                'compliant': True,
-                'score': 95,
-                'encryption_standards': 'AES-256'
-            },
+            'data_encryption': _SOC2_DATA_ENCRYPTION,
             'access_controls': {
-                'compliant': len(pii_events) > 0,
+                'compliant': stats.pii_events > 0,
                 'score': 85,
                 'pii_handling': 'Tracked and logged'
             }
         }
     
-    def _assess_privacy_criteria(self, events: List[Dict]) -> Dict:
+    def _assess_privacy_criteria(self, stats: EventStats) -> Dict:
         """Assess SOC2 Privacy criteria."""
-        return {
-            'privacy_policy': {
-                'compliant': True,
-                'score': 90,
-                'policy_available': True
-            },
-            'consent_management': {
-                'compliant': True,
-                'score': 85,
-                'consent_tracking': 'Implemented'
-            }
-        }
+        return _SOC2_PRIVACY
     
     def _calculate_soc2_score(self, criteria: Dict) -> Dict:
         """Calculate overall SOC2 compliance score."""
-        scores = []
-        for category in criteria.values():
-            for control in category.values():
-                scores.append(control.get('score', 0))
-        
-        overall_score = sum(scores) / len(scores) if scores else 0
+        overall_score = _mean_score(criteria)
         
         return {
             'overall_score': round(overall_score, 1),
-            'grade': 'A' if overall_score >= 90 else 'B' if overall_score >= 80 else 'C',
-            'status': 'COMPLIANT' if overall_score >= 80 else 'NEEDS_IMPROVEMENT'
+            'grade': _grade(overall_score),
+            'status': _compliance_status(overall_score)
         }
     
     # GDPR assessment methods
-    def _assess_gdpr_article_5(self, events: List[Dict]) -> Dict:
+    def _assess_gdpr_article_5(self, stats: EventStats) -> Dict:
         """Assess GDPR Article 5 - Data processing principles."""
-        return {
-            'lawfulness': {'compliant': True, 'score': 90},
-            'fairness': {'compliant': True, 'score': 90},
-            'transparency': {'compliant': True, 'score': 85},
-            'purpose_limitation': {'compliant': True, 'score': 85},
-            'data_minimization': {'compliant': True, 'score': 80},
-            'accuracy': {'compliant': True, 'score': 90},
-            'storage_limitation': {'compliant': True, 'score': 85},
-            'security': {'compliant': True, 'score': 90}
-        }
+        return _GDPR_ARTICLE_5
     
-    def _assess_gdpr_article_25(self, events: List[Dict]) -> Dict:
+    def _assess_gdpr_article_25(self, stats: EventStats) -> Dict:
         """Assess GDPR Article 25 - Privacy by design."""
-        return {
-            'privacy_by_design': {'compliant': True, 'score': 85},
-            'privacy_by_default': {'compliant': True, 'score': 85}
-        }
+        return _GDPR_ARTICLE_25
     
-    def _assess_gdpr_article_32(self, events: List[Dict]) -> Dict:
+    def _assess_gdpr_article_32(self, stats: EventStats) -> Dict:
         """Assess GDPR Article 32 - Security of processing."""
-        return {
-            'technical_measures': {'compliant': True, 'score': 90},
-            'organizational_measures': {'compliant': True, 'score': 85}
-        }
+        return _GDPR_ARTICLE_32
     
-    def _assess_gdpr_article_33(self, events: List[Dict]) -> Dict:
+    def _assess_gdpr_article_33(self, stats: EventStats) -> Dict:
         """Assess GDPR Article 33 - Breach notification."""
-        return {
-            'notification_procedure': {'compliant': True, 'score': 85},
-            'timeline': {'compliant': True, 'score': 90}
-        }
+        return _GDPR_ARTICLE_33
     
-    def _assess_gdpr_article_35(self, events: List[Dict]) -> Dict:
+    def _assess_gdpr_article_35(self, stats: EventStats) -> Dict:
         """Assess GDPR Article 35 - DPIA."""
-        return {
-            'dpia_process': {'compliant': True, 'score': 80},
-            'documentation': {'compliant': True, 'score': 85}
-        }
+        return _GDPR_ARTICLE_35
     
     # Helper methods
-    def _generate_soc2_summary(self, events: List[Dict], criteria: Dict) -> Dict:
+    def _generate_soc2_summary(self, stats: EventStats, criteria: Dict) -> Dict:
         """Generate SOC2 executive summary."""
         return {
-            'total_events': len(events),
-            'security_incidents': len([e for e in events if e.get('event_type') == 'SECURITY_VIOLATION']),
-            'data_access_events': len([e for e in events if e.get('event_type') == 'FILE_ACCESS']),
-            'migration_events': len([e for e in events if e.get('event_type') == 'MIGRATION_EVENT']),
+            'total_events': stats.total_events,
+            'security_incidents': stats.by_type['SECURITY_VIOLATION'],
+            'data_access_events': stats.by_type['FILE_ACCESS'],
+            'migration_events': stats.by_type['MIGRATION_EVENT'],
             'overall_health': 'GOOD'
         }
     
@@ -479,13 +935,13 @@ class AuditReporter:
         
         return recommendations
     
-    def _collect_soc2_evidence(self, events: List[Dict]) -> List[Dict]:
+    def _collect_soc2_evidence(self, stats: EventStats) -> List[Dict]:
         """Collect evidence for SOC2 compliance."""
         return [
             {
                 'type': 'audit_log',
                 'description': 'Comprehensive audit logging',
-                'count': len(events)
+                'count': stats.total_events
             },
             {
                 'type': 'security_controls',
@@ -496,229 +952,143 @@ class AuditReporter:
     
     def _calculate_gdpr_score(self, articles: Dict) -> Dict:
         """Calculate GDPR compliance score."""
-        scores = []
-        for article in articles.values():
-            for principle in article.values():
-                scores.append(principle.get('score', 0))
-        
-        overall_score = sum(scores) / len(scores) if scores else 0
+        overall_score = _mean_score(articles)
         
         return {
             'overall_score': round(overall_score, 1),
-            'status': 'COMPLIANT' if overall_score >= 80 else 'NEEDS_IMPROVEMENT'
+            'status': _compliance_status(overall_score)
         }
     
     def _generate_gdpr_recommendations(self, articles: Dict) -> List[str]:
         """Generate GDPR compliance recommendations."""
-        return [
-            "Maintain comprehensive privacy documentation",
-            "Regular privacy impact assessments",
-            "Data breach response procedures"
-        ]
+        return list(_GDPR_RECOMMENDATIONS)
     
-    def _analyze_pii_processing(self, events: List[Dict]) -> Dict:
+    def _analyze_pii_processing(self, stats: EventStats) -> Dict:
         """Analyze PII processing events."""
-        pii_events = [e for e in events if e.get('compliance', {}).get('gdpr_pii_processed', False)]
-        
         return {
-            'total_pii_events': len(pii_events),
-            'processing_purposes': ['Migration analysis', 'Security scanning'],
+            'total_pii_events': stats.pii_events,
+            'processing_purposes': list(_GDPR_PROCESSING_PURPOSES),
             'data_retention': '90 days',
             'data_subject_requests': 0
         }
     
-    def _analyze_data_subject_requests(self, events: List[Dict]) -> Dict:
+    def _analyze_data_subject_requests(self, stats: EventStats) -> Dict:
         """Analyze data subject requests."""
-        return {
-            'total_requests': 0,
-            'requests_processed': 0,
-            'average_response_time': 'N/A'
-        }
+        return _GDPR_DATA_SUBJECT_REQUESTS
     
     # HIPAA assessment methods
-    def _assess_hipaa_privacy_rule(self, events: List[Dict]) -> Dict:
+    def _assess_hipaa_privacy_rule(self, stats: EventStats) -> Dict:
         """Assess HIPAA Privacy Rule."""
-        return {
-            'phi_protection': {'compliant': True, 'score': 90},
-            'minimum_necessary': {'compliant': True, 'score': 85},
-            'patient_rights': {'compliant': True, 'score': 85}
-        }
+        return _HIPAA_PRIVACY_RULE
     
-    def _assess_hipaa_security_rule(self, events: List[Dict]) -> Dict:
+    def _assess_hipaa_security_rule(self, stats: EventStats) -> Dict:
         """Assess HIPAA Security Rule."""
-        return {
-            'administrative_safeguards': {'compliant': True, 'score': 85},
-            'physical_safeguards': {'compliant': True, 'score': 80},
-            'technical_safeguards': {'compliant': True, 'score': 90}
-        }
+        return _HIPAA_SECURITY_RULE
     
-    def _assess_hipaa_breach_rule(self, events: List[Dict]) -> Dict:
+    def _assess_hipaa_breach_rule(self, stats: EventStats) -> Dict:
         """Assess HIPAA Breach Notification Rule."""
-        return {
-            'breach_detection': {'compliant': True, 'score': 85},
-            'notification_procedure': {'compliant': True, 'score': 85}
-        }
+        return _HIPAA_BREACH_RULE
     
-    def _assess_hipaa_enforcement_rule(self, events: List[Dict]) -> Dict:
+    def _assess_hipaa_enforcement_rule(self, stats: EventStats) -> Dict:
         """Assess HIPAA Enforcement Rule."""
-        return {
-            'compliance_program': {'compliant': True, 'score': 85},
-            'policies_procedures': {'compliant': True, 'score': 85}
-        }
+        return _HIPAA_ENFORCEMENT_RULE
     
     def _calculate_hipaa_score(self, rules: Dict) -> Dict:
         """Calculate HIPAA compliance score."""
-        scores = []
-        for rule in rules.values():
-            for safeguard in rule.values():
-                scores.append(safeguard.get('score', 0))
-        
-        overall_score = sum(scores) / len(scores) if scores else 0
+        overall_score = _mean_score(rules)
         
         return {
             'overall_score': round(overall_score, 1),
-            'status': 'COMPLIANT' if overall_score >= 80 else 'NEEDS_IMPROVEMENT'
+            'status': _compliance_status(overall_score)
         }
     
     def _generate_hipaa_recommendations(self, rules: Dict) -> List[str]:
         """Generate HIPAA compliance recommendations."""
-        return [
-            "Maintain HIPAA security policies",
-            "Regular security training",
-            "Business associate agreements"
-        ]
+        return list(_HIPAA_RECOMMENDATIONS)
     
-    def _analyze_phi_processing(self, events: List[Dict]) -> Dict:
+    def _analyze_phi_processing(self, stats: EventStats) -> Dict:
         """Analyze PHI processing events."""
-        phi_events = [e for e in events if e.get('compliance', {}).get('hipaa_phi_accessed', False)]
-        
         return {
-            'total_phi_events': len(phi_events),
-            'phi_types': ['Medical records', 'Patient information'],
+            'total_phi_events': stats.phi_events,
+            'phi_types': list(_HIPAA_PHI_TYPES),
             'access_controls': 'Role-based',
             'encryption': 'AES-256'
         }
     
-    def _assess_security_measures(self, events: List[Dict]) -> Dict:
+    def _assess_security_measures(self, stats: EventStats) -> Dict:
         """Assess implemented security measures."""
-        return {
-            'access_control': 'Implemented',
-            'encryption': 'AES-256',
-            'audit_logging': 'Comprehensive',
-            'authentication': 'Multi-factor'
-        }
+        return _HIPAA_SECURITY_MEASURES
     
     # Security audit methods
-    def _analyze_authentication_events(self, events: List[Dict]) -> Dict:
+    def _analyze_authentication_events(self, stats: EventStats) -> Dict:
         """Analyze authentication events."""
-        auth_events = [e for e in events if 'auth' in e.get('action', '').lower()]
-        
         return {
-            'total_attempts': len(auth_events),
-            'successful_logins': len([e for e in auth_events if e.get('result') == 'SUCCESS']),
-            'failed_logins': len([e for e in auth_events if e.get('result') == 'FAILURE'])
+            'total_attempts': stats.auth_attempts,
+            'successful_logins': stats.auth_successes,
+            'failed_logins': stats.auth_failures
         }
     
-    def _analyze_access_control(self, events: List[Dict]) -> Dict:
+    def _analyze_access_control(self, stats: EventStats) -> Dict:
         """Analyze access control events."""
         return {
-            'access_granted': len([e for e in events if e.get('result') == 'SUCCESS']),
-            'access_denied': len([e for e in events if e.get('result') == 'DENIED']),
+            'access_granted': stats.by_result['SUCCESS'],
+            'access_denied': stats.by_result['DENIED'],
             'privilege_escalation': 0
         }
     
-    def _analyze_data_protection(self, events: List[Dict]) -> Dict:
+    def _analyze_data_protection(self, stats: EventStats) -> Dict:
         """Analyze data protection events."""
-        return {
-            'data_encrypted': True,
-            'backup_frequency': 'Daily',
-            'retention_policy': '90 days'
-        }
+        return _SECURITY_DATA_PROTECTION
     
-    def _analyze_security_incidents(self, events: List[Dict]) -> Dict:
+    def _analyze_security_incidents(self, stats: EventStats) -> Dict:
         """Analyze security incidents."""
-        incidents = [e for e in events if e.get('event_type') == 'SECURITY_VIOLATION']
+        incidents = stats.by_type['SECURITY_VIOLATION']
         
         return {
-            'total_incidents': len(incidents),
-            'critical_incidents': len([i for i in incidents if i.get('details', {}).get('severity') == 'CRITICAL']),
-            'resolved_incidents': len(incidents)  # Assuming all are resolved
+            'total_incidents': incidents,
+            'critical_incidents': stats.critical_incidents,
+            'resolved_incidents': incidents  # Assuming all are resolved
         }
     
-    def _analyze_vulnerability_management(self, events: List[Dict]) -> Dict:
+    def _analyze_vulnerability_management(self, stats: EventStats) -> Dict:
         """Analyze vulnerability management."""
-        return {
-            'vulnerabilities_scanned': True,
-            'patch_management': 'Automated',
-            'security_updates': 'Current'
-        }
+        return _SECURITY_VULNERABILITY_MANAGEMENT
     
-    def _perform_risk_assessment(self, events: List[Dict], analysis: Dict) -> Dict:
+    def _perform_risk_assessment(self, stats: EventStats, analysis: Dict) -> Dict:
         """Perform security risk assessment."""
         return {
             'overall_risk': 'LOW',
             'risk_factors': [],
-            'mitigation_strategies': [
-                'Regular security audits',
-                'Employee training',
-                'Incident response planning'
-            ]
+            'mitigation_strategies': list(_SECURITY_MITIGATION_STRATEGIES)
         }
     
     def _calculate_security_score(self, analysis: Dict) -> Dict:
         """Calculate security score."""
-        return {
-            'overall_score': 85,
-            'grade': 'B',
-            'status': 'GOOD'
-        }
+        return _SECURITY_SCORE
     
     def _generate_security_recommendations(self, analysis: Dict) -> List[str]:
         """Generate security recommendations."""
-        return [
-            "Implement multi-factor authentication",
-            "Regular security training",
-            "Enhanced monitoring and alerting"
-        ]
+        return list(_SECURITY_RECOMMENDATIONS)
     
-    def _assess_overall_compliance(self, events: List[Dict]) -> Dict:
+    def _assess_overall_compliance(self, stats: EventStats) -> Dict:
         """Assess overall compliance status."""
         return {
             'compliant': True,
-            'frameworks': ['SOC2', 'GDPR', 'HIPAA'],
-            'last_audit': datetime.now().isoformat()
+            'frameworks': list(_COMPLIANCE_FRAMEWORKS),
+            'last_audit': datetime.now(timezone.utc).isoformat()
         }
     
     def _generate_html_report(self, report: Dict) -> str:
         """Generate HTML report."""
-        return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>{report['report_type']} Compliance Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        .header {{ background: #f5f5f5; padding: 20px; border-radius: 5px; }}
-        .section {{ margin: 20px 0; }}
-        .score {{ font-size: 24px; font-weight: bold; color: #2E7D32; }}
-        .recommendation {{ background: #FFF3E0; padding: 10px; margin: 5px 0; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>{report['report_type']} Compliance Report</h1>
-        <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-    </div>
+        return ''.join(self._iter_html_report(report))
     
-    <div class="section">
-        <h2>Compliance Score</h2>
-        <div class="score">{report.get('compliance_score', {}).get('overall_score', 'N/A')}/100</div>
-    </div>
-    
-    <div class="section">
-        <h2>Recommendations</h2>
-        {"".join([f'<div class="recommendation">{rec}</div>' for rec in report.get('recommendations', [])])}
-    </div>
-</body>
-</html>
-        """
+    def _iter_html_report(self, report: Dict) -> Iterator[str]:
+        """Yield the HTML report in chunks so it can be streamed to a file."""
+        yield _HTML_HEAD % {
+            'report_type': html.escape(str(report['report_type'])),
+            'generated': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+            'score': html.escape(str(report.get('compliance_score', _EMPTY_SECTION).get('overall_score', 'N/A')))
+        }
+        for rec in report.get('recommendations', ()):
+            yield _HTML_RECOMMENDATION % html.escape(str(rec), quote=False)
+        yield _HTML_TAIL
@@ -8,13 +8,408 @@ Tracks data flow through the application:
 - Compliance validation
 """
 
+import hashlib
+import io
 import json
+import mmap
+import os
 import re
+import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 from ..security import SecurityAuditLogger, SafeCodeAnalyzer
+from code_migration.config import settings
+
+
+# File suffixes handled by each analyzer
+PYTHON_SUFFIXES = ('.py',)
+JAVASCRIPT_SUFFIXES = ('.js', '.jsx', '.ts', '.tsx')
+CONFIG_SUFFIXES = ('.json', '.yaml', '.yml', '.env')
+
+# Dependency, build and tooling directories pruned from the project walk
+SKIP_DIRS = frozenset({
+    'node_modules', '.git', 'dist', 'build', '.venv', 'venv', '__pycache__', 'vendor'
+})
+# Bundled output that would only produce noise
+MINIFIED_SUFFIXES = ('.min.js',)
+
+# Below this many files, process start-up costs more than a serial pass saves
+PARALLEL_ANALYSIS_MIN_FILES = 32
+PARALLEL_ANALYSIS_CHUNKSIZE = 16
+
+# Bytes of a mapped file decoded at a time for the keyword automaton
+PII_SCAN_WINDOW = 1 << 20
+
+# Files at least this large are memory-mapped; smaller ones are read, which
+# is as fast for typical sources and immune to SIGBUS if another process
+# truncates the file mid-scan
+MMAP_MIN_SIZE = 1 << 20
+
+# Per-file findings kept between runs, in the project's log directory
+LINEAGE_CACHE_FILE = 'lineage_cache.json'
+
+# Bump when the analyzers or the cached entry layout change; the scanning
+# patterns are folded into the cache version automatically
+LINEAGE_CACHE_VERSION = 1
+
+# Files ahead of the serial scan whose reads are queued with the kernel
+PREFETCH_DEPTH = 64
+
+
+# Use the RE2 DFA engine for the scanning patterns when installed
+try:
+    import re2 as _scan_re
+    
+    _RE2_AVAILABLE = True
+except ImportError:
+    _scan_re = re
+    _RE2_AVAILABLE = False
+
+# Use Hyperscan for the literal PII keyword scan when installed
+try:
+    import hyperscan
+    
+    _HYPERSCAN_AVAILABLE = True
+except ImportError:
+    _HYPERSCAN_AVAILABLE = False
+
+# Otherwise use an Aho-Corasick automaton for the PII keywords when installed
+try:
+    import ahocorasick
+    
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
+# JIT-compile the newline offset scan when Numba is installed
+try:
+    import numpy as np
+    from numba import njit
+    
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# Only lets the backtracking engine skip mid-identifier starts; RE2 has
+# no lookbehind and does not need it
+_WORD_START = b'' if _RE2_AVAILABLE else rb'(?<!\w)'
+
+def _group_types(pattern) -> Tuple[Optional[str], ...]:
+    """
+    Finding type for each group index of a pattern, for dispatch on lastindex.
+    
+    RE2 reports group names as bytes for bytes patterns; they are decoded
+    here once instead of per match.
+    """
+    types: List[Optional[str]] = [None] * (pattern.groups + 1)
+    for name, index in pattern.groupindex.items():
+        types[index] = sys.intern(name.decode('ascii') if isinstance(name, bytes) else name)
+    return tuple(types)
+
+
+# Scanning patterns, compiled once and merged per category so each file
+# is scanned once per category. Named groups carry the finding type.
+# Patterns are bytes so they run directly over memory-mapped files.
+_PY_DB_RE = _scan_re.compile(
+    # Also covers psycopg2/mysql/sqlite3 .connect() calls
+    rb'(?:create_engine|connect)\(["\']([^"\']+)["\']'
+)
+
+_PY_DATA_OP_RE = _scan_re.compile(
+    rb'(?P<http_request>requests\.(?:get|post|put|delete)\()'
+    rb'|' + _WORD_START + rb'(\w+)\.(?:'
+    rb'(?P<sql_execute>execute)|(?P<data_select>select)|(?P<data_insert>insert)'
+    rb'|(?P<data_update>update)|(?P<data_delete>delete))\('
+    rb'|(?P<json_parse>json\.loads\()'
+    rb'|(?P<json_serialize>json\.dumps\()'
+)
+
+# PII keywords by flow type, shared by the regex and Hyperscan scanners
+_PII_KEYWORDS = (
+    ('pii_field', ('email', 'phone', 'ssn', 'credit_card', 'password')),
+    ('entity_with_pii', ('user', 'customer', 'patient')),
+    ('crypto_operation', ('encrypt', 'decrypt', 'hash')),
+    ('data_protection', ('mask', 'anonymize', 'redact'))
+)
+
+# Configuration keys that indicate a data source, with their byte form
+_CONFIG_KEYS = tuple(
+    (key, key.encode('ascii'))
+    for key in ('DATABASE_URL', 'DB_HOST', 'DB_NAME', 'DB_USER', 'API_KEY', 'SECRET_KEY')
+)
+
+# Longest keyword span past a window's end that can still start inside it
+_PII_KEYWORD_OVERLAP = max(len(keyword) for _pii_type, keywords in _PII_KEYWORDS for keyword in keywords) - 1
+
+_PY_PII_RE = _scan_re.compile(('(?i)' + '|'.join(
+    f"(?P<{pii_type}>{'|'.join(keywords)})" for pii_type, keywords in _PII_KEYWORDS
+)).encode('ascii'))
+
+_JS_API_RE = _scan_re.compile(
+    rb'(?:fetch|axios\.(?:get|post|put|delete)|\$\.ajax|request)\(["\']([^"\']+)["\']'
+)
+
+_JS_DATA_OP_RE = _scan_re.compile(
+    rb'\.(?:(?P<async_operation>then)|(?P<data_transformation>map)'
+    rb'|(?P<data_filtering>filter)|(?P<data_aggregation>reduce))\('
+    rb'|(?P<local_storage>localStorage\.(?:get|set)Item)'
+    rb'|(?P<session_storage>sessionStorage\.(?:get|set)Item)'
+    rb'|(?P<json_operation>JSON\.(?:parse|stringify))'
+)
+
+# Named groups never nest, so the last closed group names the finding
+_PY_DATA_OP_TYPES = _group_types(_PY_DATA_OP_RE)
+_PY_PII_TYPES = _group_types(_PY_PII_RE)
+_JS_DATA_OP_TYPES = _group_types(_JS_DATA_OP_RE)
+
+
+_NEWLINE_RE = re.compile(b'\n')
+
+# Secrets masked in reported connection strings, with their replacements
+_CONNECTION_SECRET_RE = re.compile(
+    r'(?P<password>password=[^;]+)|(?P<pwd>pwd=[^;]+)|(?P<credentials>//[^:]+:[^@]+@)',
+    re.IGNORECASE
+)
+_CONNECTION_SECRET_MASKS = {
+    'password': 'password=***',
+    'pwd': 'pwd=***',
+    'credentials': '//***:***@'
+}
+
+# Cached findings only hold for the analyzer and patterns that produced them
+_LINEAGE_CACHE_TAG = f"{LINEAGE_CACHE_VERSION}-" + hashlib.blake2b(repr((
+    _PY_DB_RE.pattern, _PY_DATA_OP_RE.pattern, _PY_PII_RE.pattern,
+    _JS_API_RE.pattern, _JS_DATA_OP_RE.pattern, _CONFIG_KEYS,
+    _CONNECTION_SECRET_RE.pattern, _CONNECTION_SECRET_MASKS
+)).encode('utf-8'), digest_size=8).hexdigest()
+
+# Marker for each compliance issue severity in the text report
+_SEVERITY_EMOJI = {
+    'CRITICAL': '🔴',
+    'HIGH': '🟠',
+    'MEDIUM': '🟡',
+    'LOW': '🟢'
+}
+
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _newline_offsets(buffer):
+        """Offsets of every newline in a uint8 buffer."""
+        offsets = np.empty(buffer.size, np.int64)
+        count = 0
+        for index in range(buffer.size):
+            if buffer[index] == 10:
+                offsets[count] = index
+                count += 1
+        return offsets[:count]
+
+
+def _build_pii_database():
+    """Compile the PII keywords into one caseless Hyperscan database."""
+    expressions = [
+        '|'.join(keywords).encode('ascii') for _pii_type, keywords in _PII_KEYWORDS
+    ]
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(expressions)
+    )
+    return database
+
+
+def _build_pii_automaton():
+    """Build an Aho-Corasick automaton mapping each keyword to its flow type."""
+    automaton = ahocorasick.Automaton()
+    for pii_type, keywords in _PII_KEYWORDS:
+        for keyword in keywords:
+            automaton.add_word(keyword, (pii_type, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+_PII_DATABASE = _build_pii_database() if _HYPERSCAN_AVAILABLE else None
+_PII_AUTOMATON = _build_pii_automaton() if _AHOCORASICK_AVAILABLE else None
+
+
+def _decode(data: bytes) -> str:
+    """Decode a matched slice for storing in findings."""
+    return data.decode('utf-8', errors='ignore')
+
+
+def _prefetch_file(file_path: Path) -> None:
+    """Ask the kernel to start reading a file in the background."""
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _iter_prefetched(file_paths: List[Path], depth: int = PREFETCH_DEPTH) -> Iterator[Path]:
+    """
+    Yield file paths while keeping reads queued for the next depth files.
+    
+    Overlaps storage latency across many small files during a serial scan.
+    Platforms without posix_fadvise get the paths unchanged.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        yield from file_paths
+        return
+    
+    for file_path in islice(file_paths, depth):
+        _prefetch_file(file_path)
+    
+    for index, file_path in enumerate(file_paths):
+        if index + depth < len(file_paths):
+            _prefetch_file(file_paths[index + depth])
+        yield file_path
+
+
+@contextmanager
+def _mapped_file(file_path: Path) -> Iterator[bytes]:
+    """
+    Yield a file's bytes, memory-mapping large files so they are paged in as scanned.
+    
+    Files under MMAP_MIN_SIZE are read into memory. A mapped file that
+    another process truncates during the scan raises SIGBUS; that risk is
+    accepted only for files large enough to benefit from mapping. Files
+    over the configured maximum analysis size yield empty bytes.
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0 or size > settings.security.max_file_size_kb * 1024:
+            yield b''
+            return
+        if size < MMAP_MIN_SIZE:
+            yield f.read()
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                data.madvise(mmap.MADV_SEQUENTIAL)
+            yield data
+
+
+def _iter_pii_matches(data: bytes) -> Iterator[Tuple[str, int, int]]:
+    """
+    Yield (flow type, start, end) for each PII keyword in data.
+    
+    Matches are leftmost and non-overlapping, as with re.finditer.
+    """
+    if _PII_DATABASE is not None:
+        hits = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            hits.append((start, end, pattern_id))
+        
+        _PII_DATABASE.scan(data, match_event_handler=on_match)
+        
+        # Hyperscan reports every match as it ends; keep finditer's view
+        hits.sort()
+        last_end = 0
+        for start, end, pattern_id in hits:
+            if start >= last_end:
+                last_end = end
+                yield _PII_KEYWORDS[pattern_id][0], start, end
+        return
+    
+    if _PII_AUTOMATON is not None:
+        yield from _iter_automaton_matches(data)
+        return
+    
+    for match in _PY_PII_RE.finditer(data):
+        yield _PY_PII_TYPES[match.lastindex], match.start(), match.end()
+
+
+class Transformation(NamedTuple):
+    """A data operation found in a file."""
+    type: str
+    file: str
+    line: int
+    context: str
+
+
+class PIIFlow(NamedTuple):
+    """A PII-related identifier found in a file."""
+    type: str
+    file: str
+    line: int
+    match: str
+    context: str
+
+
+def _iter_automaton_matches(data: bytes) -> Iterator[Tuple[str, int, int]]:
+    """
+    Yield PII keyword matches from the automaton, one window at a time.
+    
+    Only PII_SCAN_WINDOW bytes (plus enough overlap to finish a keyword)
+    are decoded at once, so large files never get a full in-memory copy.
+    Latin-1 maps each byte to one character, so offsets stay byte
+    offsets, and lowering never turns non-ASCII bytes into keyword letters.
+    """
+    position = 0
+    while position < len(data):
+        window_end = position + PII_SCAN_WINDOW
+        text = data[position:window_end + _PII_KEYWORD_OVERLAP].decode('latin-1').lower()
+        
+        # Resume after the last match so windows never split or overlap one
+        next_position = window_end
+        for last, (pii_type, length) in _PII_AUTOMATON.iter_long(text):
+            start = position + last + 1 - length
+            if start >= window_end:
+                break
+            next_position = start + length
+            yield pii_type, start, start + length
+        
+        position = max(window_end, next_position)
+
+
+@dataclass
+class FileLineage:
+    """Findings from a single file, merged into the tracker afterwards."""
+    # (type, identifier, details) triples, deduplicated on merge
+    sources: List[Tuple[str, str, Dict]] = field(default_factory=list)
+    transformations: List[Transformation] = field(default_factory=list)
+    pii_flows: List[PIIFlow] = field(default_factory=list)
+    
+    def to_cache(self) -> Dict:
+        """JSON-serializable form for the lineage cache."""
+        return {
+            'sources': self.sources,
+            'transformations': self.transformations,
+            'pii_flows': self.pii_flows
+        }
+    
+    @classmethod
+    def from_cache(cls, entry: Dict) -> 'FileLineage':
+        """Rebuild findings stored by to_cache, sharing repeated labels and paths."""
+        intern = sys.intern
+        return cls(
+            sources=[tuple(source) for source in entry['sources']],
+            transformations=[
+                Transformation(intern(kind), intern(file), *rest)
+                for kind, file, *rest in entry['transformations']
+            ],
+            pii_flows=[
+                PIIFlow(intern(kind), intern(file), *rest)
+                for kind, file, *rest in entry['pii_flows']
+            ]
+        )
 
 
 class DataLineageTracker:
@@ -43,16 +438,26 @@ class DataLineageTracker:
         log_dir = self.project_path / '.migration-logs'
         self.audit_logger = SecurityAuditLogger(log_dir)
         
+        # Findings from earlier runs, keyed by relative path
+        self.cache_file = log_dir / LINEAGE_CACHE_FILE
+        self._cache: Dict[str, Dict] = self._load_cache()
+        
         # Data lineage graph
         self.data_flow = {}
-        self.data_sources = set()
-        self.data_transformations = []
-        self.pii_flows = []
+        self.data_sources: List[Dict] = []
+        self._source_keys: Set[Tuple[str, str]] = set()
+        self.data_transformations: List[Transformation] = []
+        self.pii_flows: List[PIIFlow] = []
     
-    def analyze_data_lineage(self) -> Dict:
+    def analyze_data_lineage(self, max_workers: Optional[int] = None, use_cache: bool = True) -> Dict:
         """
         Analyze data flow through the codebase.
         
+        Args:
+            max_workers: Worker processes for large projects (defaults to
+                the analysis max_workers setting; 1 analyzes serially)
+            use_cache: Reuse findings for files unchanged since the last run
+            
         Returns:
             Data lineage analysis results
         """
@@ -67,23 +472,31 @@ class DataLineageTracker:
         try:
             # Reset tracking
             self.data_flow = {}
-            self.data_sources = set()
+            self.data_sources = []
+            self._source_keys = set()
             self.data_transformations = []
             self.pii_flows = []
             
-            # Analyze Python files
-            for py_file in self.project_path.rglob('*.py'):
-                self._analyze_python_file(py_file)
+            # Collect Python, JavaScript/TypeScript and configuration files
+            # in a single walk, dispatching on suffix
+            # Also skip our own logs and lineage cache
+            skip_dirs = SKIP_DIRS | {self.cache_file.parent.name}
+            file_paths = []
+            for dirpath, dirnames, filenames in os.walk(self.project_path):
+                dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+                file_paths.extend(
+                    Path(dirpath, filename) for filename in filenames
+                    if os.path.splitext(filename)[1] in _ANALYZERS
+                    and not filename.endswith(MINIFIED_SUFFIXES)
+                )
             
-            # Analyze JavaScript/TypeScript files
-            for js_file in self.project_path.rglob('*'):
-                if js_file.suffix in ['.js', '.jsx', '.ts', '.tsx']:
-                    self._analyze_javascript_file(js_file)
+            if use_cache:
+                file_lineages = self._analyze_files_cached(file_paths, max_workers)
+            else:
+                file_lineages = self._analyze_files(file_paths, max_workers)
             
-            # Analyze configuration files
-            for config_file in self.project_path.rglob('*'):
-                if config_file.suffix in ['.json', '.yaml', '.yml', '.env']:
-                    self._analyze_config_file(config_file)
+            for lineage in file_lineages:
+                self._merge_file_lineage(lineage)
             
             # Generate lineage graph
             lineage_graph = self._build_lineage_graph()
@@ -94,9 +507,9 @@ class DataLineageTracker:
             results = {
                 'analysis_timestamp': datetime.now().isoformat(),
                 'project_path': str(self.project_path),
-                'data_sources': list(self.data_sources),
-                'data_transformations': self.data_transformations,
-                'pii_flows': self.pii_flows,
+                'data_sources': self.data_sources,
+                'data_transformations': [t._asdict() for t in self.data_transformations],
+                'pii_flows': [p._asdict() for p in self.pii_flows],
                 'lineage_graph': lineage_graph,
                 'compliance_issues': compliance_issues,
                 'summary': self._generate_lineage_summary()
@@ -129,192 +542,137 @@ class DataLineageTracker:
             )
             raise
     
-    def _analyze_python_file(self, file_path: Path) -> None:
-        """Analyze Python file for data operations."""
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            relative_path = str(file_path.relative_to(self.project_path))
-            
-            # Find database connections
-            db_patterns = [
-                r'connect\(["\']([^"\']+)["\']',
-                r'create_engine\(["\']([^"\']+)["\']',
-                r'psycopg2\.connect\(["\']([^"\']+)["\']',
-                r'mysql\.connect\(["\']([^"\']+)["\']',
-                r'sqlite3\.connect\(["\']([^"\']+)["\']'
-            ]
-            
-            for pattern in db_patterns:
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    connection_string = match.group(1)
-                    self.data_sources.add({
-                        'type': 'database',
-                        'connection_string': self._sanitize_connection_string(connection_string),
-                        'file': relative_path,
-                        'line': content[:match.start()].count('\n') + 1
-                    })
-            
-            # Find data operations
-            data_operations = [
-                (r'(\w+)\.execute\(', 'sql_execute'),
-                (r'(\w+)\.select\(', 'data_select'),
-                (r'(\w+)\.insert\(', 'data_insert'),
-                (r'(\w+)\.update\(', 'data_update'),
-                (r'(\w+)\.delete\(', 'data_delete'),
-                (r'requests\.(get|post|put|delete)\(', 'http_request'),
-                (r'json\.loads\(', 'json_parse'),
-                (r'json\.dumps\(', 'json_serialize')
-            ]
-            
-            for pattern, operation_type in data_operations:
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    self.data_transformations.append({
-                        'type': operation_type,
-                        'file': relative_path,
-                        'line': content[:match.start()].count('\n') + 1,
-                        'context': self._get_line_context(content, match.start())
-                    })
-            
-            # Find PII handling
-            pii_patterns = [
-                (r'(email|phone|ssn|credit_card|password)', 'pii_field'),
-                (r'(user|customer|patient)', 'entity_with_pii'),
-                (r'(encrypt|decrypt|hash)', 'crypto_operation'),
-                (r'(mask|anonymize|redact)', 'data_protection')
-            ]
-            
-            for pattern, pii_type in pii_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    self.pii_flows.append({
-                        'type': pii_type,
-                        'file': relative_path,
-                        'line': content[:match.start()].count('\n') + 1,
-                        'match': match.group(),
-                        'context': self._get_line_context(content, match.start())
-                    })
+    def _analyze_files(self, file_paths: List[Path], max_workers: Optional[int]) -> List[FileLineage]:
+        """Analyze files, fanning out to worker processes for large file sets."""
+        if max_workers is None:
+            max_workers = settings.analysis.max_workers
         
-        except Exception:
-            pass
+        if max_workers > 1 and len(file_paths) >= PARALLEL_ANALYSIS_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(
+                    _analyze_lineage_file,
+                    file_paths,
+                    repeat(self.project_path),
+                    chunksize=PARALLEL_ANALYSIS_CHUNKSIZE
+                ))
+        
+        return [
+            _analyze_lineage_file(file_path, self.project_path)
+            for file_path in _iter_prefetched(file_paths)
+        ]
     
-    def _analyze_javascript_file(self, file_path: Path) -> None:
-        """Analyze JavaScript/TypeScript file for data operations."""
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+    def _analyze_files_cached(self, file_paths: List[Path], max_workers: Optional[int]) -> List[FileLineage]:
+        """
+        Analyze only files whose mtime or size changed since the cached run.
+        
+        The cache is rewritten with the current files, dropping deleted ones.
+        """
+        results: List[Optional[FileLineage]] = []
+        stale = []
+        cache = {}
+        # Files over the size limit are cached as empty findings, so a new
+        # limit must miss every entry made under the old one
+        max_file_size_kb = settings.security.max_file_size_kb
+        
+        for file_path in file_paths:
             relative_path = str(file_path.relative_to(self.project_path))
+            try:
+                stat = file_path.stat()
+                key = [stat.st_mtime_ns, stat.st_size, max_file_size_kb]
+            except OSError:
+                key = None
             
-            # Find API calls
-            api_patterns = [
-                r'fetch\(["\']([^"\']+)["\']',
-                r'axios\.(get|post|put|delete)\(["\']([^"\']+)["\']',
-                r'\$\.ajax\(["\']([^"\']+)["\']',
-                r'request\(["\']([^"\']+)["\']'
-            ]
-            
-            for pattern in api_patterns:
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    endpoint = match.group(2) if len(match.groups()) > 1 else match.group(1)
-                    self.data_sources.add({
-                        'type': 'api_endpoint',
-                        'endpoint': endpoint,
-                        'file': relative_path,
-                        'line': content[:match.start()].count('\n') + 1
-                    })
-            
-            # Find data operations
-            data_operations = [
-                (r'\.then\(', 'async_operation'),
-                (r'localStorage\.(get|set)Item', 'local_storage'),
-                (r'sessionStorage\.(get|set)Item', 'session_storage'),
-                (r'JSON\.(parse|stringify)', 'json_operation'),
-                (r'\.map\(', 'data_transformation'),
-                (r'\.filter\(', 'data_filtering'),
-                (r'\.reduce\(', 'data_aggregation')
-            ]
+            entry = self._cache.get(relative_path)
+            if key is not None and entry is not None and entry.get('key') == key:
+                try:
+                    results.append(FileLineage.from_cache(entry))
+                    cache[relative_path] = entry
+                    continue
+                except (KeyError, TypeError):
+                    # Entry from an older cache layout; re-analyze
+                    pass
             
-            for pattern, operation_type in data_operations:
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    self.data_transformations.append({
-                        'type': operation_type,
-                        'file': relative_path,
-                        'line': content[:match.start()].count('\n') + 1,
-                        'context': self._get_line_context(content, match.start())
-                    })
+            stale.append((len(results), relative_path, key, file_path))
+            results.append(None)
         
-        except Exception:
-            pass
+        analyzed = self._analyze_files([file_path for *_, file_path in stale], max_workers)
+        for (index, relative_path, key, _file_path), lineage in zip(stale, analyzed):
+            results[index] = lineage
+            if key is not None:
+                cache[relative_path] = {'key': key, **lineage.to_cache()}
+        
+        self._cache = cache
+        self._save_cache()
+        return results
     
-    def _analyze_config_file(self, file_path: Path) -> None:
-        """Analyze configuration file for data sources."""
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load cached findings, treating a missing, corrupt or outdated cache as empty."""
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            relative_path = str(file_path.relative_to(self.project_path))
-            
-            # Find database configurations
-            db_keys = ['DATABASE_URL', 'DB_HOST', 'DB_NAME', 'DB_USER', 'API_KEY', 'SECRET_KEY']
-            
-            for key in db_keys:
-                if key in content:
-                    self.data_sources.add({
-                        'type': 'config_database',
-                        'config_key': key,
-                        'file': relative_path,
-                        'line': content[:content.find(key)].count('\n') + 1
-                    })
-        
-        except Exception:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get('version') != _LINEAGE_CACHE_TAG:
+            return {}
+        files = cache.get('files')
+        return files if isinstance(files, dict) else {}
+    
+    def _save_cache(self) -> None:
+        """Persist cached findings, replacing the previous cache atomically."""
+        temp_file = self.cache_file.with_suffix('.tmp')
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': _LINEAGE_CACHE_TAG, 'files': self._cache}, f)
+            os.replace(temp_file, self.cache_file)
+        except OSError:
             pass
     
+    def _merge_file_lineage(self, lineage: FileLineage) -> None:
+        """Fold one file's findings into the tracker state."""
+        for source_type, identifier, details in lineage.sources:
+            self._add_source(source_type, identifier, details)
+        self.data_transformations.extend(lineage.transformations)
+        self.pii_flows.extend(lineage.pii_flows)
+    
+    def _add_source(self, source_type: str, identifier: str, details: Dict) -> None:
+        """Record a data source once per (type, identifier), keeping the first sighting."""
+        key = (source_type, identifier)
+        if key in self._source_keys:
+            return
+        self._source_keys.add(key)
+        self.data_sources.append(details)
+    
     def _build_lineage_graph(self) -> Dict:
-        """Build data lineage graph from analysis."""
-        graph = {
-            'nodes': [],
-            'edges': []
-        }
+        """
+        Build data lineage graph from analysis.
+        
+        Nodes reference their finding by index ('ref') into the matching
+        results list instead of embedding it; edges are (source, target)
+        node id pairs.
+        """
+        nodes = [
+            {'id': f"source_{i}", 'type': 'data_source', 'label': source.get('type', 'unknown'), 'ref': i}
+            for i, source in enumerate(self.data_sources)
+        ]
+        nodes.extend(
+            {'id': f"transform_{i}", 'type': 'transformation', 'label': transform.type, 'ref': i}
+            for i, transform in enumerate(self.data_transformations)
+        )
         
-        # Add data sources as nodes
-        for i, source in enumerate(self.data_sources):
-            node_id = f"source_{i}"
-            graph['nodes'].append({
-                'id': node_id,
-                'type': 'data_source',
-                'label': source.get('type', 'unknown'),
-                'details': source
-            })
-        
-        # Add transformations as nodes
-        for i, transform in enumerate(self.data_transformations):
-            node_id = f"transform_{i}"
-            graph['nodes'].append({
-                'id': node_id,
-                'type': 'transformation',
-                'label': transform['type'],
-                'details': transform
-            })
-        
-        # Add PII flows as special nodes
-        for i, pii_flow in enumerate(self.pii_flows):
-            node_id = f"pii_{i}"
-            graph['nodes'].append({
-                'id': node_id,
-                'type': 'pii_flow',
-                'label': pii_flow['type'],
-                'details': pii_flow
-            })
+        # PII flows as special nodes
+        nodes.extend(
+            {'id': f"pii_{i}", 'type': 'pii_flow', 'label': pii_flow.type, 'ref': i}
+            for i, pii_flow in enumerate(self.pii_flows)
+        )
         
         # Add edges (simplified - would need more sophisticated analysis)
-        for i in range(len(graph['nodes']) - 1):
-            graph['edges'].append({
-                'source': graph['nodes'][i]['id'],
-                'target': graph['nodes'][i + 1]['id'],
-                'type': 'data_flow'
-            })
+        node_ids = [node['id'] for node in nodes]
+        edges = list(zip(node_ids, node_ids[1:]))
         
-        return graph
+        return {
+            'nodes': nodes,
+            'edges': edges
+        }
     
     def _identify_compliance_issues(self) -> List[Dict]:
         """Identify potential compliance issues."""
@@ -322,13 +680,13 @@ class DataLineageTracker:
         
         # Check for unencrypted data storage
         for transform in self.data_transformations:
-            if transform['type'] == 'local_storage' and 'pii' in str(transform).lower():
+            if transform.type == 'local_storage' and 'pii' in str(transform).lower():
                 issues.append({
                     'severity': 'HIGH',
                     'type': 'UNENCRYPTED_PII_STORAGE',
                     'description': 'PII data stored in localStorage without encryption',
-                    'file': transform['file'],
-                    'line': transform['line'],
+                    'file': transform.file,
+                    'line': transform.line,
                     'recommendation': 'Use encryption for PII data in client-side storage'
                 })
         
@@ -367,90 +725,227 @@ class DataLineageTracker:
             'total_transformations': len(self.data_transformations),
             'total_pii_flows': len(self.pii_flows),
             'data_source_types': list(set(s.get('type', 'unknown') for s in self.data_sources)),
-            'transformation_types': list(set(t.get('type', 'unknown') for t in self.data_transformations)),
-            'pii_flow_types': list(set(p.get('type', 'unknown') for p in self.pii_flows))
+            'transformation_types': list(set(t.type for t in self.data_transformations)),
+            'pii_flow_types': list(set(p.type for p in self.pii_flows))
         }
     
-    def _sanitize_connection_string(self, connection_string: str) -> str:
+    @staticmethod
+    def _sanitize_connection_string(connection_string: str) -> str:
         """Sanitize database connection string for logging."""
-        # Remove sensitive parts
-        sanitized = re.sub(r'password=[^;]+', 'password=***', connection_string, flags=re.IGNORECASE)
-        sanitized = re.sub(r'pwd=[^;]+', 'pwd=***', sanitized, flags=re.IGNORECASE)
-        sanitized = re.sub(r'//[^:]+:[^@]+@', '//***:***@', sanitized)
-        return sanitized
+        # Remove sensitive parts in a single pass
+        return _CONNECTION_SECRET_RE.sub(
+            lambda match: _CONNECTION_SECRET_MASKS[match.lastgroup], connection_string
+        )
     
-    def _get_line_context(self, content: str, position: int) -> str:
-        """Get context around a position in content."""
-        lines = content.split('\n')
-        line_num = content[:position].count('\n')
+    @staticmethod
+    def _line_starts(data: bytes) -> List[int]:
+        """Offsets at which each line starts, for bisecting match positions."""
+        if _NUMBA_AVAILABLE:
+            newlines = _newline_offsets(np.frombuffer(data, dtype=np.uint8))
+            return [0, *(newlines + 1).tolist()]
+        return [0, *(match.end() for match in _NEWLINE_RE.finditer(data))]
+    
+    @staticmethod
+    def _get_line_context(data: bytes, line_starts: List[int], position: int) -> str:
+        """Get context around a position in file data."""
+        line_num = bisect_right(line_starts, position) - 1
         
         start_line = max(0, line_num - 1)
-        end_line = min(len(lines), line_num + 2)
+        end_line = min(len(line_starts), line_num + 2)
+        end = line_starts[end_line] - 1 if end_line < len(line_starts) else len(data)
         
-        context_lines = lines[start_line:end_line]
-        return '\n'.join(context_lines).strip()
+        return _decode(data[line_starts[start_line]:end]).strip()
     
     def generate_lineage_report(self, lineage_results: Dict) -> str:
         """Generate formatted data lineage report."""
-        report_lines = [
-            "📊 DATA LINEAGE ANALYSIS REPORT",
-            "=" * 50,
-            f"📅 Analysis Date: {lineage_results['analysis_timestamp']}",
-            f"📁 Project: {lineage_results['project_path']}",
-            "",
-            "📈 SUMMARY:",
-            f"  Data Sources: {lineage_results['summary']['total_data_sources']}",
-            f"  Data Transformations: {lineage_results['summary']['total_transformations']}",
-            f"  PII Flows: {lineage_results['summary']['total_pii_flows']}",
-            ""
-        ]
+        report = io.StringIO()
+        write = report.write
+        summary = lineage_results['summary']
+        
+        write(
+            "📊 DATA LINEAGE ANALYSIS REPORT\n"
+            f"{'=' * 50}\n"
+            f"📅 Analysis Date: {lineage_results['analysis_timestamp']}\n"
+            f"📁 Project: {lineage_results['project_path']}\n"
+            "\n"
+            "📈 SUMMARY:\n"
+            f"  Data Sources: {summary['total_data_sources']}\n"
+            f"  Data Transformations: {summary['total_transformations']}\n"
+            f"  PII Flows: {summary['total_pii_flows']}\n"
+            "\n"
+        )
         
         # Data sources
         if lineage_results['data_sources']:
-            report_lines.extend([
-                "🗄️  DATA SOURCES:",
-            ])
+            write("🗄️  DATA SOURCES:\n")
             
             for source in lineage_results['data_sources'][:10]:  # Limit to 10
-                report_lines.extend([
-                    f"  • {source['type']}: {source.get('connection_string', source.get('endpoint', 'N/A'))}",
-                    f"    File: {source['file']}:{source['line']}"
-                ])
+                write(
+                    f"  • {source['type']}: {source.get('connection_string', source.get('endpoint', 'N/A'))}\n"
+                    f"    File: {source['file']}:{source['line']}\n"
+                )
         
         # PII flows
         if lineage_results['pii_flows']:
-            report_lines.extend([
-                "",
-                "🔒 PII DATA FLOWS:",
-            ])
+            write("\n🔒 PII DATA FLOWS:\n")
             
             for pii_flow in lineage_results['pii_flows'][:10]:  # Limit to 10
-                report_lines.extend([
-                    f"  • {pii_flow['type']}: {pii_flow['match']}",
-                    f"    File: {pii_flow['file']}:{pii_flow['line']}"
-                ])
+                write(
+                    f"  • {pii_flow['type']}: {pii_flow['match']}\n"
+                    f"    File: {pii_flow['file']}:{pii_flow['line']}\n"
+                )
         
         # Compliance issues
         if lineage_results['compliance_issues']:
-            report_lines.extend([
-                "",
-                "⚠️  COMPLIANCE ISSUES:",
-            ])
+            write("\n⚠️  COMPLIANCE ISSUES:\n")
             
             for issue in lineage_results['compliance_issues']:
-                severity_emoji = {
-                    'CRITICAL': '🔴',
-                    'HIGH': '🟠',
-                    'MEDIUM': '🟡',
-                    'LOW': '🟢'
-                }.get(issue['severity'], '⚪')
+                severity_emoji = _SEVERITY_EMOJI.get(issue['severity'], '⚪')
                 
-                report_lines.extend([
-                    f"  {severity_emoji} {issue['type']} ({issue['severity']})",
-                    f"    Description: {issue['description']}",
-                    f"    File: {issue['file']}:{issue['line']}",
-                    f"    Recommendation: {issue['recommendation']}",
-                    ""
-                ])
-        
-        return "\n".join(report_lines)
+                write(
+                    f"  {severity_emoji} {issue['type']} ({issue['severity']})\n"
+                    f"    Description: {issue['description']}\n"
+                    f"    File: {issue['file']}:{issue['line']}\n"
+                    f"    Recommendation: {issue['recommendation']}\n"
+                    "\n"
+                )
+        
+        # Lines are newline-terminated as written; the report has no final newline
+        report.truncate(report.tell() - 1)
+        return report.getvalue()
+
+
+def _analyze_python_file(file_path: Path, project_path: Path) -> FileLineage:
+    """Analyze Python file for data operations."""
+    lineage = FileLineage()
+    try:
+        relative_path = sys.intern(str(file_path.relative_to(project_path)))
+        with _mapped_file(file_path) as data:
+            line_starts = DataLineageTracker._line_starts(data)
+            
+            # Find database connections
+            for match in _PY_DB_RE.finditer(data):
+                connection_string = DataLineageTracker._sanitize_connection_string(_decode(match.group(1)))
+                lineage.sources.append(('database', connection_string, {
+                    'type': 'database',
+                    'connection_string': connection_string,
+                    'file': relative_path,
+                    'line': bisect_right(line_starts, match.start())
+                }))
+            
+            # Find data operations
+            for match in _PY_DATA_OP_RE.finditer(data):
+                lineage.transformations.append(Transformation(
+                    _PY_DATA_OP_TYPES[match.lastindex],
+                    relative_path,
+                    bisect_right(line_starts, match.start()),
+                    DataLineageTracker._get_line_context(data, line_starts, match.start())
+                ))
+            
+            # Find PII handling, reporting each kind once per line
+            seen_pii = set()
+            for pii_type, start, end in _iter_pii_matches(data):
+                line = bisect_right(line_starts, start)
+                if (line, pii_type) in seen_pii:
+                    continue
+                seen_pii.add((line, pii_type))
+                lineage.pii_flows.append(PIIFlow(
+                    pii_type,
+                    relative_path,
+                    line,
+                    _decode(data[start:end]),
+                    DataLineageTracker._get_line_context(data, line_starts, start)
+                ))
+    
+    except Exception:
+        pass
+    
+    return lineage
+
+
+def _analyze_javascript_file(file_path: Path, project_path: Path) -> FileLineage:
+    """Analyze JavaScript/TypeScript file for data operations."""
+    lineage = FileLineage()
+    try:
+        relative_path = sys.intern(str(file_path.relative_to(project_path)))
+        with _mapped_file(file_path) as data:
+            line_starts = DataLineageTracker._line_starts(data)
+            
+            # Find API calls
+            for match in _JS_API_RE.finditer(data):
+                endpoint = _decode(match.group(1))
+                lineage.sources.append(('api_endpoint', endpoint, {
+                    'type': 'api_endpoint',
+                    'endpoint': endpoint,
+                    'file': relative_path,
+                    'line': bisect_right(line_starts, match.start())
+                }))
+            
+            # Find data operations
+            for match in _JS_DATA_OP_RE.finditer(data):
+                lineage.transformations.append(Transformation(
+                    _JS_DATA_OP_TYPES[match.lastindex],
+                    relative_path,
+                    bisect_right(line_starts, match.start()),
+                    DataLineageTracker._get_line_context(data, line_starts, match.start())
+                ))
+    
+    except Exception:
+        pass
+    
+    return lineage
+
+
+def _analyze_config_file(file_path: Path, project_path: Path) -> FileLineage:
+    """Analyze configuration file for data sources."""
+    lineage = FileLineage()
+    try:
+        relative_path = sys.intern(str(file_path.relative_to(project_path)))
+        with _mapped_file(file_path) as data:
+            # Find database configurations with one find per key
+            found = []
+            for key, encoded_key in _CONFIG_KEYS:
+                position = data.find(encoded_key)
+                if position != -1:
+                    found.append((key, position))
+            
+            # Most config files mention none of the keys; skip the line table
+            if found:
+                line_starts = DataLineageTracker._line_starts(data)
+            
+            for key, position in found:
+                lineage.sources.append(('config_database', key, {
+                    'type': 'config_database',
+                    'config_key': key,
+                    'file': relative_path,
+                    'line': bisect_right(line_starts, position)
+                }))
+    
+    except Exception:
+        pass
+    
+    return lineage
+
+
+# Analyzer for each handled file suffix
+_ANALYZERS = {
+    **dict.fromkeys(PYTHON_SUFFIXES, _analyze_python_file),
+    **dict.fromkeys(JAVASCRIPT_SUFFIXES, _analyze_javascript_file),
+    **dict.fromkeys(CONFIG_SUFFIXES, _analyze_config_file)
+}
+
+
+def _analyze_lineage_file(file_path: Path, project_path: Path) -> FileLineage:
+    """
+    Analyze a single file with the analyzer for its suffix.
+    
+    Module-level so it can be pickled into analysis worker processes.
+    
+    Args:
+        file_path: Path to file to analyze
+        project_path: Project root, for relative paths in findings
+        
+    Returns:
+        Findings for the file
+    """
+    return _ANALYZERS[os.path.splitext(file_path.name)[1]](file_path, project_path)
@@ -10,12 +10,22 @@ Detects PII for GDPR compliance:
 - Names
 """
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from ..security import SecurityAuditLogger
+from code_migration.config import settings
+
+
+# Below this many files, process start-up costs more than a serial scan saves
+PARALLEL_SCAN_MIN_FILES = 32
+PARALLEL_SCAN_CHUNKSIZE = 16
 
 
 class PIIDetector:
@@ -158,54 +168,17 @@ class PIIDetector:
         Returns:
             List of PII findings
         """
-        findings = []
-        
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            lines = content.split('\n')
-            
-            for pii_type, pattern_info in self.all_patterns.items():
-                try:
-                    matches = re.finditer(
-                        pattern_info['pattern'], 
-                        content, 
-                        re.MULTILINE | re.IGNORECASE
-                    )
-                    
-                    for match in matches:
-                        line_num = content[:match.start()].count('\n') + 1
-                        line_content = lines[line_num - 1] if line_num <= len(lines) else ""
-                        
-                        finding = {
-                            'type': pii_type,
-                            'severity': pattern_info['severity'],
-                            'confidence': pattern_info['confidence'],
-                            'regulation': pattern_info['regulation'],
-                            'line': line_num,
-                            'column': match.start() - content.rfind('\n', 0, match.start()),
-                            'match': match.group()[:50] + "..." if len(match.group()) > 50 else match.group(),
-                            'file_path': str(file_path.relative_to(self.project_path)),
-                            'context': self._get_context(line_content, match.group()),
-                            'recommendation': self._get_recommendation(pii_type, pattern_info['regulation'])
-                        }
-                        
-                        findings.append(finding)
-                        
-                except re.error:
-                    continue
-        
-        except Exception as e:
-            # Log error but continue scanning
-            pass
-        
-        return findings
+        return _scan_file_for_pii(file_path, self.project_path, self.all_patterns)
     
-    def scan_directory(self, file_extensions: List[str] = None) -> Dict:
+    def scan_directory(self, file_extensions: List[str] = None,
+                       max_workers: Optional[int] = None) -> Dict:
         """
         Scan entire directory for PII.
         
         Args:
             file_extensions: List of file extensions to scan
+            max_workers: Worker processes for large scans (defaults to
+                the analysis max_workers setting; 1 scans serially)
             
         Returns:
             Scan results with summary
@@ -230,22 +203,21 @@ class PIIDetector:
             }
         )
         
-        for ext in file_extensions:
-            for file_path in self.project_path.rglob(f'*{ext}'):
-                # Skip hidden and system files (except .env)
-                if (file_path.name.startswith('.') and file_path.name != '.env') or file_path.name.startswith('__'):
-                    continue
-                
-                try:
-                    findings = self.scan_file(file_path)
-                    files_scanned += 1
-                    
-                    if findings:
-                        files_with_pii += 1
-                        all_findings.extend(findings)
-                        
-                except Exception:
-                    continue
+        file_paths = []
+        for path in _iter_files(str(self.project_path), tuple(file_extensions)):
+            file_path = Path(path)
+            # Skip hidden and system files (except .env)
+            if (file_path.name.startswith('.') and file_path.name != '.env') or file_path.name.startswith('__'):
+                continue
+            
+            file_paths.append(file_path)
+        
+        for findings in self._scan_files(file_paths, max_workers):
+            files_scanned += 1
+            
+            if findings:
+                files_with_pii += 1
+                all_findings.extend(findings)
         
         # Generate summary
         summary = self._generate_scan_summary(all_findings, files_scanned, files_with_pii)
@@ -275,6 +247,23 @@ class PIIDetector:
             'findings': all_findings
         }
     
+    def _scan_files(self, file_paths: List[Path], max_workers: Optional[int]) -> List[List[Dict]]:
+        """Scan files, fanning out to worker processes for large file sets."""
+        if max_workers is None:
+            max_workers = settings.analysis.max_workers
+        
+        if max_workers > 1 and len(file_paths) >= PARALLEL_SCAN_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(
+                    _scan_file_for_pii,
+                    file_paths,
+                    repeat(self.project_path),
+                    repeat(self.all_patterns),
+                    chunksize=PARALLEL_SCAN_CHUNKSIZE
+                ))
+        
+        return [self.scan_file(file_path) for file_path in file_paths]
+    
     def generate_compliance_report(self, scan_results: Dict) -> str:
         """
         Generate compliance report from scan results.
@@ -367,7 +356,8 @@ class PIIDetector:
         
         return "\n".join(report_lines)
     
-    def _get_context(self, line_content: str, match: str) -> str:
+    @staticmethod
+    def _get_context(line_content: str, match: str) -> str:
         """Get context around the PII match."""
         # Redact the actual PII
         redacted = line_content.replace(match, '[REDACTED]')
@@ -378,7 +368,8 @@ class PIIDetector:
         
         return redacted.strip()
     
-    def _get_recommendation(self, pii_type: str, regulation: str) -> str:
+    @staticmethod
+    def _get_recommendation(pii_type: str, regulation: str) -> str:
         """Get recommendation for PII type."""
         recommendations = {
             'email': f"Remove email address. Use environment variables or configuration files for {regulation} compliance.",
@@ -433,3 +424,101 @@ class PIIDetector:
         )
         
         return summary
+
+
+def _scan_file_for_pii(file_path: Path, project_path: Path, patterns: Dict[str, Dict]) -> List[Dict]:
+    """
+    Scan a single file for PII.
+    
+    Module-level so it can be pickled into scan worker processes.
+    
+    Args:
+        file_path: Path to file to scan
+        project_path: Project root, for relative paths in findings
+        patterns: PII/PHI pattern definitions to apply
+        
+    Returns:
+        List of PII findings
+    """
+    findings = []
+    
+    try:
+        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        lines = content.split('\n')
+        
+        for pii_type, pattern_info in patterns.items():
+            try:
+                matches = re.finditer(
+                    pattern_info['pattern'], 
+                    content, 
+                    re.MULTILINE | re.IGNORECASE
+                )
+                
+                for match in matches:
+                    line_num = content[:match.start()].count('\n') + 1
+                    line_content = lines[line_num - 1] if line_num <= len(lines) else ""
+                    
+                    finding = {
+                        'type': pii_type,
+                        'severity': pattern_info['severity'],
+                        'confidence': pattern_info['confidence'],
+                        'regulation': pattern_info['regulation'],
+                        'line': line_num,
+                        'column': match.start() - content.rfind('\n', 0, match.start()),
+                        'match': match.group()[:50] + "..." if len(match.group()) > 50 else match.group(),
+                        'file_path': str(file_path.relative_to(project_path)),
+                        'context': PIIDetector._get_context(line_content, match.group()),
+                        'recommendation': PIIDetector._get_recommendation(pii_type, pattern_info['regulation'])
+                    }
+                    
+                    findings.append(finding)
+                    
+            except re.error:
+                continue
+    
+    except Exception:
+        # Log error but continue scanning
+        pass
+    
+    return findings
+
+
+@lru_cache(maxsize=4096)
+def _list_directory(path: str, mtime_ns: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    List the file and subdirectory paths directly inside path.
+    
+    Keyed on the directory's mtime, which changes whenever an entry is
+    added, removed or renamed in it, so a stale listing is never reused.
+    """
+    files = []
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                files.append(entry.path)
+    return tuple(files), tuple(subdirs)
+
+
+def _iter_files(root: str, suffixes: Tuple[str, ...]) -> Iterator[str]:
+    """
+    Recursively yield paths of files under root ending in any of suffixes.
+    
+    Directory listings come from os.scandir and are cached per directory,
+    so rescanning an unchanged tree costs one stat per directory.
+    Symlinked directories are not followed.
+    """
+    try:
+        files, subdirs = _list_directory(root, os.stat(root).st_mtime_ns)
+    except OSError:
+        # Unreadable directory; skip it like any other unscannable file
+        return
+    
+    for path in files:
+        if path.endswith(suffixes):
+            yield path
+    
+    for subdir in subdirs:
+        yield from _iter_files(subdir, suffixes)
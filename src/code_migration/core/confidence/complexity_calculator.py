@@ -9,10 +9,59 @@ Calculates various complexity metrics:
 """
 
 import ast
+import hashlib
+import heapq
+import json
+import operator
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from ..security import SafeCodeAnalyzer
+from ..security import SafeCodeAnalyzer, SecurityError
+from code_migration.config import settings
+
+
+# Below this many files, pool start-up costs more than a serial pass saves
+PARALLEL_ANALYSIS_MIN_FILES = 8
+
+# Per-file results kept, keyed by (path, mtime, size) so edits invalidate them
+FILE_CACHE_SIZE = 4096
+# Parsed trees are far larger than results, so fewer are kept
+TREE_CACHE_SIZE = 256
+
+# Part of every disk cache key; bump when the analysis or metrics change
+# so results computed by older code are never served
+CACHE_VERSION = 1
+
+# SafeCodeAnalyzer records a complexity for every function
+_get_complexity = operator.itemgetter('complexity')
+
+# Inclusive upper bounds, looked up with bisect_left
+_COMPLEXITY_BUCKET_LIMITS = (5, 10, 20)
+_COMPLEXITY_BUCKETS = ('simple', 'moderate', 'complex', 'very_complex')
+_COMPLEXITY_LEVEL_LIMITS = (10, 20, 50)
+_COMPLEXITY_LEVELS = ("LOW", "MEDIUM", "HIGH", "VERY_HIGH")
+_COMPLEXITY_ASSESSMENTS = (
+    "  ✅ Low complexity",
+    "  ⚠️  Moderate complexity",
+    "  ⚠️  High complexity",
+    "  ❌ Very high complexity"
+)
+
+# Inclusive lower bounds, looked up with bisect_right
+_MAINTAINABILITY_LIMITS = (50, 70, 85)
+_MAINTAINABILITY_ASSESSMENTS = (
+    "  ❌ Poor maintainability - refactoring required",
+    "  ⚠️  Moderate maintainability - consider refactoring",
+    "  ✅ Good maintainability",
+    "  ✅ Excellent maintainability"
+)
 
 
 class ComplexityCalculator:
@@ -26,6 +75,9 @@ class ComplexityCalculator:
     - Technical Debt: Estimated effort to fix issues
     """
     
+    # Shared by all instances; the analyzer holds no per-project state
+    _analyzer: Optional[SafeCodeAnalyzer] = None
+    
     def __init__(self, project_path: Path):
         """
         Initialize complexity calculator.
@@ -34,17 +86,53 @@ class ComplexityCalculator:
             project_path: Path to project to analyze
         """
         self.project_path = Path(project_path)
-        self.code_analyzer = SafeCodeAnalyzer()
+        self.code_analyzer = self._get_analyzer()
+        
+        # Per-file analyses persisted across runs, unless disabled
+        cache_dir = settings.analysis.cache_dir
+        self.cache_dir = Path(cache_dir).expanduser() / 'complexity' if cache_dir else None
+        
+        # LRU caches keyed by _file_key
+        self._file_cache: OrderedDict = OrderedDict()
+        self._cognitive_cache: OrderedDict = OrderedDict()
+        self._tree_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    @classmethod
+    def _get_analyzer(cls) -> SafeCodeAnalyzer:
+        """Shared code analyzer, created on first use."""
+        # Racing threads may each build one; it is stateless, so either will do
+        if cls._analyzer is None:
+            cls._analyzer = SafeCodeAnalyzer()
+        return cls._analyzer
     
-    def calculate_project_complexity(self) -> Dict:
+    def calculate_project_complexity(self, max_workers: Optional[int] = None, use_cache: bool = True) -> Dict:
         """
         Calculate complexity metrics for entire project.
         
+        Args:
+            max_workers: Worker processes for larger projects (defaults to
+                the analysis max_workers setting; 1 analyzes serially)
+            use_cache: Return the previous result when no Python file has
+                been added, removed or modified since
+        
         Returns:
             Dict with complexity metrics
         """
         try:
-            analysis = self.code_analyzer.analyze_directory(self.project_path)
+            if not self.project_path.is_dir():
+                raise SecurityError(f"Path is not a directory: {self.project_path}")
+            
+            # One stat-only walk decides whether anything needs analyzing
+            py_files = list(_scan_python_files(self.project_path))
+            manifest_file = self._manifest_file() if use_cache else None
+            fingerprint = _tree_fingerprint(py_files)
+            if manifest_file is not None:
+                cached = _load_manifest(manifest_file, fingerprint)
+                if cached is not None:
+                    return cached
+            
+            analysis = self._analyze_project([entry[0] for entry in py_files], max_workers)
             
             # Calculate additional metrics
             total_functions = len(analysis['functions'])
@@ -64,7 +152,7 @@ class ComplexityCalculator:
             # Calculate technical debt
             technical_debt = self._calculate_technical_debt(analysis)
             
-            return {
+            result = {
                 'total_files': analysis['files_analyzed'],
                 'total_lines': total_lines,
                 'total_functions': total_functions,
@@ -78,6 +166,10 @@ class ComplexityCalculator:
                 'most_complex_files': self._get_most_complex_files(analysis)
             }
             
+            if manifest_file is not None:
+                _write_analysis_cache(manifest_file, {'fingerprint': fingerprint, 'result': result})
+            return result
+            
         except Exception as e:
             return {
                 'error': str(e),
@@ -95,14 +187,54 @@ class ComplexityCalculator:
         """
         Calculate complexity metrics for a single file.
         
+        Results are cached until the file's mtime or size changes.
+        
         Args:
             file_path: Path to file to analyze
             
         Returns:
             Dict with file complexity metrics
         """
+        key = self._file_key(file_path)
+        if key is not None:
+            cached = self._cache_get(self._file_cache, key)
+            if cached is not None:
+                return cached
+        
+        result = self._compute_file_complexity(file_path, key)
+        if key is not None:
+            self._cache_put(self._file_cache, key, result, FILE_CACHE_SIZE)
+        return result
+    
+    def calculate_files_complexity(self, file_paths: List[Path], max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Calculate complexity metrics for many files.
+        
+        Args:
+            file_paths: Paths of files to analyze
+            max_workers: Worker threads for larger batches (defaults to the
+                analysis max_workers setting; 1 analyzes serially)
+            
+        Returns:
+            List of file complexity metrics, in file_paths order
+        """
+        if max_workers is None:
+            max_workers = settings.analysis.max_workers
+        
+        if max_workers <= 1 or len(file_paths) < PARALLEL_ANALYSIS_MIN_FILES:
+            return [self.calculate_file_complexity(file_path) for file_path in file_paths]
+        
+        # Threads share this instance's caches; one file's read overlaps another's parse
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.calculate_file_complexity, file_paths))
+    
+    def _compute_file_complexity(self, file_path: Path, key: Optional[Tuple[str, int, int]]) -> Dict:
+        """Calculate complexity metrics for a single file, uncached."""
         try:
-            analysis = self.code_analyzer.analyze(file_path)
+            analysis, tree = _analyze_python_file_with_tree(file_path, self.cache_dir)
+            # Hand the tree to the cognitive metric so the file is read once
+            if tree is not None and key is not None:
+                self._cache_put(self._tree_cache, key, tree, TREE_CACHE_SIZE)
             
             if not analysis.get('parsed'):
                 return {
@@ -114,11 +246,12 @@ class ComplexityCalculator:
             functions = analysis['functions']
             classes = analysis['classes']
             
-            total_complexity = sum(f.get('complexity', 0) for f in functions)
+            # The analyzer already totals its functions' complexity
+            total_complexity = analysis['complexity']
             total_lines = analysis['line_count']
             
             # Cognitive complexity (simplified)
-            cognitive_complexity = self._calculate_cognitive_complexity(file_path)
+            cognitive_complexity = self._cognitive_complexity(file_path, key)
             
             # Maintainability index
             maintainability_index = self._calculate_maintainability_index(
@@ -144,6 +277,76 @@ class ComplexityCalculator:
                 'file_path': str(file_path)
             }
     
+    def _analyze_project(self, py_files: List[Path], max_workers: Optional[int]) -> Dict:
+        """
+        Analyze the project's Python files, in parallel when worthwhile.
+        
+        Returns the same aggregate as SafeCodeAnalyzer.analyze_directory.
+        """
+        results = {
+            "directory": str(self.project_path),
+            "files_analyzed": 0,
+            "total_lines": 0,
+            "total_size": 0,
+            "classes": [],
+            "functions": [],
+            "imports": [],
+            "total_complexity": 0,
+            "errors": [],
+            # (file, lines, complexity, functions) per parsed file
+            "files": []
+        }
+        
+        for py_file, analysis in zip(py_files, self._analyze_files(py_files, max_workers)):
+            if analysis.get("parsed"):
+                results["files_analyzed"] += 1
+                results["total_lines"] += analysis["line_count"]
+                results["total_size"] += analysis["file_size"]
+                results["total_complexity"] += analysis["complexity"]
+                
+                # Aggregate data
+                results["classes"].extend(analysis["classes"])
+                results["functions"].extend(analysis["functions"])
+                results["imports"].extend(analysis["imports"])
+                results["files"].append((
+                    str(py_file), analysis["line_count"], analysis["complexity"],
+                    len(analysis["functions"])
+                ))
+            else:
+                results["errors"].append({
+                    "file": str(py_file),
+                    "error": analysis.get("error", "Unknown error")
+                })
+        
+        # Calculate summary statistics
+        if results["files_analyzed"] > 0:
+            results["avg_complexity"] = results["total_complexity"] / results["files_analyzed"]
+            results["avg_lines_per_file"] = results["total_lines"] / results["files_analyzed"]
+        else:
+            results["avg_complexity"] = 0
+            results["avg_lines_per_file"] = 0
+        
+        return results
+    
+    def _analyze_files(self, py_files: List[Path], max_workers: Optional[int]) -> List[Dict]:
+        """Analyze files, fanning out to worker processes for larger file sets."""
+        if max_workers is None:
+            max_workers = settings.analysis.max_workers
+        
+        if max_workers <= 1 or len(py_files) < PARALLEL_ANALYSIS_MIN_FILES:
+            return [_analyze_python_file(py_file, self.cache_dir) for py_file in py_files]
+        
+        chunksize = max(1, len(py_files) // (4 * max_workers))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(
+                    _analyze_python_file, py_files, repeat(self.cache_dir), chunksize=chunksize
+                ))
+        except (ImportError, NotImplementedError, OSError):
+            # No working multiprocessing here; AST parsing still overlaps file reads
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_analyze_python_file, py_files, repeat(self.cache_dir)))
+    
     def _calculate_maintainability_index(
         self, 
         total_lines: int, 
@@ -155,25 +358,7 @@ class ComplexityCalculator:
         
         Higher is better (0-100 scale).
         """
-        if function_count == 0:
-            return 100.0
-        
-        # Simplified maintainability index calculation
-        # Based on Microsoft's maintainability index formula
-        volume = total_lines * (1.0 if total_lines > 0 else 0.0)
-        complexity = total_complexity
-        functions = function_count
-        
-        # Maintainability Index (simplified)
-        if volume > 0:
-            mi = max(0, 
-                171 - 5.2 * (volume ** 0.23) - 0.23 * complexity - 16.2 * (functions ** 0.5)
-            )
-        else:
-            mi = 100
-        
-        # Scale to 0-100
-        return min(100, max(0, mi))
+        return _maintainability_index(total_lines, total_complexity, function_count)
     
     def _calculate_technical_debt(self, analysis: Dict) -> float:
         """
@@ -210,75 +395,119 @@ class ComplexityCalculator:
         
         Measures how hard the code is to understand.
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content)
+        return self._cognitive_complexity(file_path, self._file_key(file_path))
+    
+    def _cognitive_complexity(self, file_path: Path, key: Optional[Tuple[str, int, int]]) -> int:
+        """Cognitive complexity for the file version identified by key."""
+        if key is not None:
+            cached = self._cache_get(self._cognitive_cache, key)
+            if cached is not None:
+                return cached
+        
+        # Files over the analysis size limit are not parsed at all, matching
+        # SafeCodeAnalyzer; the size comes from the stat behind the key
+        if key is not None and key[2] > settings.security.max_file_size_kb * 1024:
             complexity = 0
-            nesting_level = 0
-            
-            for node in ast.walk(tree):
-                # Increment for nesting
-                if isinstance(node, (ast.If, ast.While, ast.For, ast.With)):
-                    complexity += 1 + nesting_level
-                    nesting_level += 1
-                elif isinstance(node, ast.BoolOp):
-                    complexity += len(node.values) - 1 + nesting_level
-                elif isinstance(node, ast.ExceptHandler):
-                    complexity += 1 + nesting_level
-                elif isinstance(node, ast.ListComp):
-                    complexity += 1 + nesting_level
-                # Reset nesting level when leaving block
-                elif hasattr(node, 'body') and node.body:
-                    # This is a bit simplified, but works for basic cases
-                    pass
-            
-            return complexity
-            
-        except Exception:
-            return 0
+        else:
+            # ValueError covers undecodable source and, before 3.12, null bytes;
+            # RecursionError covers pathologically deep nesting
+            try:
+                visitor = _CognitiveVisitor()
+                visitor.visit(self._parse_tree(file_path, key))
+                complexity = visitor.score
+            except (SyntaxError, ValueError, OSError, RecursionError):
+                complexity = 0
+        
+        if key is not None:
+            self._cache_put(self._cognitive_cache, key, complexity, FILE_CACHE_SIZE)
+        return complexity
+    
+    def _parse_tree(self, file_path: Path, key: Optional[Tuple[str, int, int]]) -> ast.Module:
+        """Parse a file once per version, sharing the tree between AST metrics."""
+        if key is not None:
+            tree = self._cache_get(self._tree_cache, key)
+            if tree is not None:
+                return tree
+        
+        # Compiling the raw bytes lets the tokenizer decode (honouring any
+        # coding cookie) without a Python-level str copy
+        with open(file_path, 'rb') as f:
+            source = f.read()
+        
+        tree = compile(source, str(file_path), 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+        if key is not None:
+            self._cache_put(self._tree_cache, key, tree, TREE_CACHE_SIZE)
+        return tree
+    
+    def _manifest_file(self) -> Optional[Path]:
+        """Cached project result, named by blake2b of the project path."""
+        if self.cache_dir is None:
+            return None
+        key = os.path.abspath(self.project_path).encode('utf-8', 'surrogateescape')
+        return self.cache_dir / f"project-{hashlib.blake2b(key, digest_size=16).hexdigest()}.json"
+    
+    @staticmethod
+    def _file_key(file_path: Path) -> Optional[Tuple[str, int, int]]:
+        """Cache key for a file's current version, or None if it cannot be stat'ed."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (str(file_path), stat.st_mtime_ns, stat.st_size)
+    
+    def _cache_get(self, cache: OrderedDict, key: Tuple):
+        """Look up a cached value, marking it most recently used."""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, cache: OrderedDict, key: Tuple, value, max_size: int) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > max_size:
+                cache.popitem(last=False)
     
     def _get_complexity_distribution(self, analysis: Dict) -> Dict:
         """Get distribution of function complexities."""
         functions = analysis['functions']
+        try:
+            complexities = list(map(_get_complexity, functions))
+        except KeyError:
+            complexities = [func.get('complexity', 0) for func in functions]
         
-        if not functions:
-            return {'simple': 0, 'moderate': 0, 'complex': 0, 'very_complex': 0}
-        
-        distribution = {'simple': 0, 'moderate': 0, 'complex': 0, 'very_complex': 0}
-        
-        for func in functions:
-            complexity = func.get('complexity', 0)
-            if complexity <= 5:
-                distribution['simple'] += 1
-            elif complexity <= 10:
-                distribution['moderate'] += 1
-            elif complexity <= 20:
-                distribution['complex'] += 1
-            else:
-                distribution['very_complex'] += 1
+        counts = [0] * len(_COMPLEXITY_BUCKETS)
+        for complexity in complexities:
+            counts[bisect_left(_COMPLEXITY_BUCKET_LIMITS, complexity)] += 1
         
-        return distribution
+        return dict(zip(_COMPLEXITY_BUCKETS, counts))
     
     def _get_most_complex_files(self, analysis: Dict, limit: int = 5) -> List[Dict]:
-        """Get most complex files."""
-        # This is a simplified version - in practice, you'd analyze each file
-        # and sort by complexity
+        """Get most complex files, highest cyclomatic complexity first."""
+        # A bounded heap selects the top files without sorting them all, and
+        # the maintainability index is only worked out for those few
+        top_files = heapq.nlargest(limit, analysis.get('files', []), key=lambda f: f[2])
         
-        # For now, return empty list as this would require additional analysis
-        return []
+        return [
+            {
+                'file_path': file_path,
+                'total_lines': lines,
+                'cyclomatic_complexity': complexity,
+                'functions_count': functions,
+                'maintainability_index': self._calculate_maintainability_index(
+                    lines, complexity, functions
+                ),
+                'complexity_level': self._get_complexity_level(complexity)
+            }
+            for file_path, lines, complexity, functions in top_files
+        ]
     
     def _get_complexity_level(self, complexity: int) -> str:
         """Get complexity level description."""
-        if complexity <= 10:
-            return "LOW"
-        elif complexity <= 20:
-            return "MEDIUM"
-        elif complexity <= 50:
-            return "HIGH"
-        else:
-            return "VERY_HIGH"
+        return _COMPLEXITY_LEVELS[bisect_left(_COMPLEXITY_LEVEL_LIMITS, complexity)]
     
     def generate_complexity_report(self, complexity_data: Dict) -> str:
         """
@@ -293,6 +522,24 @@ class ComplexityCalculator:
         if 'error' in complexity_data:
             return f"❌ Error calculating complexity: {complexity_data['error']}"
         
+        # Sections are assembled into one list and joined once
+        dist = complexity_data.get('complexity_distribution')
+        distribution_lines = [
+            "📊 COMPLEXITY DISTRIBUTION:",
+            f"  Simple (≤5): {dist['simple']} functions",
+            f"  Moderate (6-10): {dist['moderate']} functions",
+            f"  Complex (11-20): {dist['complex']} functions",
+            f"  Very Complex (>20): {dist['very_complex']} functions",
+            ""
+        ] if dist is not None else []
+        
+        maintainability_line = _MAINTAINABILITY_ASSESSMENTS[
+            bisect_right(_MAINTAINABILITY_LIMITS, complexity_data['maintainability_index'])
+        ]
+        complexity_line = _COMPLEXITY_ASSESSMENTS[
+            bisect_left(_COMPLEXITY_BUCKET_LIMITS, complexity_data['average_complexity'])
+        ]
+        
         report_lines = [
             "📊 CODE COMPLEXITY ANALYSIS",
             "=" * 50,
@@ -308,45 +555,199 @@ class ComplexityCalculator:
             f"  Average Complexity: {complexity_data['average_complexity']:.1f}",
             f"  Maintainability Index: {complexity_data['maintainability_index']:.1f}/100",
             f"  Technical Debt: {complexity_data['technical_debt_hours']:.1f} hours",
-            ""
-        ]
-        
-        # Complexity distribution
-        if 'complexity_distribution' in complexity_data:
-            dist = complexity_data['complexity_distribution']
-            report_lines.extend([
-                "📊 COMPLEXITY DISTRIBUTION:",
-                f"  Simple (≤5): {dist['simple']} functions",
-                f"  Moderate (6-10): {dist['moderate']} functions", 
-                f"  Complex (11-20): {dist['complex']} functions",
-                f"  Very Complex (>20): {dist['very_complex']} functions",
-                ""
-            ])
-        
-        # Assessment
-        mi = complexity_data['maintainability_index']
-        avg_complexity = complexity_data['average_complexity']
-        
-        report_lines.extend([
+            "",
+            *distribution_lines,
             "🔍 ASSESSMENT:",
-        ])
-        
-        if mi >= 85:
-            report_lines.append("  ✅ Excellent maintainability")
-        elif mi >= 70:
-            report_lines.append("  ✅ Good maintainability")
-        elif mi >= 50:
-            report_lines.append("  ⚠️  Moderate maintainability - consider refactoring")
-        else:
-            report_lines.append("  ❌ Poor maintainability - refactoring required")
-        
-        if avg_complexity <= 5:
-            report_lines.append("  ✅ Low complexity")
-        elif avg_complexity <= 10:
-            report_lines.append("  ⚠️  Moderate complexity")
-        elif avg_complexity <= 20:
-            report_lines.append("  ⚠️  High complexity")
-        else:
-            report_lines.append("  ❌ Very high complexity")
+            maintainability_line,
+            complexity_line
+        ]
         
         return "\n".join(report_lines)
+
+
+# Constructs that cost 1 plus their depth and nest their children deeper
+_NESTING_NODE_TYPES = frozenset({
+    ast.If, ast.While, ast.For, ast.AsyncFor, ast.With, ast.AsyncWith, ast.ExceptHandler,
+    ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp
+})
+
+
+@lru_cache(maxsize=8192)
+def _maintainability_index(total_lines: int, total_complexity: int, function_count: int) -> float:
+    """Maintainability index for a metrics triple, memoized as small files often share one."""
+    if function_count == 0:
+        return 100.0
+    
+    # Simplified maintainability index calculation
+    # Based on Microsoft's maintainability index formula
+    volume = total_lines * (1.0 if total_lines > 0 else 0.0)
+    complexity = total_complexity
+    functions = function_count
+    
+    # Maintainability Index (simplified)
+    if volume > 0:
+        mi = max(0, 
+            171 - 5.2 * (volume ** 0.23) - 0.23 * complexity - 16.2 * (functions ** 0.5)
+        )
+    else:
+        mi = 100
+    
+    # Scale to 0-100
+    return min(100, max(0, mi))
+
+
+class _CognitiveVisitor:
+    """
+    Score cognitive complexity in a single traversal.
+    
+    Each branching construct costs 1 plus its nesting depth, which
+    increases inside the construct and is restored on the way out.
+    Dispatches on the exact node type with one set lookup per node,
+    rather than ast.NodeVisitor's per-node method name lookup.
+    """
+    
+    def __init__(self):
+        self.depth = 0
+        self.score = 0
+    
+    def visit(self, node: ast.AST) -> None:
+        """Score a node and its children."""
+        node_type = type(node)
+        if node_type in _NESTING_NODE_TYPES:
+            self.score += 1 + self.depth
+            self.depth += 1
+            for child in ast.iter_child_nodes(node):
+                self.visit(child)
+            self.depth -= 1
+            return
+        
+        if node_type is ast.BoolOp:
+            # Each extra operand of a boolean chain, at the current depth
+            self.score += len(node.values) - 1 + self.depth
+        
+        for child in ast.iter_child_nodes(node):
+            self.visit(child)
+
+
+def _analyze_python_file(file_path: Path, cache_dir: Optional[Path] = None) -> Dict:
+    """
+    Analyze a single Python file, reporting security errors in the result.
+    
+    Module-level so it can be pickled into analysis worker processes.
+    
+    Args:
+        file_path: Path to file to analyze
+        cache_dir: Directory of persisted analyses, or None to always parse
+        
+    Returns:
+        SafeCodeAnalyzer analysis, or an unparsed result with the error
+    """
+    return _analyze_python_file_with_tree(file_path, cache_dir)[0]
+
+
+def _analyze_python_file_with_tree(
+    file_path: Path, 
+    cache_dir: Optional[Path] = None
+) -> Tuple[Dict, Optional[ast.Module]]:
+    """
+    Analyze a single Python file, also returning its tree when it was parsed.
+    
+    The tree is None when the analysis came from the disk cache or the
+    file did not parse.
+    """
+    cache_file = None
+    if cache_dir is not None:
+        try:
+            cache_file = _analysis_cache_file(cache_dir, file_path)
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f), None
+        except (OSError, ValueError):
+            pass
+    
+    try:
+        analysis, tree = SafeCodeAnalyzer.analyze_with_tree(file_path)
+    except SecurityError as e:
+        return {"parsed": False, "error": str(e)}, None
+    
+    if cache_file is not None:
+        _write_analysis_cache(cache_file, analysis)
+    return analysis, tree
+
+
+def _scan_python_files(directory: Path):
+    """
+    Yield (path, mtime_ns, size) for each Python file under directory.
+    
+    Walks in os.walk's top-down order, taking stats from the scandir
+    entries. Symlinked directories are not followed.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.py'):
+                stat = entry.stat()
+                yield Path(entry.path), stat.st_mtime_ns, stat.st_size
+        except OSError:
+            continue
+    
+    for subdir in subdirs:
+        yield from _scan_python_files(subdir)
+
+
+def _cache_salt() -> str:
+    """CACHE_VERSION plus every setting that changes analysis results."""
+    # Files over the size limit are reported unsafe instead of analyzed
+    return f"{CACHE_VERSION}\0{settings.security.max_file_size_kb}"
+
+
+def _tree_fingerprint(py_files: List[Tuple[Path, int, int]]) -> str:
+    """Digest of every file's path, mtime and size; any change to the tree alters it."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{_cache_salt()}\n".encode('ascii'))
+    for file_path, mtime_ns, size in py_files:
+        digest.update(f"{file_path}\0{mtime_ns}\0{size}\n".encode('utf-8', 'surrogateescape'))
+    return digest.hexdigest()
+
+
+def _load_manifest(manifest_file: Path, fingerprint: str) -> Optional[Dict]:
+    """Previous project result if it was computed for the same tree fingerprint."""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get('fingerprint') != fingerprint:
+        return None
+    return manifest.get('result')
+
+
+def _analysis_cache_file(cache_dir: Path, file_path: Path) -> Path:
+    """Cache entry for the file's current version, named by blake2b of path, size, mtime and _cache_salt."""
+    stat = os.stat(file_path)
+    key = f"{_cache_salt()}\0{os.path.abspath(file_path)}\0{stat.st_size}\0{stat.st_mtime_ns}"
+    digest = hashlib.blake2b(key.encode('utf-8', 'surrogateescape'), digest_size=16).hexdigest()
+    return cache_dir / f"{digest}.json"
+
+
+def _write_analysis_cache(cache_file: Path, analysis: Dict) -> None:
+    """Persist an analysis atomically; caching is best effort."""
+    # Unique per process and thread so concurrent workers never share a temp file
+    temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(analysis, f)
+        os.replace(temp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
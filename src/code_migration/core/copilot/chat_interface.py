@@ -8,12 +8,119 @@ Provides interactive chat capabilities:
 - Context preservation
 """
 
+import io
 import json
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from .copilot_engine import MigrationCopilot, CopilotResponse
+if TYPE_CHECKING:
+    from .copilot_engine import MigrationCopilot, CopilotResponse
+
+
+_SEVERITY_EMOJI = {
+    'ERROR': '🔴',
+    'WARNING': '🟡',
+    'INFO': '🔵'
+}
+_DEFAULT_SEVERITY_EMOJI = '⚪'
+
+# Session messages, formatted once and written in a single call
+_WELCOME_MESSAGE = """
+🚀 Welcome to Migration Co-pilot!
+
+I'm your AI assistant for code migrations. I can help you with:
+
+💡 Migration recommendations and best practices
+📝 Code transformation examples
+🔧 Troubleshooting migration issues
+📊 Migration planning and estimates
+🔒 Security considerations
+❓ General migration questions
+
+Type your message to start chatting, or use these commands:
+  /help      - Show available commands
+  /status    - Show conversation status
+  /clear     - Clear conversation history
+  /summary   - Show conversation summary
+  /recommend - Get migration recommendations
+  /analyze   - Analyze code for issues
+  /exit      - End the session
+
+Let's make your migration successful! 🎯
+
+"""
+
+_HELP_MESSAGE = """
+📋 Available Commands:
+
+General:
+  /help      - Show this help message
+  /status    - Show conversation status
+  /summary   - Show conversation summary
+  /clear     - Clear conversation history
+  /exit      - End the session
+
+Migration:
+  /recommend [type]  - Get migration recommendations
+  /analyze   - Analyze code for migration issues
+  /plan      - Create migration plan
+  /troubleshoot [issue] - Get troubleshooting help
+
+Examples:
+  /recommend react-hooks
+  /recommend vue3
+  /analyze src/components/Button.jsx
+  /troubleshoot "Tests failing after migration"
+
+"""
+
+_GOODBYE_TEMPLATE = """
+👋 Thanks for using Migration Co-pilot!
+
+Session Summary:
+- Duration: {duration:.1f} minutes
+- Messages exchanged: {total_messages}
+- Topics discussed: {topics}
+
+Have a great migration! 🚀
+
+"""
+
+_STATUS_TEMPLATE = """
+📊 Conversation Status:
+
+Duration: {duration:.1f} minutes
+Messages: {total_messages} total
+          {user_messages} from you
+          {assistant_messages} from me
+
+Topics Discussed:
+{topics}
+
+Average Confidence: {average_confidence:.0%}
+
+"""
+
+_SUMMARY_TEMPLATE = """
+📝 Conversation Summary:
+
+Session Duration: {duration:.1f} minutes
+Total Messages: {total_messages}
+
+Topics Discussed ({topic_count}):
+{topics}
+
+Quality Metrics:
+• Average Response Confidence: {average_confidence:.0%}
+• Assistant Responses: {assistant_messages}
+• User Questions: {user_messages}
+
+This conversation is being saved for future reference.
+
+"""
 
 
 class ChatInterface:
@@ -35,17 +142,34 @@ class ChatInterface:
             project_path: Path to project directory
         """
         self.project_path = Path(project_path)
-        self.copilot = MigrationCopilot(project_path)
+        self._copilot: Optional['MigrationCopilot'] = None
+        # Conversation summary, recomputed only after the conversation changes
+        self._summary_cache: Optional[Dict] = None
         self.session_start = datetime.now()
-        
+    
+    @property
+    def copilot(self) -> 'MigrationCopilot':
+        """Co-pilot engine, created on first use."""
+        if self._copilot is None:
+            from .copilot_engine import MigrationCopilot
+            self._copilot = MigrationCopilot(self.project_path)
+        return self._copilot
+    
     def start_interactive_session(self) -> None:
         """Start interactive chat session."""
+        if sys.stdin.isatty():
+            # Line editing and history for input(), where available
+            try:
+                import readline  # noqa: F401
+            except ImportError:
+                pass
+        
         self._print_welcome_message()
         
         while True:
             try:
                 # Get user input
-                user_input = input("\n🧑 You: ").strip()
+                user_input = self._read_line("\n🧑 You: ").strip()
                 
                 # Check for exit commands
                 if user_input.lower() in ['exit', 'quit', 'bye', 'goodbye']:
@@ -62,7 +186,7 @@ class ChatInterface:
                     continue
                 
                 # Get response from copilot
-                response = self.copilot.chat(user_input)
+                response = self.send_message(user_input)
                 
                 # Print response
                 self._print_response(response)
@@ -73,7 +197,7 @@ class ChatInterface:
             except EOFError:
                 break
     
-    def send_message(self, message: str, context: Optional[Dict] = None) -> CopilotResponse:
+    def send_message(self, message: str, context: Optional[Dict] = None) -> 'CopilotResponse':
         """
         Send a message to the copilot.
         
@@ -84,95 +208,99 @@ class ChatInterface:
         Returns:
             CopilotResponse
         """
+        self._summary_cache = None
         return self.copilot.chat(message, context)
     
     def get_conversation_summary(self) -> Dict:
         """
         Get summary of current conversation.
         
+        The summary is reused until a message is sent or the conversation
+        is cleared through this interface.
+        
         Returns:
             Conversation summary
         """
-        return self.copilot.get_conversation_summary()
+        if self._summary_cache is None:
+            self._summary_cache = self.copilot.get_conversation_summary()
+        return self._summary_cache
     
     def clear_conversation(self) -> None:
         """Clear conversation history."""
+        self._summary_cache = None
         self.copilot.clear_conversation()
         print("🗑️  Conversation history cleared.")
     
     def _print_welcome_message(self) -> None:
         """Print welcome message."""
-        print("""
-🚀 Welcome to Migration Co-pilot!
-
-I'm your AI assistant for code migrations. I can help you with:
-
-💡 Migration recommendations and best practices
-📝 Code transformation examples
-🔧 Troubleshooting migration issues
-📊 Migration planning and estimates
-🔒 Security considerations
-❓ General migration questions
-
-Type your message to start chatting, or use these commands:
-  /help      - Show available commands
-  /status    - Show conversation status
-  /clear     - Clear conversation history
-  /summary   - Show conversation summary
-  /recommend - Get migration recommendations
-  /analyze   - Analyze code for issues
-  /exit      - End the session
-
-Let's make your migration successful! 🎯
-        """)
+        sys.stdout.write(_WELCOME_MESSAGE)
     
     def _print_goodbye_message(self) -> None:
         """Print goodbye message."""
         summary = self.get_conversation_summary()
-        duration = summary.get('conversation_duration', 0)
         
-        print(f"""
-👋 Thanks for using Migration Co-pilot!
-
-Session Summary:
-- Duration: {duration:.1f} minutes
-- Messages exchanged: {summary.get('total_messages', 0)}
-- Topics discussed: {', '.join(summary.get('topics_discussed', []))}
-
-Have a great migration! 🚀
-        """)
+        sys.stdout.write(_GOODBYE_TEMPLATE.format(
+            duration=summary.get('conversation_duration', 0),
+            total_messages=summary.get('total_messages', 0),
+            topics=', '.join(summary.get('topics_discussed', []))
+        ))
     
-    def _print_response(self, response: CopilotResponse) -> None:
-        """Print copilot response with formatting."""
-        print(f"\n🤖 Co-pilot (confidence: {response.confidence:.0%}):")
-        print(f"{response.message}\n")
+    @staticmethod
+    def _read_line(prompt: str) -> str:
+        """
+        Read one line of user input.
+        
+        Terminals go through input() for line editing; piped input is read
+        with a single readline per turn.
+        
+        Raises:
+            EOFError: When input is exhausted
+        """
+        if sys.stdin.isatty():
+            return input(prompt)
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\n')
+    
+    def _print_response(self, response: 'CopilotResponse') -> None:
+        """Print copilot response with formatting, in a single write."""
+        buf = io.StringIO()
+        buf.write(f"\n🤖 Co-pilot (confidence: {response.confidence:.0%}):\n")
+        buf.write(f"{response.message}\n\n")
         
-        # Print suggestions
+        # Suggestions
         if response.suggestions:
-            print("💡 Suggestions:")
+            buf.write("💡 Suggestions:\n")
             for i, suggestion in enumerate(response.suggestions, 1):
-                print(f"  {i}. {suggestion}")
-            print()
+                buf.write(f"  {i}. {suggestion}\n")
+            buf.write("\n")
         
-        # Print code examples
+        # Code examples
         if response.code_examples:
-            print("💻 Code Examples:")
+            buf.write("💻 Code Examples:\n")
             for i, example in enumerate(response.code_examples, 1):
-                print(f"  Example {i}:")
+                buf.write(f"  Example {i}:\n")
                 # Format code with indentation
                 lines = example.split('\n')
                 for line in lines[:10]:  # Show first 10 lines
-                    print(f"    {line}")
+                    buf.write(f"    {line}\n")
                 if len(lines) > 10:
-                    print(f"    ... ({len(lines) - 10} more lines)")
-                print()
+                    buf.write(f"    ... ({len(lines) - 10} more lines)\n")
+                buf.write("\n")
         
-        # Print documentation links
+        # Documentation links
         if response.documentation_links:
-            print("📚 Documentation:")
+            buf.write("📚 Documentation:\n")
             for link in response.documentation_links:
-                print(f"  - {link}")
-            print()
+                buf.write(f"  - {link}\n")
+            buf.write("\n")
+        
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
     
     def _handle_command(self, command: str) -> None:
         """Handle special commands."""
@@ -199,67 +327,36 @@ Have a great migration! 🚀
     
     def _print_help(self) -> None:
         """Print help message."""
-        print("""
-📋 Available Commands:
-
-General:
-  /help      - Show this help message
-  /status    - Show conversation status
-  /summary   - Show conversation summary
-  /clear     - Clear conversation history
-  /exit      - End the session
-
-Migration:
-  /recommend [type]  - Get migration recommendations
-  /analyze   - Analyze code for migration issues
-  /plan      - Create migration plan
-  /troubleshoot [issue] - Get troubleshooting help
-
-Examples:
-  /recommend react-hooks
-  /recommend vue3
-  /analyze src/components/Button.jsx
-  /troubleshoot "Tests failing after migration"
-        """)
+        sys.stdout.write(_HELP_MESSAGE)
     
     def _print_status(self) -> None:
         """Print conversation status."""
         summary = self.get_conversation_summary()
+        topics = summary.get('topics_discussed', [])
         
-        print(f"""
-📊 Conversation Status:
-
-Duration: {summary.get('conversation_duration', 0):.1f} minutes
-Messages: {summary.get('total_messages', 0)} total
-          {summary.get('user_messages', 0)} from you
-          {summary.get('assistant_messages', 0)} from me
-
-Topics Discussed:
-{chr(10).join(f"  - {topic}" for topic in summary.get('topics_discussed', [])) or "  None yet"}
-
-Average Confidence: {summary.get('average_confidence', 0):.0%}
-        """)
+        sys.stdout.write(_STATUS_TEMPLATE.format(
+            duration=summary.get('conversation_duration', 0),
+            total_messages=summary.get('total_messages', 0),
+            user_messages=summary.get('user_messages', 0),
+            assistant_messages=summary.get('assistant_messages', 0),
+            topics="\n".join(f"  - {topic}" for topic in topics) or "  None yet",
+            average_confidence=summary.get('average_confidence', 0)
+        ))
     
     def _print_summary(self) -> None:
         """Print conversation summary."""
         summary = self.get_conversation_summary()
+        topics = summary.get('topics_discussed', [])
         
-        print(f"""
-📝 Conversation Summary:
-
-Session Duration: {summary.get('conversation_duration', 0):.1f} minutes
-Total Messages: {summary.get('total_messages', 0)}
-
-Topics Discussed ({len(summary.get('topics_discussed', []))}):
-{chr(10).join(f"  • {topic}" for topic in summary.get('topics_discussed', [])) or "  No specific topics"}
-
-Quality Metrics:
-• Average Response Confidence: {summary.get('average_confidence', 0):.0%}
-• Assistant Responses: {summary.get('assistant_messages', 0)}
-• User Questions: {summary.get('user_messages', 0)}
-
-This conversation is being saved for future reference.
-        """)
+        sys.stdout.write(_SUMMARY_TEMPLATE.format(
+            duration=summary.get('conversation_duration', 0),
+            total_messages=summary.get('total_messages', 0),
+            topic_count=len(topics),
+            topics="\n".join(f"  • {topic}" for topic in topics) or "  No specific topics",
+            average_confidence=summary.get('average_confidence', 0),
+            assistant_messages=summary.get('assistant_messages', 0),
+            user_messages=summary.get('user_messages', 0)
+        ))
     
     def _handle_recommend_command(self) -> None:
         """Handle recommend command interactively."""
@@ -316,16 +413,19 @@ This conversation is being saved for future reference.
         
         language = input("Enter language (javascript/python/etc.): ").strip().lower()
         
-        full_path = self.project_path / file_path
-        
-        if not full_path.exists():
+        # Opening directly reports a missing file without a separate stat
+        # Strict UTF-8: undecodable files are reported rather than analyzed mangled
+        try:
+            with open(os.fspath(self.project_path / file_path), 'r', encoding='utf-8') as f:
+                code = f.read()
+        except FileNotFoundError:
             print(f"❌ File not found: {file_path}")
             return
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"❌ Error analyzing file: {e}")
+            return
         
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                code = f.read()
-            
             print(f"\n🔍 Analyzing {file_path}...\n")
             
             issues = self.copilot.analyze_code_issues(code, language)
@@ -334,23 +434,22 @@ This conversation is being saved for future reference.
                 print("✅ No migration issues detected in this file.")
                 return
             
-            print(f"Found {len(issues)} potential issues:\n")
+            buf = io.StringIO()
+            buf.write(f"Found {len(issues)} potential issues:\n\n")
             
             for i, issue in enumerate(issues, 1):
-                severity_emoji = {
-                    'ERROR': '🔴',
-                    'WARNING': '🟡',
-                    'INFO': '🔵'
-                }.get(issue.get('severity', 'INFO'), '⚪')
+                severity_emoji = _SEVERITY_EMOJI.get(issue.get('severity', 'INFO'), _DEFAULT_SEVERITY_EMOJI)
                 
-                print(f"{i}. {severity_emoji} {issue.get('type', 'Issue')}")
-                print(f"   Severity: {issue.get('severity', 'Unknown')}")
-                print(f"   {issue.get('message', '')}")
+                buf.write(f"{i}. {severity_emoji} {issue.get('type', 'Issue')}\n")
+                buf.write(f"   Severity: {issue.get('severity', 'Unknown')}\n")
+                buf.write(f"   {issue.get('message', '')}\n")
                 
                 if issue.get('suggestion'):
-                    print(f"   💡 Suggestion: {issue['suggestion']}")
+                    buf.write(f"   💡 Suggestion: {issue['suggestion']}\n")
                 
-                print()
+                buf.write("\n")
+            
+            sys.stdout.write(buf.getvalue())
         
         except Exception as e:
             print(f"❌ Error analyzing file: {e}")
@@ -9,20 +9,190 @@ Main engine that coordinates:
 """
 
 import json
+import os
 import re
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 from ..security import SecurityAuditLogger
 from .rag_system import RAGSystem
 from .knowledge_base import KnowledgeBase
 
+# Write and parse saved conversation lines with orjson when installed
+try:
+    import orjson
+    
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# Match all intent keywords in one pass with Aho-Corasick when installed
+try:
+    import ahocorasick
+    
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
+
+# Messages kept when the conversation is loaded or compacted
+CONVERSATION_HISTORY_LIMIT = 100
+# The append-only log is compacted once it holds this many lines
+CONVERSATION_COMPACT_LINES = 2 * CONVERSATION_HISTORY_LIMIT
+
+
+# Intent keywords, highest priority first; lowercase, as messages are
+# lowercased before matching
+_INTENT_KEYWORDS = (
+    ('troubleshoot', ('error', 'issue', 'problem', 'failed', 'not working', 'bug')),
+    ('recommend', ('recommend', 'suggest', 'best practice', 'should i')),
+    ('explain', ('explain', 'how does', 'what is', 'why')),
+    ('code_help', ('code', 'example', 'transform', 'convert', 'migrate')),
+    ('planning', ('plan', 'schedule', 'timeline', 'estimate')),
+    ('security', ('security', 'safe', 'risk', 'vulnerable')),
+)
+
+
+def _build_intent_automaton():
+    """Build an Aho-Corasick automaton mapping each keyword to its intent's priority."""
+    automaton = ahocorasick.Automaton()
+    for priority, (_intent, keywords) in enumerate(_INTENT_KEYWORDS):
+        for keyword in keywords:
+            automaton.add_word(keyword, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+_INTENT_AUTOMATON = _build_intent_automaton() if _AHOCORASICK_AVAILABLE else None
+
+
+def _lifecycle_rule(method: str) -> Tuple[str, Dict]:
+    """Rule flagging a React lifecycle method replaceable by useEffect."""
+    return (rf'\b{method}\b', {
+        'type': 'lifecycle_method',
+        'severity': 'INFO',
+        'message': f'Lifecycle method {method} detected. Can be replaced with useEffect.',
+        'suggestion': f'Replace {method} with useEffect hook'
+    })
+
+
+_JS_ISSUE_RULES = (
+    (r'\bclass\s+\w+\s+extends\s+[\w.]*Component\b|\bcreateClass\b', {
+        'type': 'class_component',
+        'severity': 'INFO',
+        'message': 'Class component detected. Consider migrating to functional component with hooks.',
+        'suggestion': 'Use function component with useState and useEffect hooks'
+    }),
+    _lifecycle_rule('componentDidMount'),
+    _lifecycle_rule('componentWillUnmount'),
+    _lifecycle_rule('componentDidUpdate'),
+    (r'\bthis\.setState\b', {
+        'type': 'set_state',
+        'severity': 'INFO',
+        'message': 'this.setState detected. Replace with useState hook.',
+        'suggestion': 'const [state, setState] = useState(initialValue)'
+    }),
+)
+
+_PYTHON_ISSUE_RULES = (
+    # A print statement: print followed by an argument rather than a call
+    (r'^[ \t]*print[ \t]+[^\s(=]', {
+        'type': 'python2_print',
+        'severity': 'ERROR',
+        'message': 'Python 2 print statement detected. Must use print() function in Python 3.',
+        'suggestion': 'Replace "print x" with "print(x)"'
+    }),
+    (r'/\s*\d+', {
+        'type': 'integer_division',
+        'severity': 'WARNING',
+        'message': 'Integer division may behave differently in Python 3.',
+        'suggestion': 'Use // for integer division or ensure proper float handling'
+    }),
+)
+
+
+def _compile_issue_rules(rules: Tuple) -> Tuple[re.Pattern, Tuple[Dict, ...]]:
+    """
+    Union a language's rules into one pattern, scanned once per file.
+    
+    Each rule is its own group inside a lookahead, so overlapping matches
+    of different rules are all seen; lastindex - 1 is the rule's index.
+    """
+    pattern = re.compile(
+        '(?=' + '|'.join(f'({regex})' for regex, _issue in rules) + ')',
+        re.MULTILINE
+    )
+    return pattern, tuple(issue for _regex, issue in rules)
+
+
+_CODE_ISSUE_RULES = {
+    'javascript': _compile_issue_rules(_JS_ISSUE_RULES),
+    'python': _compile_issue_rules(_PYTHON_ISSUE_RULES),
+}
+_CODE_ISSUE_RULES['jsx'] = _CODE_ISSUE_RULES['javascript']
+
+# Static reply text, built once; responses get their own list copies
+_TROUBLESHOOTING_SUGGESTIONS = (
+    "Check the error logs for more details",
+    "Verify all dependencies are installed correctly",
+    "Try clearing the cache and rebuilding",
+    "Check for syntax errors in the migrated code",
+)
+_TROUBLESHOOTING_REPORT_STEPS = "\n".join((
+    "1. Check the error message and identify the specific component",
+    "2. Verify the migration was applied correctly",
+    "3. Check for any missing dependencies",
+    "4. Review the migration logs for more details",
+))
+_TROUBLESHOOTING_REPORT_SUGGESTIONS = (
+    "Would you like me to analyze the specific error in more detail?",
+    "Should I help you roll back to the previous version?",
+    "Do you want to see examples of correct migration patterns?",
+)
+# Read-only so no caller can change the links every response shares
+_DOCUMENTATION_LINKS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'troubleshoot': (
+        'https://docs.code-migration.ai/troubleshooting',
+        'https://docs.code-migration.ai/common-issues'
+    ),
+    'recommend': (
+        'https://docs.code-migration.ai/best-practices',
+        'https://docs.code-migration.ai/patterns'
+    ),
+    'explain': (
+        'https://docs.code-migration.ai/concepts',
+        'https://docs.code-migration.ai/migration-types'
+    ),
+    'code_help': (
+        'https://docs.code-migration.ai/examples',
+        'https://docs.code-migration.ai/api-reference'
+    ),
+    'planning': (
+        'https://docs.code-migration.ai/planning',
+        'https://docs.code-migration.ai/visual-planner'
+    ),
+    'security': (
+        'https://docs.code-migration.ai/security',
+        'https://docs.code-migration.ai/compliance'
+    ),
+    'general': (
+        'https://docs.code-migration.ai',
+        'https://docs.code-migration.ai/getting-started'
+    ),
+})
+_DEFAULT_DOCUMENTATION_LINKS = _DOCUMENTATION_LINKS['general']
+
 
 @dataclass
 class ChatMessage:
     """Chat message data structure."""
+    # Slots keep long histories small; dataclass(slots=True) needs Python 3.10
+    __slots__ = ('message_id', 'timestamp', 'role', 'content', 'context', 'metadata')
+    
     message_id: str
     timestamp: str
     role: str  # 'user', 'assistant', 'system'
@@ -34,6 +204,11 @@ class ChatMessage:
 @dataclass
 class CopilotResponse:
     """Co-pilot response structure."""
+    __slots__ = (
+        'response_id', 'message', 'suggestions', 'code_examples',
+        'documentation_links', 'confidence', 'context_used'
+    )
+    
     response_id: str
     message: str
     suggestions: List[str]
@@ -55,26 +230,69 @@ class MigrationCopilot:
     - Interactive troubleshooting
     """
     
-    def __init__(self, project_path: Path):
+    def __init__(
+        self,
+        project_path: Path,
+        response_cache_size: int = 128,
+        response_cache_distance: float = 0.05
+    ):
         """
         Initialize Migration Co-pilot.
         
         Args:
             project_path: Path to project directory
+            response_cache_size: Chat responses kept for repeated questions
+                (0 disables the cache)
+            response_cache_distance: Largest keyword-set Jaccard distance at
+                which a cached response answers a new message
         """
         self.project_path = Path(project_path)
-        self.conversation_history: List[ChatMessage] = []
+        self.response_cache_size = response_cache_size
+        self.response_cache_distance = response_cache_distance
+        # LRU of (intent, keywords) -> (knowledge context, response), valid
+        # for the RAG index revision it was filled from
+        self._response_cache: OrderedDict = OrderedDict()
+        self._response_cache_revision = 0
+        # Read from the log on first access; see conversation_history
+        self._conversation_history: Optional[List[ChatMessage]] = None
+        self._started = datetime.now()
+        # Running totals for the summary, kept in step with the history
+        self._reset_summary_counters()
         self.rag_system = RAGSystem(project_path)
         self.knowledge_base = KnowledgeBase(project_path)
         
         log_dir = self.project_path / '.migration-logs'
         self.audit_logger = SecurityAuditLogger(log_dir)
         
-        self.conversation_file = self.project_path / '.migration-copilot.json'
-        self._load_conversation_history()
-        
-        # Initialize with system context
-        self._initialize_context()
+        # One JSON line per message, appended as the conversation grows;
+        # repeated strings are written once and referenced by ID
+        self.conversation_file = self.project_path / '.migration-copilot.jsonl'
+        # Conversation saved by earlier versions as one JSON document
+        self.legacy_conversation_file = self.project_path / '.migration-copilot.json'
+        self._persisted_count = 0
+        self._file_messages = 0
+        self._string_ids: Dict[str, int] = {}
+        self._rewrite_pending = False
+        # Set when the log's last line lacks its newline, e.g. after a crash
+        self._log_torn = False
+    
+    @property
+    def conversation_history(self) -> List[ChatMessage]:
+        """Messages of this conversation, loaded from the log when first needed."""
+        if self._conversation_history is None:
+            self._conversation_history = []
+            self._load_conversation_history()
+            
+            # Initialize with system context
+            self._initialize_context()
+        return self._conversation_history
+    
+    @conversation_history.setter
+    def conversation_history(self, messages: List[ChatMessage]) -> None:
+        """Replace the conversation; the log is rewritten with it on the next save."""
+        self._conversation_history = messages
+        self._reset_summary_counters()
+        self._rewrite_pending = True
     
     def chat(self, user_message: str, context: Optional[Dict] = None) -> CopilotResponse:
         """
@@ -87,40 +305,56 @@ class MigrationCopilot:
         Returns:
             CopilotResponse with answer and suggestions
         """
+        # One clock reading stamps every ID and timestamp of this turn
+        now = datetime.now()
+        timestamp = now.isoformat()
+        tag = now.strftime('%Y%m%d_%H%M%S')
+        
         # Create user message
         user_msg = ChatMessage(
-            message_id=f"msg_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            timestamp=datetime.now().isoformat(),
+            message_id=f"msg_{tag}",
+            timestamp=timestamp,
             role='user',
             content=user_message,
             context=context or {},
             metadata={}
         )
         
-        self.conversation_history.append(user_msg)
+        self._append_message(user_msg, now)
         
         # Analyze intent
         intent = self._analyze_intent(user_message)
         
-        # Retrieve relevant knowledge
-        knowledge_context = self.rag_system.retrieve_relevant_context(
-            query=user_message,
-            intent=intent,
-            conversation_history=self.conversation_history[-10:]  # Last 10 messages
-        )
-        
-        # Generate response
-        response = self._generate_response(
-            user_message=user_message,
-            intent=intent,
-            knowledge_context=knowledge_context,
-            conversation_context=self.conversation_history[-5:]  # Last 5 messages
-        )
+        # Rephrasings of an earlier question reuse its answer
+        cache_key = (intent, frozenset(self.rag_system._extract_keywords(user_message)))
+        cached = self._lookup_response(cache_key)
+        if cached is not None:
+            knowledge_context, response = cached
+            # Hand out fresh lists so edits never reach the cache or other turns
+            knowledge_context = list(knowledge_context)
+            response = _copy_response(response, response_id=f"resp_{tag}")
+        else:
+            # Retrieve relevant knowledge
+            knowledge_context = self.rag_system.retrieve_relevant_context(
+                query=user_message,
+                intent=intent,
+                conversation_history=self.conversation_history[-10:]  # Last 10 messages
+            )
+            
+            # Generate response
+            response = self._generate_response(
+                user_message=user_message,
+                intent=intent,
+                knowledge_context=knowledge_context,
+                conversation_context=self.conversation_history[-5:],  # Last 5 messages
+                response_id=f"resp_{tag}"
+            )
+            self._store_response(cache_key, knowledge_context, response)
         
         # Create assistant message
         assistant_msg = ChatMessage(
-            message_id=f"msg_{datetime.now().strftime('%Y%m%d_%H%M%S')}_response",
-            timestamp=datetime.now().isoformat(),
+            message_id=f"msg_{tag}_response",
+            timestamp=timestamp,
             role='assistant',
             content=response.message,
             context={'intent': intent, 'knowledge_used': knowledge_context},
@@ -131,7 +365,7 @@ class MigrationCopilot:
             }
         )
         
-        self.conversation_history.append(assistant_msg)
+        self._append_message(assistant_msg, now)
         
         # Log interaction
         self.audit_logger.log_migration_event(
@@ -172,14 +406,14 @@ class MigrationCopilot:
             file_path=file_path
         )
         
-        # Enhance with RAG context
+        # Enhance with RAG context, retrieved for all recommendations at once
+        contexts = self.rag_system.retrieve_relevant_context_batch(
+            [f"{migration_type} {rec.get('topic', '')}" for rec in recommendations],
+            limit=3
+        )
+        
         enhanced_recommendations = []
-        for rec in recommendations:
-            context = self.rag_system.retrieve_relevant_context(
-                query=f"{migration_type} {rec.get('topic', '')}",
-                limit=3
-            )
-            
+        for rec, context in zip(recommendations, contexts):
             rec['additional_context'] = context
             enhanced_recommendations.append(rec)
         
@@ -198,55 +432,18 @@ class MigrationCopilot:
         """
         issues = []
         
-        # Pattern-based analysis
-        if language == 'javascript' or language == 'jsx':
-            # Check for class components
-            if 'class.*extends.*Component' in code or 'createClass' in code:
-                issues.append({
-                    'type': 'class_component',
-                    'severity': 'INFO',
-                    'message': 'Class component detected. Consider migrating to functional component with hooks.',
-                    'suggestion': 'Use function component with useState and useEffect hooks'
-                })
-            
-            # Check for lifecycle methods
-            lifecycle_methods = ['componentDidMount', 'componentWillUnmount', 'componentDidUpdate']
-            for method in lifecycle_methods:
-                if method in code:
-                    issues.append({
-                        'type': 'lifecycle_method',
-                        'severity': 'INFO',
-                        'message': f'Lifecycle method {method} detected. Can be replaced with useEffect.',
-                        'suggestion': f'Replace {method} with useEffect hook'
-                    })
+        # Pattern-based analysis: one scan finds which rules match, and each
+        # matching rule reports once, in rule order
+        rules = _CODE_ISSUE_RULES.get(language)
+        if rules is not None:
+            pattern, rule_issues = rules
+            matched = set()
+            for match in pattern.finditer(code):
+                matched.add(match.lastindex - 1)
+                if len(matched) == len(rule_issues):
+                    break
             
-            # Check for this.setState
-            if 'this.setState' in code:
-                issues.append({
-                    'type': 'set_state',
-                    'severity': 'INFO',
-                    'message': 'this.setState detected. Replace with useState hook.',
-                    'suggestion': 'const [state, setState] = useState(initialValue)'
-                })
-        
-        elif language == 'python':
-            # Check for Python 2 patterns
-            if 'print ' in code and 'print(' not in code:
-                issues.append({
-                    'type': 'python2_print',
-                    'severity': 'ERROR',
-                    'message': 'Python 2 print statement detected. Must use print() function in Python 3.',
-                    'suggestion': 'Replace "print x" with "print(x)"'
-                })
-            
-            # Check for integer division
-            if re.search(r'/\s*\d+', code):
-                issues.append({
-                    'type': 'integer_division',
-                    'severity': 'WARNING',
-                    'message': 'Integer division may behave differently in Python 3.',
-                    'suggestion': 'Use // for integer division or ensure proper float handling'
-                })
+            issues.extend(dict(rule_issues[index]) for index in sorted(matched))
         
         # Query knowledge base for additional issues
         additional_issues = self.knowledge_base.analyze_code_patterns(
@@ -314,7 +511,7 @@ class MigrationCopilot:
         )
         
         # Generate troubleshooting response
-        response = self._generate_troubleshooting_response(
+        response = self._generate_troubleshooting_report(
             issue_description=issue_description,
             error_message=error_message,
             stack_trace=stack_trace,
@@ -330,60 +527,160 @@ class MigrationCopilot:
         Returns:
             Conversation summary dictionary
         """
-        user_messages = [m for m in self.conversation_history if m.role == 'user']
-        assistant_messages = [m for m in self.conversation_history if m.role == 'assistant']
-        
-        # Extract topics discussed
-        topics = set()
-        for msg in self.conversation_history:
-            if 'intent' in msg.context:
-                topics.add(msg.context['intent'])
+        self._sync_summary_counters()
         
         return {
             'total_messages': len(self.conversation_history),
-            'user_messages': len(user_messages),
-            'assistant_messages': len(assistant_messages),
-            'topics_discussed': list(topics),
+            'user_messages': self._role_counts.get('user', 0),
+            'assistant_messages': self._role_counts.get('assistant', 0),
+            'topics_discussed': list(self._topics),
             'conversation_duration': self._calculate_conversation_duration(),
             'average_confidence': self._calculate_average_confidence()
         }
     
     def clear_conversation(self) -> None:
         """Clear conversation history."""
-        self.conversation_history.clear()
-        self._save_conversation_history()
+        # The log is rewritten below, so there is no need to load it first
+        self._conversation_history = []
+        self._reset_summary_counters()
+        self._save_conversation_history(rewrite=True)
+    
+    def _append_message(self, message: ChatMessage, sent_at: datetime) -> None:
+        """Add a message sent at the given time and fold it into the summary totals."""
+        self.conversation_history.append(message)
+        if self._first_sent_at is None:
+            self._first_sent_at = sent_at
+        self._last_sent_at = sent_at
+        self._fold_message(message)
+    
+    def _fold_message(self, message: ChatMessage) -> None:
+        """Add one message to the role, topic and confidence totals."""
+        self._summarized_count += 1
+        self._last_summarized = message
+        self._role_counts[message.role] = self._role_counts.get(message.role, 0) + 1
+        
+        if 'intent' in message.context:
+            self._topics[message.context['intent']] = None
+        if message.role == 'assistant' and 'confidence' in message.metadata:
+            self._confidence_sum += message.metadata['confidence']
+            self._confidence_count += 1
+    
+    def _reset_summary_counters(self) -> None:
+        """Zero the running totals behind get_conversation_summary."""
+        self._role_counts: Dict[str, int] = {}
+        # Insertion-ordered set of intents seen
+        self._topics: Dict[str, None] = {}
+        self._confidence_sum = 0.0
+        self._confidence_count = 0
+        self._first_sent_at: Optional[datetime] = None
+        self._last_sent_at: Optional[datetime] = None
+        # How many messages, ending with which, the totals cover
+        self._summarized_count = 0
+        self._last_summarized: Optional[ChatMessage] = None
+    
+    def _sync_summary_counters(self) -> None:
+        """Rebuild the totals if the history was changed other than through _append_message."""
+        history = self.conversation_history
+        if self._summarized_count == len(history) and (not history or history[-1] is self._last_summarized):
+            return
+        
+        self._reset_summary_counters()
+        for message in history:
+            self._fold_message(message)
+        if history:
+            self._first_sent_at = _parse_timestamp(history[0].timestamp)
+            self._last_sent_at = _parse_timestamp(history[-1].timestamp)
+    
+    def _lookup_response(
+        self, key: Tuple[str, FrozenSet[str]]
+    ) -> Optional[Tuple[List[str], CopilotResponse]]:
+        """
+        Find a cached answer for a message with the same intent and nearly the same keywords.
+        
+        The cache is emptied when the RAG index has changed since it was filled.
+        """
+        revision = self.rag_system.revision
+        if revision != self._response_cache_revision:
+            self._response_cache.clear()
+            self._response_cache_revision = revision
+        
+        entry = self._response_cache.get(key)
+        if entry is not None:
+            self._response_cache.move_to_end(key)
+            return entry
+        
+        intent, keywords = key
+        size = len(keywords)
+        best_key, best_distance = None, self.response_cache_distance
+        for cached_key in self._response_cache:
+            if cached_key[0] != intent:
+                continue
+            cached_keywords = cached_key[1]
+            cached_size = len(cached_keywords)
+            larger = max(size, cached_size)
+            # Jaccard distance is at least 1 - smaller/larger, so check
+            # the sizes before building any intersection
+            if not larger:
+                best_key, best_distance = cached_key, 0.0
+                continue
+            if larger - min(size, cached_size) > best_distance * larger:
+                continue
+            
+            shared = len(keywords & cached_keywords)
+            distance = 1 - shared / (size + cached_size - shared)
+            if distance <= best_distance:
+                best_key, best_distance = cached_key, distance
+        
+        if best_key is None:
+            return None
+        self._response_cache.move_to_end(best_key)
+        return self._response_cache[best_key]
+    
+    def _store_response(
+        self, key: Tuple[str, FrozenSet[str]], context: List[str], response: CopilotResponse
+    ) -> None:
+        """Cache a generated answer, evicting the least recently used when full."""
+        if self.response_cache_size <= 0:
+            return
+        # Keep a private copy; the caller owns the lists of the one it returns
+        self._response_cache[key] = (list(context), _copy_response(response))
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > self.response_cache_size:
+            self._response_cache.popitem(last=False)
     
     def _analyze_intent(self, message: str) -> str:
         """Analyze user message intent."""
         message_lower = message.lower()
         
-        # Define intent patterns
-        intents = {
-            'troubleshoot': ['error', 'issue', 'problem', 'failed', 'not working', 'bug'],
-            'recommend': ['recommend', 'suggest', 'best practice', 'should I'],
-            'explain': ['explain', 'how does', 'what is', 'why'],
-            'code_help': ['code', 'example', 'transform', 'convert', 'migrate'],
-            'planning': ['plan', 'schedule', 'timeline', 'estimate'],
-            'security': ['security', 'safe', 'risk', 'vulnerable'],
-            'general': []
-        }
-        
-        # Check for intent matches
-        for intent, keywords in intents.items():
-            if any(keyword in message_lower for keyword in keywords):
-                return intent
-        
-        return 'general'
+        # The highest-priority intent with any keyword in the message wins
+        if _INTENT_AUTOMATON is None:
+            # Substring tests in priority order stop at the first hit
+            for intent, keywords in _INTENT_KEYWORDS:
+                for keyword in keywords:
+                    if keyword in message_lower:
+                        return intent
+            return 'general'
+        
+        best = len(_INTENT_KEYWORDS)
+        for _end, priority in _INTENT_AUTOMATON.iter(message_lower):
+            if priority < best:
+                best = priority
+                if best == 0:
+                    break
+        
+        return _INTENT_KEYWORDS[best][0] if best < len(_INTENT_KEYWORDS) else 'general'
     
     def _generate_response(
         self,
         user_message: str,
         intent: str,
         knowledge_context: List[str],
-        conversation_context: List[ChatMessage]
+        conversation_context: List[ChatMessage],
+        response_id: Optional[str] = None
     ) -> CopilotResponse:
         """Generate copilot response."""
-        response_id = f"resp_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        if response_id is None:
+            response_id = f"resp_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Base response generation on intent
         if intent == 'troubleshoot':
@@ -437,12 +734,7 @@ class MigrationCopilot:
         """Generate troubleshooting response."""
         response_msg = "I can help you troubleshoot this issue. Here are some steps to resolve it:"
         
-        suggestions = [
-            "Check the error logs for more details",
-            "Verify all dependencies are installed correctly",
-            "Try clearing the cache and rebuilding",
-            "Check for syntax errors in the migrated code"
-        ]
+        suggestions = list(_TROUBLESHOOTING_SUGGESTIONS)
         
         code_examples = context[:2] if context else []
         
@@ -549,37 +841,25 @@ class MigrationCopilot:
         
         return response_msg, suggestions, code_examples
     
-    def _generate_troubleshooting_response(
+    def _generate_troubleshooting_report(
         self,
         issue_description: str,
         error_message: Optional[str],
         stack_trace: Optional[str],
         context: List[str]
     ) -> CopilotResponse:
-        """Generate troubleshooting response."""
+        """Generate the full troubleshooting response for troubleshoot_issue."""
         response_id = f"resp_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Build troubleshooting message
         message = f"I've analyzed your issue: {issue_description}\n\n"
         message += "Here are the troubleshooting steps:\n\n"
-        
-        steps = [
-            "1. Check the error message and identify the specific component",
-            "2. Verify the migration was applied correctly",
-            "3. Check for any missing dependencies",
-            "4. Review the migration logs for more details"
-        ]
-        
-        message += "\n".join(steps)
+        message += _TROUBLESHOOTING_REPORT_STEPS
         
         if error_message:
             message += f"\n\nError Details:\n{error_message}"
         
-        suggestions = [
-            "Would you like me to analyze the specific error in more detail?",
-            "Should I help you roll back to the previous version?",
-            "Do you want to see examples of correct migration patterns?"
-        ]
+        suggestions = list(_TROUBLESHOOTING_REPORT_SUGGESTIONS)
         
         code_examples = context[:3] if context else []
         doc_links = self._generate_documentation_links('troubleshoot', context)
@@ -614,116 +894,210 @@ class MigrationCopilot:
         self, intent: str, context: List[str]
     ) -> List[str]:
         """Generate relevant documentation links."""
-        links = []
-        
-        # Base documentation links
-        base_links = {
-            'troubleshoot': [
-                'https://docs.code-migration.ai/troubleshooting',
-                'https://docs.code-migration.ai/common-issues'
-            ],
-            'recommend': [
-                'https://docs.code-migration.ai/best-practices',
-                'https://docs.code-migration.ai/patterns'
-            ],
-            'explain': [
-                'https://docs.code-migration.ai/concepts',
-                'https://docs.code-migration.ai/migration-types'
-            ],
-            'code_help': [
-                'https://docs.code-migration.ai/examples',
-                'https://docs.code-migration.ai/api-reference'
-            ],
-            'planning': [
-                'https://docs.code-migration.ai/planning',
-                'https://docs.code-migration.ai/visual-planner'
-            ],
-            'security': [
-                'https://docs.code-migration.ai/security',
-                'https://docs.code-migration.ai/compliance'
-            ],
-            'general': [
-                'https://docs.code-migration.ai',
-                'https://docs.code-migration.ai/getting-started'
-            ]
-        }
-        
-        links.extend(base_links.get(intent, base_links['general']))
-        
-        return links
+        return list(_DOCUMENTATION_LINKS.get(intent, _DEFAULT_DOCUMENTATION_LINKS))
     
     def _calculate_conversation_duration(self) -> float:
         """Calculate conversation duration in minutes."""
-        if len(self.conversation_history) < 2:
+        if len(self.conversation_history) < 2 or self._first_sent_at is None or self._last_sent_at is None:
             return 0
         
-        start_time = datetime.fromisoformat(self.conversation_history[0].timestamp)
-        end_time = datetime.fromisoformat(self.conversation_history[-1].timestamp)
-        
-        duration = (end_time - start_time).total_seconds() / 60
+        duration = (self._last_sent_at - self._first_sent_at).total_seconds() / 60
         return duration
     
     def _calculate_average_confidence(self) -> float:
         """Calculate average confidence from assistant messages."""
-        assistant_messages = [m for m in self.conversation_history if m.role == 'assistant']
-        
-        if not assistant_messages:
+        if not self._confidence_count:
             return 0
         
-        confidences = []
-        for msg in assistant_messages:
-            if 'confidence' in msg.metadata:
-                confidences.append(msg.metadata['confidence'])
-        
-        return sum(confidences) / len(confidences) if confidences else 0
+        return self._confidence_sum / self._confidence_count
     
     def _initialize_context(self) -> None:
         """Initialize conversation context."""
+        now = self._started
         system_msg = ChatMessage(
-            message_id=f"msg_{datetime.now().strftime('%Y%m%d_%H%M%S')}_system",
-            timestamp=datetime.now().isoformat(),
+            message_id=f"msg_{now.strftime('%Y%m%d_%H%M%S')}_system",
+            timestamp=now.isoformat(),
             role='system',
             content='Migration Co-pilot initialized. Ready to assist with migrations.',
             context={'initialization': True},
             metadata={}
         )
         
-        self.conversation_history.append(system_msg)
+        self._append_message(system_msg, now)
     
     def _load_conversation_history(self) -> None:
-        """Load conversation history from file."""
-        if self.conversation_file.exists():
+        """Load the most recent messages from the conversation log."""
+        loads = orjson.loads if _ORJSON_AVAILABLE else json.loads
+        strings: List[str] = []
+        messages = []
+        
+        try:
+            with open(self.conversation_file, 'rb') as f:
+                for line in f:
+                    self._log_torn = not line.endswith(b'\n')
+                    # Skip lines a crash left half-written
+                    try:
+                        record = loads(line)
+                        if 'string' in record:
+                            strings.append(record['string'])
+                            continue
+                        self._file_messages += 1
+                        message = _decode_message(record, strings)
+                        messages.append((message, datetime.fromisoformat(message.timestamp)))
+                    except (IndexError, KeyError, TypeError, ValueError):
+                        continue
+        except FileNotFoundError:
+            messages = self._load_legacy_conversation()
+            # Write the imported messages to the new log on the next save
+            self._rewrite_pending = bool(messages)
+        except OSError:
+            pass
+        
+        self._string_ids = {string: string_id for string_id, string in enumerate(strings)}
+        messages = messages[-CONVERSATION_HISTORY_LIMIT:]
+        for message, sent_at in messages:
+            self._append_message(message, sent_at)
+        self._persisted_count = len(messages)
+    
+    def _load_legacy_conversation(self) -> List[Tuple[ChatMessage, datetime]]:
+        """Read messages from the JSON document earlier versions saved."""
+        try:
+            with open(self.legacy_conversation_file, 'rb') as f:
+                records = json.load(f)['messages']
+        except (OSError, ValueError, KeyError, TypeError):
+            return []
+        
+        messages = []
+        for record in records:
             try:
-                with open(self.conversation_file, 'r') as f:
-                    data = json.load(f)
-                    for msg_data in data.get('messages', []):
-                        msg = ChatMessage(**msg_data)
-                        self.conversation_history.append(msg)
-            except Exception:
-                pass
-    
-    def _save_conversation_history(self) -> None:
-        """Save conversation history to file."""
+                message = _decode_message(record, [])
+                messages.append((message, datetime.fromisoformat(message.timestamp)))
+            except (IndexError, KeyError, TypeError, ValueError):
+                continue
+        return messages
+    
+    def _save_conversation_history(self, rewrite: bool = False) -> None:
+        """
+        Append messages not yet saved, compacting the log when it grows too long.
+        
+        Args:
+            rewrite: Replace the log with the most recent messages even if short
+        """
+        string_ids = self._string_ids
+        rewrite = rewrite or self._rewrite_pending
         try:
-            # Keep only last 100 messages
-            recent_messages = self.conversation_history[-100:]
+            new_messages = self.conversation_history[self._persisted_count:]
             
-            data = {
-                'messages': [
-                    {
-                        'message_id': m.message_id,
-                        'timestamp': m.timestamp,
-                        'role': m.role,
-                        'content': m.content,
-                        'context': m.context,
-                        'metadata': m.metadata
-                    }
-                    for m in recent_messages
-                ]
-            }
+            if rewrite or self._file_messages + len(new_messages) > CONVERSATION_COMPACT_LINES:
+                # Rewrite with only the most recent messages and their strings
+                recent_messages = self.conversation_history[-CONVERSATION_HISTORY_LIMIT:]
+                string_ids = {}
+                temp_file = self.conversation_file.with_name(f"{self.conversation_file.name}.tmp")
+                with open(temp_file, 'wb') as f:
+                    f.writelines(_encode_messages(recent_messages, string_ids))
+                os.replace(temp_file, self.conversation_file)
+                self._string_ids = string_ids
+                self._file_messages = len(recent_messages)
+                self._rewrite_pending = False
+                self._log_torn = False
+            
+            elif new_messages:
+                known = len(string_ids)
+                lines = _encode_messages(new_messages, string_ids)
+                try:
+                    with open(self.conversation_file, 'ab') as f:
+                        # Never glue a record onto a half-written last line
+                        if self._log_torn:
+                            f.write(b'\n')
+                        f.writelines(lines)
+                except Exception:
+                    # Forget strings that may not have reached the file
+                    for string in [string for string, string_id in string_ids.items() if string_id >= known]:
+                        del string_ids[string]
+                    self._log_torn = True
+                    raise
+                self._log_torn = False
+                self._file_messages += len(new_messages)
             
-            with open(self.conversation_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._persisted_count = len(self.conversation_history)
         
         except Exception:
             pass
+
+
+def _parse_timestamp(timestamp: str) -> Optional[datetime]:
+    """Parse a message timestamp, or None if it is not ISO 8601."""
+    try:
+        return datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return None
+
+
+def _copy_response(response: CopilotResponse, **changes) -> CopilotResponse:
+    """Copy a response with its own lists, applying any field changes."""
+    return replace(
+        response,
+        suggestions=list(response.suggestions),
+        code_examples=list(response.code_examples),
+        documentation_links=list(response.documentation_links),
+        context_used=list(response.context_used),
+        **changes
+    )
+
+
+def _intern(string: str, string_ids: Dict[str, int], lines: List[bytes]) -> int:
+    """ID of a string in the log's table, emitting its definition line on first use."""
+    string_id = string_ids.get(string)
+    if string_id is None:
+        string_id = string_ids[string] = len(string_ids)
+        lines.append(_dumps_line({'string': string}))
+    return string_id
+
+
+def _encode_messages(messages: List[ChatMessage], string_ids: Dict[str, int]) -> List[bytes]:
+    """
+    Serialize messages as compact JSON lines.
+    
+    Message content and retrieved knowledge repeat heavily between turns,
+    so they are stored as IDs into a string table that string_ids tracks.
+    """
+    lines: List[bytes] = []
+    for message in messages:
+        context = message.context
+        knowledge_used = context.get('knowledge_used')
+        if isinstance(knowledge_used, list) and all(isinstance(item, str) for item in knowledge_used):
+            context = {key: value for key, value in context.items() if key != 'knowledge_used'}
+            context['knowledge_used_ids'] = [_intern(item, string_ids, lines) for item in knowledge_used]
+        
+        lines.append(_dumps_line({
+            'message_id': message.message_id,
+            'timestamp': message.timestamp,
+            'role': message.role,
+            'content_id': _intern(message.content, string_ids, lines),
+            'context': context,
+            'metadata': message.metadata
+        }))
+    return lines
+
+
+def _decode_message(record: Dict, strings: List[str]) -> ChatMessage:
+    """Rebuild a message from its log record, resolving string IDs."""
+    context = record['context']
+    if 'knowledge_used_ids' in context:
+        context['knowledge_used'] = [strings[string_id] for string_id in context.pop('knowledge_used_ids')]
+    
+    return ChatMessage(
+        message_id=record['message_id'],
+        timestamp=record['timestamp'],
+        role=record['role'],
+        content=strings[record['content_id']] if 'content_id' in record else record['content'],
+        context=context,
+        metadata=record['metadata']
+    )
+
+
+def _dumps_line(record: Dict) -> bytes:
+    """Encode one record as a compact JSON line."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(record, separators=(',', ':')).encode('utf-8') + b'\n'
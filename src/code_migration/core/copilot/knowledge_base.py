@@ -507,23 +507,22 @@ export default {
     
     def _load_knowledge(self) -> None:
         """Load knowledge from file."""
-        if self.knowledge_file.exists():
-            try:
-                with open(self.knowledge_file, 'r') as f:
-                    data = json.load(f)
-                    
-                    # Load patterns
-                    for pattern_data in data.get('patterns', []):
-                        pattern = MigrationPattern(**pattern_data)
-                        self.patterns[pattern.pattern_id] = pattern
-                    
-                    # Load practices
-                    for practice_data in data.get('practices', []):
-                        practice = BestPractice(**practice_data)
-                        self.practices[practice.practice_id] = practice
+        try:
+            with open(self.knowledge_file, 'r') as f:
+                data = json.load(f)
+                
+                # Load patterns
+                for pattern_data in data.get('patterns', []):
+                    pattern = MigrationPattern(**pattern_data)
+                    self.patterns[pattern.pattern_id] = pattern
+                
+                # Load practices
+                for practice_data in data.get('practices', []):
+                    practice = BestPractice(**practice_data)
+                    self.practices[practice.practice_id] = practice
             
-            except Exception:
-                pass
+        except Exception:
+            pass
     
     def _save_knowledge(self) -> None:
         """Save knowledge to file."""
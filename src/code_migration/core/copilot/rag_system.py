@@ -13,7 +13,7 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 import hashlib
 
@@ -51,6 +51,8 @@ class RAGSystem:
         self.project_path = Path(project_path)
         self.chunks: Dict[str, KnowledgeChunk] = {}
         self.index: Dict[str, List[str]] = {}  # keyword -> chunk_ids
+        # Bumped whenever the index changes, so callers can drop stale results
+        self.revision = 0
         
         self.index_file = self.project_path / '.migration-rag-index.json'
         self._load_index()
@@ -78,24 +80,55 @@ class RAGSystem:
         Returns:
             List of relevant context strings
         """
-        # Extract keywords from query
-        keywords = self._extract_keywords(query)
+        return self.retrieve_relevant_context_batch([query], intent=intent, limit=limit)[0]
+    
+    def retrieve_relevant_context_batch(
+        self,
+        queries: List[str],
+        intent: Optional[str] = None,
+        limit: int = 5
+    ) -> List[List[str]]:
+        """
+        Retrieve relevant context for several queries at once.
         
-        # Find matching chunks
-        matching_chunks = self._find_matching_chunks(keywords, intent)
+        Repeated queries are answered once, and each candidate chunk's
+        keywords are extracted once for the whole batch.
         
-        # Score chunks by relevance
-        scored_chunks = self._score_chunks(matching_chunks, query, keywords)
+        Args:
+            queries: Search queries
+            intent: Optional intent filter applied to every query
+            limit: Maximum number of chunks to return per query
+            
+        Returns:
+            List of relevant context strings for each query, in order
+        """
+        chunk_keywords: Dict[str, Set[str]] = {}
+        results: Dict[str, List[str]] = {}
         
-        # Sort by score and limit
-        sorted_chunks = sorted(
-            scored_chunks,
-            key=lambda x: x['score'],
-            reverse=True
-        )[:limit]
+        for query in queries:
+            if query in results:
+                continue
+            
+            # Extract keywords from query
+            keywords = self._extract_keywords(query)
+            
+            # Find matching chunks
+            matching_chunks = self._find_matching_chunks(keywords, intent)
+            
+            # Score chunks by relevance
+            scored_chunks = self._score_chunks(matching_chunks, query, keywords, chunk_keywords)
+            
+            # Sort by score and limit
+            sorted_chunks = sorted(
+                scored_chunks,
+                key=lambda x: x['score'],
+                reverse=True
+            )[:limit]
+            
+            # Chunk contents
+            results[query] = [chunk['chunk'].content for chunk in sorted_chunks]
         
-        # Return chunk contents
-        return [chunk['chunk'].content for chunk in sorted_chunks]
+        return [results[query] for query in queries]
     
     def add_document(
         self,
@@ -407,11 +440,18 @@ class RAGSystem:
         self,
         chunks: List[KnowledgeChunk],
         query: str,
-        query_keywords: List[str]
+        query_keywords: List[str],
+        chunk_keywords: Optional[Dict[str, Set[str]]] = None
     ) -> List[Dict]:
-        """Score chunks by relevance."""
+        """
+        Score chunks by relevance.
+        
+        chunk_keywords, when given, memoizes each chunk's keyword set by
+        chunk ID across calls.
+        """
         scored_chunks = []
         query_lower = query.lower()
+        query_keyword_set = set(query_keywords)
         
         for chunk in chunks:
             score = 0
@@ -422,8 +462,13 @@ class RAGSystem:
                 score += 10
             
             # Keyword frequency
-            chunk_keywords = self._extract_keywords(chunk.content)
-            keyword_overlap = set(query_keywords) & set(chunk_keywords)
+            if chunk_keywords is None:
+                keywords = set(self._extract_keywords(chunk.content))
+            else:
+                keywords = chunk_keywords.get(chunk.chunk_id)
+                if keywords is None:
+                    keywords = chunk_keywords[chunk.chunk_id] = set(self._extract_keywords(chunk.content))
+            keyword_overlap = query_keyword_set & keywords
             score += len(keyword_overlap) * 2
             
             # Source relevance
@@ -600,24 +645,24 @@ class RAGSystem:
     
     def _load_index(self) -> None:
         """Load index from file."""
-        if self.index_file.exists():
-            try:
-                with open(self.index_file, 'r') as f:
-                    data = json.load(f)
-                    
-                    # Load chunks
-                    for chunk_data in data.get('chunks', []):
-                        chunk = KnowledgeChunk(**chunk_data)
-                        self.chunks[chunk.chunk_id] = chunk
-                    
-                    # Load index
-                    self.index = data.get('index', {})
+        try:
+            with open(self.index_file, 'r') as f:
+                data = json.load(f)
+                
+                # Load chunks
+                for chunk_data in data.get('chunks', []):
+                    chunk = KnowledgeChunk(**chunk_data)
+                    self.chunks[chunk.chunk_id] = chunk
+                
+                # Load index
+                self.index = data.get('index', {})
             
-            except Exception:
-                pass
+        except Exception:
+            pass
     
     def _save_index(self) -> None:
         """Save index to file."""
+        self.revision += 1
         try:
             data = {
                 'chunks': [
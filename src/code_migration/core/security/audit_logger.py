@@ -11,9 +11,10 @@ import json
 import logging
 import logging.handlers
 import hashlib
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Iterator, Optional
 
 from code_migration.utils.logger import get_logger
 
@@ -43,6 +44,9 @@ class SecurityAuditLogger:
         # We also pass audit logs through structlog
         self._logger = logger
         
+        # Bumped on every logged event so readers can invalidate caches
+        self.version = 0
+        
         self.setup_logging()
 
     def close(self):
@@ -156,6 +160,8 @@ class SecurityAuditLogger:
             fallback_json = json.dumps(fallback_event, separators=(',', ':'))
             self.logger.info(fallback_json)
             self._logger.info("audit_event", **fallback_event)
+        
+        self.version += 1
     
     def log_file_access(
         self,
@@ -262,22 +268,67 @@ class SecurityAuditLogger:
         user: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
+        limit: int = 100,
+        event_types: Optional[Iterable[str]] = None,
+        result_in: Optional[Iterable[str]] = None,
+        compliance_flags: Optional[Iterable[str]] = None
     ) -> list:
         """
         Search audit logs.
         
+        Takes the same filters as iter_logs.
+        
+        Returns:
+            List of matching log entries
+        """
+        return list(self.iter_logs(
+            event_type=event_type,
+            user=user,
+            start_time=start_time,
+            end_time=end_time,
+            limit=limit,
+            event_types=event_types,
+            result_in=result_in,
+            compliance_flags=compliance_flags
+        ))
+    
+    def iter_logs(
+        self,
+        event_type: Optional[str] = None,
+        user: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 100,
+        event_types: Optional[Iterable[str]] = None,
+        result_in: Optional[Iterable[str]] = None,
+        compliance_flags: Optional[Iterable[str]] = None
+    ) -> Iterator[Dict]:
+        """
+        Lazily search audit logs, yielding matches as the log is read.
+        
         Args:
             event_type: Filter by event type
             user: Filter by user
             start_time: Start time filter
             end_time: End time filter
             limit: Maximum results to return
+            event_types: Filter by any of several event types (combined
+                with event_type)
+            result_in: Filter by any of several results
+            compliance_flags: Keep events with any of these compliance flags set
             
-        Returns:
-            List of matching log entries
+        Yields:
+            Matching log entries
         """
-        results = []
+        if limit <= 0:
+            return
+        
+        matched = 0
+        type_filter = set(event_types or ())
+        if event_type:
+            type_filter.add(event_type)
+        result_filter = set(result_in) if result_in else None
+        flag_filter = tuple(compliance_flags or ())
         
         try:
             with open(self.log_file, 'r', encoding='utf-8') as f:
@@ -286,38 +337,49 @@ class SecurityAuditLogger:
                     if not line:
                         continue
                     
+                    # Cheap substring pre-checks: a matching line must contain
+                    # the event type or flag name, so skip parsing the rest
+                    if type_filter and not any(t in line for t in type_filter):
+                        continue
+                    if flag_filter and not any(flag in line for flag in flag_filter):
+                        continue
+                    
                     try:
                         event = json.loads(line)
                         
                         # Apply filters
-                        if event_type and event.get('event_type') != event_type:
+                        if type_filter and event.get('event_type') not in type_filter:
                             continue
                         
-                        if user and event.get('user') != user:
+                        if result_filter is not None and event.get('result') not in result_filter:
                             continue
                         
-                        if start_time:
-                            event_time = datetime.fromisoformat(event.get('timestamp_utc', ''))
-                            if event_time < start_time:
+                        if flag_filter:
+                            compliance = event.get('compliance') or {}
+                            if not any(compliance.get(flag) for flag in flag_filter):
                                 continue
                         
-                        if end_time:
+                        if user and event.get('user') != user:
+                            continue
+                        
+                        if start_time or end_time:
                             event_time = datetime.fromisoformat(event.get('timestamp_utc', ''))
-                            if event_time >= end_time:
+                            if start_time and event_time < start_time:
+                                continue
+                            if end_time and event_time >= end_time:
                                 continue
                         
-                        results.append(event)
-                        
-                        if len(results) >= limit:
-                            break
-                            
                     except (json.JSONDecodeError, ValueError):
                         continue
+                    
+                    yield event
+                    
+                    matched += 1
+                    if matched >= limit:
+                        break
                         
         except FileNotFoundError:
-            pass
-        
-        return results
+            return
     
     def generate_compliance_report(
         self,
@@ -340,35 +402,64 @@ class SecurityAuditLogger:
         if start_date is None:
             start_date = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
         
-        # Get all events in date range
-        events = self.search_logs(
+        # Stream events in the date range; only the tallies and the
+        # security events are kept in memory
+        events = self.iter_logs(
             start_time=start_date,
             end_time=end_date,
             limit=10000
         )
         
-        # Generate statistics
+        # Tally every statistic in one pass, reading each event's
+        # compliance flags once instead of once per statistic
+        user_counts = Counter()
+        resource_counts = Counter()
+        total = file_access = migration = failed = data_access = pii = phi = 0
+        security_events = []
+        for e in events:
+            total += 1
+            user_counts[e.get('user', 'UNKNOWN')] += 1
+            resource_counts[e.get('resource', 'UNKNOWN')] += 1
+            
+            event_type = e.get('event_type')
+            if event_type == 'FILE_ACCESS':
+                file_access += 1
+            elif event_type == 'MIGRATION_EVENT':
+                migration += 1
+            elif event_type == 'SECURITY_VIOLATION':
+                security_events.append(e)
+            
+            compliance = e.get('compliance')
+            if compliance:
+                pii += bool(compliance.get('gdpr_pii_processed', False))
+                phi += bool(compliance.get('hipaa_phi_accessed', False))
+            
+            if e.get('action') in ('READ', 'WRITE', 'DELETE'):
+                data_access += 1
+            if e.get('result') == 'FAILURE':
+                failed += 1
+        
         report = {
             'report_period': {
                 'start': start_date.isoformat(),
                 'end': end_date.isoformat()
             },
             'summary': {
-                'total_events': len(events),
-                'unique_users': len(set(e.get('user', 'UNKNOWN') for e in events)),
-                'file_access_count': len([e for e in events if e.get('event_type') == 'FILE_ACCESS']),
-                'migration_events': len([e for e in events if e.get('event_type') == 'MIGRATION_EVENT']),
-                'security_violations': len([e for e in events if e.get('event_type') == 'SECURITY_VIOLATION'])
+                'total_events': total,
+                'unique_users': len(user_counts),
+                'file_access_count': file_access,
+                'migration_events': migration,
+                'security_violations': len(security_events)
             },
             'compliance': {
-                'gdpr_pii_events': len([e for e in events if e.get('compliance', {}).get('gdpr_pii_processed', False)]),
-                'hipaa_phi_events': len([e for e in events if e.get('compliance', {}).get('hipaa_phi_accessed', False)]),
-                'data_access_events': len([e for e in events if e.get('action') in ['READ', 'WRITE', 'DELETE']]),
-                'failed_operations': len([e for e in events if e.get('result') == 'FAILURE'])
+                'gdpr_pii_events': pii,
+                'hipaa_phi_events': phi,
+                'data_access_events': data_access,
+                'failed_operations': failed
             },
-            'top_users': self._get_top_users(events),
-            'top_resources': self._get_top_resources(events),
-            'security_events': [e for e in events if e.get('event_type') == 'SECURITY_VIOLATION']
+            'top_users': user_counts.most_common(10),
+            'top_resources': resource_counts.most_common(10),
+            'security_events': security_events
         }
         
         return report
@@ -440,20 +531,3 @@ class SecurityAuditLogger:
         else:
             return 'PUBLIC'
     
-    def _get_top_users(self, events: list, limit: int = 10) -> list:
-        """Get top users by activity."""
-        user_counts = {}
-        for event in events:
-            user = event.get('user', 'UNKNOWN')
-            user_counts[user] = user_counts.get(user, 0) + 1
-        
-        return sorted(user_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
-    
-    def _get_top_resources(self, events: list, limit: int = 10) -> list:
-        """Get top accessed resources."""
-        resource_counts = {}
-        for event in events:
-            resource = event.get('resource', 'UNKNOWN')
-            resource_counts[resource] = resource_counts.get(resource, 0) + 1
-        
-        return sorted(resource_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
@@ -13,13 +13,20 @@ import ast
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 
 from .input_validator import SecurityError
 from ..security.crypto_handler import SecureFileHandler
 from code_migration.config import settings
 
 
+# Constructs that each add one path through a function
+_DECISION_NODE_TYPES = frozenset({
+    ast.If, ast.While, ast.For, ast.AsyncFor, ast.ExceptHandler, ast.With, ast.AsyncWith,
+    ast.ListComp, ast.DictComp, ast.SetComp, ast.GeneratorExp
+})
+
+
 class SafeCodeAnalyzer:
     """
     Analyze code WITHOUT executing it.
@@ -41,6 +48,22 @@ class SafeCodeAnalyzer:
         Returns:
             Dict with analysis results
             
+        Raises:
+            SecurityError: If file is too large or analysis fails
+        """
+        return SafeCodeAnalyzer.analyze_with_tree(file_path)[0]
+    
+    @staticmethod
+    def analyze_with_tree(file_path: Path) -> Tuple[Dict[str, Any], Optional[ast.Module]]:
+        """
+        Parse code structure, also returning the parsed tree for further metrics.
+        
+        Args:
+            file_path: Path to file to analyze
+            
+        Returns:
+            Tuple of the analyze() result and the AST, or None if not parsed
+            
         Raises:
             SecurityError: If file is too large or analysis fails
         """
@@ -49,7 +72,7 @@ class SafeCodeAnalyzer:
             raise SecurityError(f"File does not exist: {file_path}")
         file_size = os.path.getsize(file_path)
         if file_size > (settings.security.max_file_size_kb * 1024):
-            return {"safe": False, "reason": f"File exceeds maximum size of {settings.security.max_file_size_kb}KB"}
+            return {"safe": False, "reason": f"File exceeds maximum size of {settings.security.max_file_size_kb}KB"}, None
         
         # Read file with size limit
         try:
@@ -73,7 +96,7 @@ class SafeCodeAnalyzer:
                 "file_path": str(file_path),
                 "file_size": file_size,
                 "line_count": len(lines)
-            }
+            }, None
         
         # Extract metadata via AST traversal only
         analysis = {
@@ -88,6 +111,11 @@ class SafeCodeAnalyzer:
             "docstrings": []
         }
         
+        # Every function's complexity from one pass, instead of re-walking
+        # each function (and again for every enclosing function)
+        function_complexities: Dict[ast.AST, int] = {}
+        SafeCodeAnalyzer._count_decision_points(tree, function_complexities)
+        
         # Traverse AST safely
         for node in ast.walk(tree):
             if isinstance(node, ast.ClassDef):
@@ -102,7 +130,7 @@ class SafeCodeAnalyzer:
                     "name": node.name,
                     "line": node.lineno,
                     "args": [arg.arg for arg in node.args.args],
-                    "complexity": SafeCodeAnalyzer._calculate_cyclomatic_complexity(node)
+                    "complexity": function_complexities[node]
                 })
                 analysis["complexity"] += analysis["functions"][-1]["complexity"]
             
@@ -129,7 +157,7 @@ class SafeCodeAnalyzer:
                     "content": ast.get_docstring(node)[:200] + "..." if len(ast.get_docstring(node)) > 200 else ast.get_docstring(node)
                 })
         
-        return analysis
+        return analysis, tree
     
     @staticmethod
     def _calculate_cyclomatic_complexity(node: ast.FunctionDef) -> int:
@@ -138,28 +166,40 @@ class SafeCodeAnalyzer:
         
         Uses only AST analysis, no execution.
         """
-        complexity = 1  # Base complexity
+        return 1 + SafeCodeAnalyzer._count_decision_points(node, {})
+    
+    @staticmethod
+    def _count_decision_points(tree: ast.AST, function_complexities: Dict[ast.AST, int]) -> int:
+        """
+        Count decision points under tree in a single depth-first pass.
         
-        for child in ast.walk(node):
-            # Each decision point adds to complexity
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-            elif isinstance(child, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(child, (ast.With, ast.AsyncWith)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-            elif isinstance(child, ast.ListComp):
-                complexity += 1
-            elif isinstance(child, ast.DictComp):
-                complexity += 1
-            elif isinstance(child, ast.SetComp):
-                complexity += 1
-            elif isinstance(child, ast.GeneratorExp):
-                complexity += 1
+        Records the cyclomatic complexity of every FunctionDef met on the
+        way. Uses an explicit stack so deeply nested expressions cannot
+        exhaust the recursion limit.
+        """
+        def own_points(node: ast.AST) -> int:
+            if type(node) in _DECISION_NODE_TYPES:
+                return 1
+            if isinstance(node, ast.BoolOp):
+                return len(node.values) - 1
+            return 0
         
-        return complexity
+        # Frames of [node, unvisited children, decision points so far]
+        stack = [[tree, ast.iter_child_nodes(tree), own_points(tree)]]
+        while True:
+            frame = stack[-1]
+            child = next(frame[1], None)
+            if child is not None:
+                stack.append([child, ast.iter_child_nodes(child), own_points(child)])
+                continue
+            
+            stack.pop()
+            node, _children, points = frame
+            if isinstance(node, ast.FunctionDef):
+                function_complexities[node] = 1 + points
+            if not stack:
+                return points
+            stack[-1][2] += points
     
     @staticmethod
     def analyze_directory(directory: Path) -> Dict[str, Any]:
@@ -0,0 +1,167 @@
+"""
+Test suite for data anonymization and masking.
+
+Tests masking, tokenization and free-text anonymization behavior.
+"""
+
+import hashlib
+
+import pytest
+
+from code_migration.core.compliance import DataAnonymizer
+
+
+class TestDataAnonymizer:
+    """Test PII masking and anonymization."""
+
+    @pytest.fixture
+    def anonymizer(self):
+        """Create anonymizer with a fixed salt."""
+        return DataAnonymizer(salt="test-salt")
+
+    def test_mask_email(self, anonymizer):
+        """Test email masking keeps first/last local char and domain."""
+        assert anonymizer.mask_email("john.doe@example.com") == "j******e@example.com"
+        assert anonymizer.mask_email("jo@example.com") == "**@example.com"
+        assert anonymizer.mask_email("not-an-email") == "not-an-email"
+        assert anonymizer.mask_email("john@example.com", preserve_domain=False) == "j**n@*******.com"
+
+    def test_mask_phone(self, anonymizer):
+        """Test phone masking keeps last four digits and format."""
+        assert anonymizer.mask_phone("555-123-4567") == "***-***-4567"
+        assert anonymizer.mask_phone("(555) 123-4567") == "(***) ***-4567"
+        assert anonymizer.mask_phone("555-123-4567", preserve_format=False) == "******4567"
+        assert anonymizer.mask_phone("12") == "**"
+
+    def test_mask_ssn(self, anonymizer):
+        """Test SSN masking."""
+        assert anonymizer.mask_ssn("123-45-6789") == "***-**-6789"
+        assert anonymizer.mask_ssn("123-45") == "******"
+
+    def test_mask_credit_card(self, anonymizer):
+        """Test credit card masking and grouping."""
+        assert anonymizer.mask_credit_card("4242-4242-4242-4242") == "**** **** **** 4242"
+        assert anonymizer.mask_credit_card("378282246310005") == "**** **** ***0 005"
+        assert anonymizer.mask_credit_card("123") == "***"
+
+    def test_anonymize_text(self, anonymizer):
+        """Test free-text anonymization of all PII types."""
+        text = (
+            "Contact john.doe@example.com or 555-123-4567. "
+            "SSN 123-45-6789, card 4242 4242 4242 4242."
+        )
+        result = anonymizer.anonymize_text(text)
+
+        assert "john.doe@example.com" not in result
+        assert "j******e@example.com" in result
+        assert "***-***-4567" in result
+        assert "***-**-6789" in result
+        assert "**** **** **** 4242" in result
+
+    def test_anonymize_text_selected_types(self, anonymizer):
+        """Test only requested PII types are anonymized."""
+        text = "Mail john.doe@example.com, SSN 123-45-6789"
+        result = anonymizer.anonymize_text(text, pii_types=['ssn'])
+
+        assert "john.doe@example.com" in result
+        assert "***-**-6789" in result
+
+    def test_anonymize_text_without_pii(self, anonymizer):
+        """Test text without PII candidates is returned unchanged."""
+        text = "No personal data here, just words."
+
+        assert anonymizer.anonymize_text(text) is text
+        assert anonymizer.anonymize_text("call 555-123-4567", pii_types=['email']) == "call 555-123-4567"
+
+    def test_anonymize_address(self, anonymizer):
+        """Test street address redaction and ZIP preservation."""
+        assert anonymizer.anonymize_address("123 Main Street") == "[ADDRESS REDACTED]"
+        result = anonymizer.anonymize_address("123 Main Street, Anytown 12345", preserve_zip=True)
+        assert result.startswith("[ADDRESS REDACTED]")
+        assert result.endswith(", 12345")
+
+    def test_tokenize_roundtrip(self, anonymizer):
+        """Test reversible tokenization is deterministic and reversible."""
+        token = anonymizer.tokenize("secret-value")
+
+        assert len(token) == 16
+        assert token == anonymizer.tokenize("secret-value")
+        assert anonymizer.detokenize(token) == "secret-value"
+        assert anonymizer.detokenize("unknown") is None
+
+    def test_hash_anonymize(self, anonymizer):
+        """Test hash anonymization is deterministic and salted."""
+        hashed = anonymizer.hash_anonymize("value")
+
+        assert len(hashed) == 16
+        assert hashed == anonymizer.hash_anonymize("value")
+        assert hashed != DataAnonymizer(salt="other-salt").hash_anonymize("value")
+
+    def test_legacy_sha256_hash(self):
+        """Test fast_hash=False keeps the truncated SHA-256 output."""
+        anonymizer = DataAnonymizer(salt="test-salt", fast_hash=False)
+        expected = hashlib.sha256(b"valuetest-salt").hexdigest()
+
+        assert anonymizer.hash_anonymize("value") == expected[:16]
+        assert anonymizer.tokenize("value") == expected[:16]
+
+    def test_salt_is_generated_lazily(self):
+        """Test the random salt is only created when hashing needs it."""
+        anonymizer = DataAnonymizer()
+        anonymizer.mask_email("john.doe@example.com")
+
+        assert anonymizer._salt is None
+
+        hashed = anonymizer.hash_anonymize("value")
+        assert len(anonymizer.salt) == 32
+        assert hashed == anonymizer.hash_anonymize("value")
+
+        anonymizer.salt = "test-salt"
+        assert anonymizer.hash_anonymize("value") == DataAnonymizer(salt="test-salt").hash_anonymize("value")
+
+    def test_hash_anonymize_many(self, anonymizer):
+        """Test batch hashing matches per-value hashing."""
+        values = ["alpha", "beta", "alpha"]
+
+        assert anonymizer.hash_anonymize_many(values, length=12) == [
+            anonymizer.hash_anonymize(value, length=12) for value in values
+        ]
+
+    def test_batch_anonymize(self, anonymizer):
+        """Test batch anonymization dispatches by field type."""
+        data = {
+            'email': 'john.doe@example.com',
+            'ssn': '123-45-6789',
+            'id': 'user-1',
+            'notes': 'keep me',
+        }
+        field_types = {'email': 'email', 'ssn': 'ssn', 'id': 'token', 'notes': 'skip'}
+
+        result = anonymizer.batch_anonymize(data, field_types)
+
+        assert result['email'] == 'j******e@example.com'
+        assert result['ssn'] == '***-**-6789'
+        assert anonymizer.detokenize(result['id']) == 'user-1'
+        assert result['notes'] == 'keep me'
+
+    def test_batch_anonymize_iter_is_lazy(self, anonymizer):
+        """Test streaming batch anonymization yields pairs in order."""
+        data = {'ssn': '123-45-6789', 'notes': 'keep me'}
+        pairs = anonymizer.batch_anonymize_iter(data, {'ssn': 'ssn', 'notes': 'skip'})
+
+        assert next(pairs) == ('ssn', '***-**-6789')
+        assert list(pairs) == [('notes', 'keep me')]
+
+    def test_anonymization_report(self, anonymizer):
+        """Test report detects the applied anonymization types."""
+        original = {'email': 'john.doe@example.com', 'id': 'user-1', 'notes': 'same'}
+        anonymized = anonymizer.batch_anonymize(original, {'email': 'email', 'id': 'token', 'notes': 'skip'})
+
+        report = anonymizer.generate_anonymization_report(original, anonymized)
+
+        assert report['fields_processed'] == 3
+        assert report['fields_changed'] == 2
+        assert report['tokens_generated'] == 1
+        assert report['field_details']['email']['anonymization_type'] == 'partial_mask'
+        assert report['field_details']['id']['anonymization_type'] == 'token'
+        assert report['field_details']['notes']['anonymization_type'] == 'none'
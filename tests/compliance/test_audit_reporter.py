@@ -222,6 +222,25 @@ class TestAuditReporter:
         assert exported_data['report_type'] == 'SOC2'
         assert 'trust_services_criteria' in exported_data
     
+    def test_report_export_json_fallback(self, temp_project_dir, reporter, monkeypatch):
+        """Test stdlib JSON export matches the orjson export."""
+        from code_migration.core.compliance import audit_reporter
+
+        report = reporter.generate_gdpr_report()
+        report['generated_at'] = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        fast_path = temp_project_dir / 'fast.json'
+        slow_path = temp_project_dir / 'slow.json'
+        assert reporter.export_report(report, fast_path, 'json') is True
+        monkeypatch.setattr(audit_reporter, '_ORJSON_AVAILABLE', False)
+        assert reporter.export_report(report, slow_path, 'json') is True
+
+        fast = json.loads(fast_path.read_text(encoding='utf-8'))
+        slow = json.loads(slow_path.read_text(encoding='utf-8'))
+        assert fast == slow
+        assert slow['gdpr_articles']['article_5_data_principles']['lawfulness']['score'] == 90
+        assert slow['generated_at'].startswith('2025-01-01T00:00:00')
+
     def test_report_export_html(self, temp_project_dir, reporter):
         """Test HTML report export functionality."""
         
@@ -243,6 +262,19 @@ class TestAuditReporter:
         assert '<!DOCTYPE html>' in html_content
         assert '</html>' in html_content
     
+    def test_html_report_escapes_content(self, reporter):
+        """Test report fields are HTML-escaped before interpolation."""
+
+        report = reporter.generate_soc2_report()
+        report['report_type'] = '<SOC2>'
+        report['recommendations'] = ['Restrict <script>alert(1)</script> & "eval"']
+
+        html_content = reporter._generate_html_report(report)
+
+        assert '<script>' not in html_content
+        assert '&lt;SOC2&gt; Compliance Report' in html_content
+        assert '&lt;script&gt;alert(1)&lt;/script&gt; &amp; "eval"' in html_content
+
     def test_report_export_invalid_format(self, temp_project_dir, reporter):
         """Test export with invalid format."""
         
@@ -377,6 +409,84 @@ class TestAuditReporter:
             assert isinstance(item['type'], str)
             assert isinstance(item['description'], str)
 
+    def test_score_grading(self, reporter):
+        """Test scorecard averaging and grade/status thresholds."""
+
+        def scorecard(*scores):
+            return {'category': {f'control_{i}': {'score': s} for i, s in enumerate(scores)}}
+
+        assert reporter._calculate_soc2_score(scorecard(90, 95))['grade'] == 'A'
+        assert reporter._calculate_soc2_score(scorecard(80, 85))['grade'] == 'B'
+        low = reporter._calculate_soc2_score(scorecard(70, 75))
+        assert low == {'overall_score': 72.5, 'grade': 'C', 'status': 'NEEDS_IMPROVEMENT'}
+        assert reporter._calculate_gdpr_score({})['overall_score'] == 0
+        assert reporter._calculate_hipaa_score(scorecard(80))['status'] == 'COMPLIANT'
+
+    def test_generate_all_reports(self, reporter):
+        """Test bundle generation matches the serial per-report output."""
+
+        end_date = datetime(2025, 1, 1, 15, 0, 0, tzinfo=timezone.utc)
+        start_date = end_date - timedelta(days=30)
+
+        parallel = reporter.generate_all_reports(start_date, end_date, max_workers=4)
+        serial = reporter.generate_all_reports(start_date, end_date, max_workers=1)
+
+        assert list(parallel) == ['SOC2', 'GDPR', 'HIPAA', 'SECURITY_AUDIT']
+        for name, report in parallel.items():
+            assert report['report_type'] == name
+            assert report['report_period'] == serial[name]['report_period']
+        assert parallel['SOC2']['summary'] == serial['SOC2']['summary']
+        assert parallel['SOC2']['summary']['total_events'] == 5
+
+    def test_generate_all_reports_reads_log_once(self, reporter, monkeypatch):
+        """Test the bundle tallies every report window from a single log scan."""
+        end_date = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        scans = []
+        iter_logs = reporter.audit_logger.iter_logs
+
+        def counting_iter_logs(*args, **kwargs):
+            scans.append(kwargs)
+            return iter_logs(*args, **kwargs)
+
+        monkeypatch.setattr(reporter.audit_logger, 'iter_logs', counting_iter_logs)
+        reports = reporter.generate_all_reports(end_date=end_date, max_workers=1)
+
+        assert len(scans) == 1
+        with AuditReporter(reporter.project_path) as fresh:
+            assert reports['SOC2']['summary'] == fresh.generate_soc2_report(end_date=end_date)['summary']
+            assert reports['GDPR']['pii_processing'] == fresh.generate_gdpr_report(end_date=end_date)['pii_processing']
+            assert reports['SECURITY_AUDIT']['security_analysis'] == (
+                fresh.generate_security_audit_report(end_date=end_date)['security_analysis']
+            )
+        assert reports['SOC2']['summary']['total_events'] == 5
+        # The security audit's 30-day window ends before the sample events
+        assert reports['SECURITY_AUDIT']['security_analysis']['security_incidents']['total_incidents'] == 0
+
+    def test_reports_are_plain_data(self, reporter):
+        """Test every public report serializes, copies and mutates independently."""
+        import copy
+        import pickle
+
+        reports = [
+            reporter.generate_soc2_report(),
+            reporter.generate_gdpr_report(),
+            reporter.generate_hipaa_report(),
+            reporter.generate_security_audit_report(),
+        ]
+        for report in reports:
+            assert json.loads(json.dumps(report)) == report
+            assert copy.deepcopy(report) == report
+            assert pickle.loads(pickle.dumps(report)) == report
+
+        first = reports[1]
+        second = reporter.generate_gdpr_report()
+        first['gdpr_articles']['article_5_data_principles']['lawfulness']['score'] = 0
+        first['recommendations'].append("Extra")
+
+        assert second['gdpr_articles']['article_5_data_principles']['lawfulness']['score'] == 90
+        assert "Extra" not in second['recommendations']
+        assert reporter.generate_gdpr_report()['compliance_score'] == second['compliance_score']
+
 
 class TestAuditReporterEdgeCases:
     """Test edge cases and boundary conditions."""
@@ -443,6 +553,22 @@ class TestAuditReporterEdgeCases:
             assert report['summary']['total_events'] == 0
             assert report['summary']['security_incidents'] == 0
     
+    def test_empty_log_skips_scan(self, temp_project_dir):
+        """Test reports over an empty log never open it for scanning."""
+        audit_log = temp_project_dir / '.migration-logs' / 'security_audit.jsonl'
+        audit_log.write_text("")
+
+        with AuditReporter(temp_project_dir) as reporter:
+            def fail_scan(*args, **kwargs):
+                raise AssertionError("empty log should not be scanned")
+
+            reporter.audit_logger.iter_logs = fail_scan
+            reports = reporter.generate_all_reports(max_workers=1)
+
+        assert reports['SOC2']['summary']['total_events'] == 0
+        assert reports['GDPR']['pii_processing']['total_pii_events'] == 0
+        assert reports['SOC2']['compliance_score']['status'] == 'COMPLIANT'
+
     def test_unicode_in_events(self, temp_project_dir):
         """Test handling of Unicode characters in audit events."""
         audit_log = temp_project_dir / '.migration-logs' / 'security_audit.jsonl'
@@ -494,6 +620,86 @@ class TestAuditReporterEdgeCases:
             # Should handle large number of events
             assert report['summary']['total_events'] == 1000
     
+    def test_filtered_log_search(self, temp_project_dir):
+        """Test event type, result and compliance filters in search_logs."""
+        audit_log = temp_project_dir / '.migration-logs' / 'security_audit.jsonl'
+        
+        events = [
+            {"event_type": "FILE_ACCESS", "timestamp_utc": "2025-01-01T10:00:00+00:00", "action": "READ",
+             "result": "SUCCESS", "compliance": {"gdpr_pii_processed": True, "hipaa_phi_accessed": False}},
+            {"event_type": "FILE_ACCESS", "timestamp_utc": "2025-01-01T11:00:00+00:00", "action": "READ",
+             "result": "DENIED", "compliance": {"gdpr_pii_processed": False, "hipaa_phi_accessed": True}},
+            {"event_type": "MIGRATION_EVENT", "timestamp_utc": "2025-01-01T12:00:00+00:00", "action": "START",
+             "result": "SUCCESS", "compliance": {"gdpr_pii_processed": True, "hipaa_phi_accessed": False}}
+        ]
+        audit_log.write_text('\n'.join(json.dumps(e, separators=(',', ':')) for e in events))
+        
+        start_date = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        end_date = datetime(2025, 1, 2, 0, 0, 0, tzinfo=timezone.utc)
+        
+        with AuditReporter(temp_project_dir) as reporter:
+            search = reporter.audit_logger.search_logs
+            
+            assert len(search(event_types=['FILE_ACCESS'], limit=10)) == 2
+            assert len(search(event_types=['FILE_ACCESS'], result_in=['DENIED'], limit=10)) == 1
+            assert len(search(compliance_flags=['gdpr_pii_processed'], limit=10)) == 2
+            
+            gdpr_report = reporter.generate_gdpr_report(start_date, end_date)
+            hipaa_report = reporter.generate_hipaa_report(start_date, end_date)
+            
+            assert gdpr_report['pii_processing']['total_pii_events'] == 2
+            assert hipaa_report['phi_processing']['total_phi_events'] == 1
+
+            summary = reporter.audit_logger.generate_compliance_report(start_date, end_date)
+            assert summary['summary']['total_events'] == 3
+            assert summary['summary']['file_access_count'] == 2
+            assert summary['top_users'] == [('UNKNOWN', 3)]
+            assert summary['compliance']['gdpr_pii_events'] == 2
+            assert summary['compliance']['hipaa_phi_events'] == 1
+            assert summary['compliance']['data_access_events'] == 2
+
+    def test_authentication_tallies(self, temp_project_dir):
+        """Test auth actions are counted case-insensitively in one pass."""
+        audit_log = temp_project_dir / '.migration-logs' / 'security_audit.jsonl'
+        events = [
+            {"event_type": "AUTH", "timestamp_utc": "2025-01-01T10:00:00+00:00", "action": "AUTHENTICATE", "result": "SUCCESS"},
+            {"event_type": "AUTH", "timestamp_utc": "2025-01-01T10:05:00+00:00", "action": "oauth_login", "result": "FAILURE"},
+            {"event_type": "FILE_ACCESS", "timestamp_utc": "2025-01-01T10:10:00+00:00", "action": None, "result": "SUCCESS"},
+            {"event_type": "FILE_ACCESS", "timestamp_utc": "2025-01-01T10:15:00+00:00", "action": "READ", "result": "SUCCESS"}
+        ]
+        audit_log.write_text('\n'.join(json.dumps(e) for e in events))
+
+        start_date = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        end_date = datetime(2025, 1, 2, 0, 0, 0, tzinfo=timezone.utc)
+
+        with AuditReporter(temp_project_dir) as reporter:
+            report = reporter.generate_security_audit_report(start_date, end_date)
+
+        assert report['security_analysis']['authentication_events'] == {
+            'total_attempts': 2,
+            'successful_logins': 1,
+            'failed_logins': 1
+        }
+
+    def test_stats_reused_until_log_changes(self, temp_project_dir):
+        """Test reports over the same window share tallies until new events are logged."""
+        start_date = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        end_date = datetime.now(timezone.utc) + timedelta(days=1)
+        audit_log = temp_project_dir / '.migration-logs' / 'security_audit.jsonl'
+        audit_log.write_text(audit_log.read_text() + '\n')
+
+        with AuditReporter(temp_project_dir) as reporter:
+            first = reporter._load_stats(start_date, end_date)
+            assert reporter._load_stats(start_date, end_date) is first
+            assert reporter.generate_security_audit_report(start_date, end_date)['security_analysis'][
+                'security_incidents']['total_incidents'] == first.by_type['SECURITY_VIOLATION']
+
+            reporter.audit_logger.log_file_access('test.py', 'user1', 'READ')
+
+            second = reporter._load_stats(start_date, end_date)
+            assert second is not first
+            assert second.total_events == first.total_events + 1
+
     def test_missing_log_directory(self, temp_project_dir):
         """Test handling when audit log directory doesn't exist."""
         # Remove log directory
@@ -236,6 +236,37 @@ class SafeClass:
         assert json_results['files_scanned'] >= 1  # JSON file
         assert json_results['total_findings'] >= 2  # API key, webhook
 
+    
+    def test_parallel_scan_matches_serial(self, detector, temp_project_dir):
+        """Test process-pool scanning returns the same findings as serial."""
+        from code_migration.core.compliance.pii_detector import PARALLEL_SCAN_MIN_FILES
+        
+        for i in range(PARALLEL_SCAN_MIN_FILES):
+            (temp_project_dir / f"contact_{i}.py").write_text(
+                f'email = "user_{i}@example.com"\nphone = "555-123-{i:04d}"\n'
+            )
+        
+        serial = detector.scan_directory(file_extensions=['.py'], max_workers=1)
+        parallel = detector.scan_directory(file_extensions=['.py'], max_workers=2)
+        
+        assert parallel['files_scanned'] == serial['files_scanned']
+        assert parallel['files_with_pii'] == serial['files_with_pii']
+        assert parallel['findings'] == serial['findings']
+
+    
+    def test_rescan_picks_up_new_nested_files(self, detector, temp_project_dir):
+        """Test cached directory listings are invalidated by new files."""
+        nested = temp_project_dir / "pkg" / "sub"
+        nested.mkdir(parents=True)
+        (nested / "first.py").write_text('email = "first@example.com"\n')
+        
+        before = detector.scan_directory(file_extensions=['.py'])
+        (nested / "second.py").write_text('email = "second@example.com"\n')
+        after = detector.scan_directory(file_extensions=['.py'])
+        
+        assert after['files_scanned'] == before['files_scanned'] + 1
+        assert any(f['file_path'].endswith('second.py') for f in after['findings'])
+
 
 class TestPIIDetectorEdgeCases:
     """Test edge cases and boundary conditions."""
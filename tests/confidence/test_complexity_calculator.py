@@ -0,0 +1,384 @@
+"""
+Test suite for code complexity calculation.
+
+Tests project and file complexity metrics.
+"""
+
+import pytest
+from pathlib import Path
+
+from code_migration.core.confidence import ComplexityCalculator
+
+
+class TestComplexityCalculator:
+    """Test complexity metrics."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache_dir(self, tmp_path, monkeypatch):
+        """Keep every calculator's default disk cache out of the home directory."""
+        from code_migration.config import settings
+
+        monkeypatch.setattr(settings.analysis, 'cache_dir', str(tmp_path / "cache"))
+
+    @pytest.fixture
+    def temp_project_dir(self):
+        """Create a temporary project directory with test files."""
+        from tempfile import TemporaryDirectory
+
+        with TemporaryDirectory() as temp_dir:
+            project_path = Path(temp_dir)
+
+            (project_path / "simple.py").write_text(
+                "def add(a, b):\n"
+                "    return a + b\n"
+            )
+
+            (project_path / "pkg").mkdir()
+            (project_path / "pkg" / "branches.py").write_text(
+                "class Router:\n"
+                "    def route(self, request):\n"
+                "        if request.user and request.user.active:\n"
+                "            for item in request.items:\n"
+                "                if item:\n"
+                "                    return item\n"
+                "        return None\n"
+            )
+
+            (project_path / "broken.py").write_text("def broken(:\n")
+
+            yield project_path
+
+    @pytest.fixture
+    def calculator(self, temp_project_dir):
+        """Create complexity calculator with its disk cache inside the temp directory."""
+        calculator = ComplexityCalculator(temp_project_dir)
+        calculator.cache_dir = temp_project_dir / ".cache"
+        return calculator
+
+    def test_project_complexity(self, calculator):
+        """Test project totals aggregate every parsed file."""
+        result = calculator.calculate_project_complexity(max_workers=1)
+
+        assert 'error' not in result
+        assert result['total_files'] == 2
+        assert result['total_functions'] == 2
+        assert result['total_classes'] == 1
+        # add: 1; route: 1 + if + bool op + for + if
+        assert result['total_complexity'] == 6
+        assert result['complexity_distribution']['simple'] == 2
+
+    def test_most_complex_files(self, temp_project_dir, calculator):
+        """Test the most complex files are ranked by cyclomatic complexity."""
+        for i in range(10):
+            branches = "".join(f"    if x == {j}:\n        return {j}\n" for j in range(i))
+            (temp_project_dir / f"module_{i}.py").write_text(f"def handler(x):\n{branches}    return x\n")
+
+        result = calculator.calculate_project_complexity(max_workers=1)
+        top = result['most_complex_files']
+
+        assert [Path(f['file_path']).name for f in top] == [
+            "module_9.py", "module_8.py", "module_7.py", "module_6.py", "module_5.py"
+        ]
+        assert top[0]['cyclomatic_complexity'] == 10
+        assert top[0]['functions_count'] == 1
+        assert 0 < top[0]['maintainability_index'] <= 100
+
+    def test_parallel_project_complexity_matches_serial(self, temp_project_dir, calculator):
+        """Test pooled analysis yields the same totals as a serial pass."""
+        for i in range(12):
+            (temp_project_dir / f"module_{i}.py").write_text(
+                f"def handler_{i}(x):\n    if x:\n        return {i}\n    return 0\n"
+            )
+
+        serial = calculator.calculate_project_complexity(max_workers=1, use_cache=False)
+        parallel = calculator.calculate_project_complexity(max_workers=2, use_cache=False)
+
+        assert parallel == serial
+        assert serial['total_files'] == 14
+
+    def test_file_complexity(self, temp_project_dir, calculator):
+        """Test single-file metrics."""
+        result = calculator.calculate_file_complexity(temp_project_dir / "pkg" / "branches.py")
+
+        assert result['functions_count'] == 1
+        assert result['classes_count'] == 1
+        assert result['cyclomatic_complexity'] == 5
+        assert result['cognitive_complexity'] > 0
+        assert result['complexity_level'] == "LOW"
+
+        broken = calculator.calculate_file_complexity(temp_project_dir / "broken.py")
+        assert 'error' in broken
+
+    def test_nested_function_complexity(self, temp_project_dir, calculator):
+        """Test an enclosing function's complexity includes its nested functions."""
+        file_path = temp_project_dir / "nested.py"
+        file_path.write_text(
+            "def outer(a, b):\n"
+            "    if a or b:\n"
+            "        pass\n"
+            "    def inner(x):\n"
+            "        while x:\n"
+            "            x = [y for y in x]\n"
+            "    return inner\n"
+        )
+
+        functions = calculator.calculate_file_complexity(file_path)['functions']
+
+        assert {f['name']: f['complexity'] for f in functions} == {'outer': 5, 'inner': 3}
+
+    def test_cognitive_complexity_tracks_nesting(self, temp_project_dir, calculator):
+        """Test nesting depth rises inside blocks and drops after them."""
+        file_path = temp_project_dir / "nesting.py"
+        file_path.write_text(
+            "def check(items, flag):\n"
+            "    for item in items:\n"          # +1
+            "        if item and flag:\n"       # +2, bool op in its test +3
+            "            return [i for i in item]\n"  # +3
+            "    while flag:\n"                 # +1, back at depth 0
+            "        flag = False\n"
+        )
+
+        assert calculator._calculate_cognitive_complexity(file_path) == 10
+        assert calculator._calculate_cognitive_complexity(temp_project_dir / "broken.py") == 0
+
+        assert calculator._calculate_cognitive_complexity(temp_project_dir / "missing.py") == 0
+
+        null_bytes = temp_project_dir / "null.py"
+        null_bytes.write_bytes(b"x = 1\0\n")
+        assert calculator._calculate_cognitive_complexity(null_bytes) == 0
+
+        latin1 = temp_project_dir / "latin1.py"
+        latin1.write_bytes(b"# -*- coding: latin-1 -*-\nNAME = '\xe9'\nif NAME:\n    pass\n")
+        assert calculator._calculate_cognitive_complexity(latin1) == 1
+
+    def test_cognitive_complexity_skips_oversized_files(self, temp_project_dir, calculator, monkeypatch):
+        """Test files over the size limit score zero without being parsed."""
+        from code_migration.config import settings
+
+        monkeypatch.setattr(settings.security, 'max_file_size_kb', 0)
+
+        assert calculator._calculate_cognitive_complexity(temp_project_dir / "simple.py") == 0
+        assert not calculator._tree_cache
+
+    def test_file_complexity_cached_until_changed(self, temp_project_dir, calculator):
+        """Test results are reused until the file's mtime or size changes."""
+        file_path = temp_project_dir / "simple.py"
+
+        first = calculator.calculate_file_complexity(file_path)
+        assert calculator.calculate_file_complexity(file_path) is first
+        assert len(calculator._tree_cache) == 1
+
+        file_path.write_text("def add(a, b):\n    if a:\n        return a + b\n    return b\n")
+        second = calculator.calculate_file_complexity(file_path)
+
+        assert second is not first
+        assert second['cyclomatic_complexity'] == 2
+
+    def test_file_complexity_reads_file_once(self, temp_project_dir, calculator, monkeypatch):
+        """Test the cognitive metric reuses the tree parsed for the analysis."""
+        from code_migration.core.confidence import complexity_calculator
+
+        calculator.cache_dir = None
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file parsed twice")
+
+        monkeypatch.setattr(complexity_calculator, 'compile', fail, raising=False)
+        result = calculator.calculate_file_complexity(temp_project_dir / "pkg" / "branches.py")
+
+        assert result['cognitive_complexity'] == 8
+
+    def test_files_complexity_in_threads(self, temp_project_dir, calculator):
+        """Test threaded batch analysis matches per-file results in order."""
+        paths = []
+        for i in range(10):
+            path = temp_project_dir / f"module_{i}.py"
+            path.write_text(f"def handler_{i}(x):\n    if x:\n        return {i}\n    return 0\n")
+            paths.append(path)
+
+        threaded = calculator.calculate_files_complexity(paths, max_workers=4)
+        serial = [ComplexityCalculator(temp_project_dir).calculate_file_complexity(path) for path in paths]
+
+        assert [r['file_path'] for r in threaded] == [str(path) for path in paths]
+        assert [r['cognitive_complexity'] for r in threaded] == [r['cognitive_complexity'] for r in serial]
+        assert all(r['cyclomatic_complexity'] == 2 for r in threaded)
+
+    def test_file_cache_evicts_least_recently_used(self, temp_project_dir, calculator, monkeypatch):
+        """Test the per-file cache stays within its size limit."""
+        from code_migration.core.confidence import complexity_calculator
+
+        monkeypatch.setattr(complexity_calculator, 'FILE_CACHE_SIZE', 2)
+        simple = temp_project_dir / "simple.py"
+        branches = temp_project_dir / "pkg" / "branches.py"
+
+        calculator.calculate_file_complexity(simple)
+        calculator.calculate_file_complexity(branches)
+        calculator.calculate_file_complexity(simple)
+        calculator.calculate_file_complexity(temp_project_dir / "broken.py")
+
+        assert [key[0] for key in calculator._file_cache] == [str(simple), str(temp_project_dir / "broken.py")]
+
+    def test_analyses_persist_across_instances(self, temp_project_dir, calculator, monkeypatch):
+        """Test unchanged files are loaded from the disk cache instead of parsed."""
+        from code_migration.core.security import SafeCodeAnalyzer
+
+        first = calculator.calculate_project_complexity(max_workers=1)
+        # Syntax errors are cached too; they only change when the file does
+        assert len(list(calculator.cache_dir.glob("*.json"))) == 4
+        assert len(list(calculator.cache_dir.glob("project-*.json"))) == 1
+
+        def fail(file_path):
+            raise AssertionError(f"re-parsed {file_path}")
+
+        monkeypatch.setattr(SafeCodeAnalyzer, 'analyze_with_tree', staticmethod(fail))
+        rerun = ComplexityCalculator(temp_project_dir)
+        rerun.cache_dir = calculator.cache_dir
+
+        assert rerun.calculate_project_complexity(max_workers=1, use_cache=False) == first
+
+    def test_unchanged_project_skips_analysis(self, temp_project_dir, calculator, monkeypatch):
+        """Test an unchanged tree returns the stored result without analyzing files."""
+        first = calculator.calculate_project_complexity(max_workers=1)
+
+        def fail(py_files, max_workers):
+            raise AssertionError("project re-analyzed")
+
+        monkeypatch.setattr(calculator, '_analyze_project', fail)
+        assert calculator.calculate_project_complexity(max_workers=1) == first
+
+        monkeypatch.undo()
+        (temp_project_dir / "pkg" / "added.py").write_text("def extra():\n    return 1\n")
+        changed = calculator.calculate_project_complexity(max_workers=1)
+
+        assert changed['total_files'] == first['total_files'] + 1
+
+    def test_cache_version_invalidates_disk_cache(self, temp_project_dir, calculator, monkeypatch):
+        """Test results cached by an older CACHE_VERSION are recomputed."""
+        from code_migration.core.confidence import complexity_calculator
+
+        first = calculator.calculate_project_complexity(max_workers=1)
+        monkeypatch.setattr(complexity_calculator, 'CACHE_VERSION', complexity_calculator.CACHE_VERSION + 1)
+
+        analyzed = []
+        analyze = calculator._analyze_project
+
+        def record(py_files, max_workers):
+            analyzed.append(len(py_files))
+            return analyze(py_files, max_workers)
+
+        monkeypatch.setattr(calculator, '_analyze_project', record)
+        rerun = calculator.calculate_project_complexity(max_workers=1)
+
+        assert analyzed == [3]
+        assert rerun == first
+        # Per-file analyses are stored again under the new version
+        assert len(list(calculator.cache_dir.glob("*.json"))) == 7
+
+    def test_size_limit_change_invalidates_disk_cache(self, temp_project_dir, calculator, monkeypatch):
+        """Test changing the file size limit recomputes the project result."""
+        from code_migration.config import settings
+
+        first = calculator.calculate_project_complexity(max_workers=1)
+        monkeypatch.setattr(settings.security, 'max_file_size_kb', 0)
+        limited = calculator.calculate_project_complexity(max_workers=1)
+
+        assert first['total_functions'] == 2
+        assert limited['total_functions'] == 0
+
+        monkeypatch.undo()
+        assert calculator.calculate_project_complexity(max_workers=1) == first
+
+    def test_concurrent_cache_writes_use_own_temp_files(self, temp_project_dir, monkeypatch):
+        """Test threads writing the same cache entry never share a temp file."""
+        import json
+        import os
+        import threading
+        from code_migration.core.confidence import complexity_calculator
+
+        cache_file = temp_project_dir / ".cache" / "entry.json"
+        barrier = threading.Barrier(2)
+        temp_files = []
+        replace = os.replace
+
+        def synchronized_replace(src, dst):
+            temp_files.append(src)
+            barrier.wait(timeout=5)
+            replace(src, dst)
+
+        monkeypatch.setattr(complexity_calculator.os, 'replace', synchronized_replace)
+        threads = [
+            threading.Thread(target=complexity_calculator._write_analysis_cache, args=(cache_file, {'n': n}))
+            for n in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(temp_files)) == 2
+        assert json.loads(cache_file.read_text()) in ({'n': 0}, {'n': 1})
+        assert list(cache_file.parent.glob("*.tmp")) == []
+
+    def test_disk_cache_disabled(self, temp_project_dir, monkeypatch):
+        """Test an empty cache_dir setting turns the disk cache off."""
+        from code_migration.config import settings
+
+        monkeypatch.setattr(settings.analysis, 'cache_dir', "")
+
+        assert ComplexityCalculator(temp_project_dir).cache_dir is None
+
+    @pytest.mark.parametrize("complexity,level", [
+        (0, "LOW"), (10, "LOW"), (11, "MEDIUM"), (20, "MEDIUM"),
+        (21, "HIGH"), (50, "HIGH"), (51, "VERY_HIGH"),
+    ])
+    def test_complexity_level_boundaries(self, calculator, complexity, level):
+        """Test level thresholds are inclusive upper bounds."""
+        assert calculator._get_complexity_level(complexity) == level
+
+    def test_complexity_distribution(self, calculator):
+        """Test functions are bucketed with inclusive upper bounds."""
+        analysis = {'functions': [{'complexity': c} for c in (1, 5, 6, 10, 11, 20, 21)] + [{}]}
+
+        assert calculator._get_complexity_distribution(analysis) == {
+            'simple': 3, 'moderate': 2, 'complex': 2, 'very_complex': 1
+        }
+        assert calculator._get_complexity_distribution({'functions': []}) == {
+            'simple': 0, 'moderate': 0, 'complex': 0, 'very_complex': 0
+        }
+
+    def test_maintainability_index_memoized(self, calculator):
+        """Test identical metric triples reuse the computed index."""
+        from code_migration.core.confidence.complexity_calculator import _maintainability_index
+
+        _maintainability_index.cache_clear()
+        first = calculator._calculate_maintainability_index(2000, 100, 25)
+        second = calculator._calculate_maintainability_index(2000, 100, 25)
+
+        assert first == second
+        assert 0 < first < 100
+        assert _maintainability_index.cache_info().hits == 1
+        assert calculator._calculate_maintainability_index(10, 0, 0) == 100.0
+
+    def test_complexity_report(self, calculator):
+        """Test the report renders every section in order."""
+        report = calculator.generate_complexity_report(calculator.calculate_project_complexity(max_workers=1))
+        lines = report.split("\n")
+
+        assert lines[0] == "📊 CODE COMPLEXITY ANALYSIS"
+        assert "  Simple (≤5): 2 functions" in lines
+        assert lines.index("📊 COMPLEXITY DISTRIBUTION:") < lines.index("🔍 ASSESSMENT:")
+        assert lines[-1] == "  ✅ Low complexity"
+        assert not report.endswith("\n")
+
+        assert calculator.generate_complexity_report({'error': 'boom'}) == "❌ Error calculating complexity: boom"
+
+    def test_code_analyzer_shared(self, temp_project_dir, calculator):
+        """Test calculators share one code analyzer."""
+        assert ComplexityCalculator(temp_project_dir).code_analyzer is calculator.code_analyzer
+
+    def test_missing_project(self, temp_project_dir):
+        """Test a missing project directory is reported as an error."""
+        result = ComplexityCalculator(temp_project_dir / "missing").calculate_project_complexity()
+
+        assert 'error' in result
+        assert result['total_files'] == 0
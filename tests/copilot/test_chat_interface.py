@@ -0,0 +1,169 @@
+"""
+Test suite for the co-pilot chat interface.
+
+Tests lazy engine creation and message rendering.
+"""
+
+import io
+
+import pytest
+from pathlib import Path
+
+from code_migration.core.copilot import ChatInterface, MigrationCopilot
+from code_migration.core.copilot.copilot_engine import CopilotResponse
+
+
+class TestChatInterface:
+    """Test chat interface behavior."""
+
+    @pytest.fixture
+    def temp_project_dir(self):
+        """Create a temporary project directory."""
+        from tempfile import TemporaryDirectory
+
+        with TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+
+    def test_copilot_created_on_first_use(self, temp_project_dir):
+        """Test the engine is only built when something needs it."""
+        chat = ChatInterface(temp_project_dir)
+
+        assert chat._copilot is None
+        assert not (temp_project_dir / '.migration-logs').exists()
+
+        copilot = chat.copilot
+        assert isinstance(copilot, MigrationCopilot)
+        assert chat.copilot is copilot
+
+    def test_summary_reused_until_conversation_changes(self, temp_project_dir):
+        """Test the summary is recomputed only after a message or a clear."""
+        calls = []
+
+        class StubCopilot:
+            def get_conversation_summary(self):
+                calls.append('summary')
+                return {'total_messages': len(calls)}
+
+            def chat(self, message, context=None):
+                return None
+
+            def clear_conversation(self):
+                pass
+
+        chat = ChatInterface(temp_project_dir)
+        chat._copilot = StubCopilot()
+
+        first = chat.get_conversation_summary()
+        assert chat.get_conversation_summary() is first
+
+        chat.send_message("hello")
+        assert chat.get_conversation_summary() == {'total_messages': 2}
+
+        chat.clear_conversation()
+        assert chat.get_conversation_summary() == {'total_messages': 3}
+        assert len(calls) == 3
+
+    def test_print_status(self, temp_project_dir, capsys):
+        """Test status output lists discussed topics."""
+        chat = ChatInterface(temp_project_dir)
+        chat._copilot = type('StubCopilot', (), {
+            'get_conversation_summary': lambda self: {
+                'conversation_duration': 2.5,
+                'total_messages': 3,
+                'user_messages': 2,
+                'assistant_messages': 1,
+                'topics_discussed': ['react', 'testing'],
+                'average_confidence': 0.8,
+            }
+        })()
+
+        chat._print_status()
+        output = capsys.readouterr().out
+
+        assert "Duration: 2.5 minutes" in output
+        assert "  - react\n  - testing\n" in output
+        assert "Average Confidence: 80%" in output
+
+    def test_analyze_command_reads_file(self, temp_project_dir, monkeypatch, capsys):
+        """Test the analyze command passes decoded file content to the engine."""
+        (temp_project_dir / "app.js").write_bytes("var x = 'é';\r\n".encode('utf-8'))
+        analyzed = []
+        chat = ChatInterface(temp_project_dir)
+        chat._copilot = type('StubCopilot', (), {
+            'analyze_code_issues': lambda self, code, language: analyzed.append((code, language)) or []
+        })()
+
+        answers = iter(["app.js", "javascript"])
+        monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+        chat._handle_analyze_command()
+
+        assert analyzed == [("var x = 'é';\n", "javascript")]
+        assert "No migration issues detected" in capsys.readouterr().out
+
+    def test_analyze_command_rejects_non_utf8(self, temp_project_dir, monkeypatch, capsys):
+        """Test a file that is not UTF-8 is reported instead of analyzed."""
+        (temp_project_dir / "app.js").write_bytes(b"var x = '\xff';\n")
+        chat = ChatInterface(temp_project_dir)
+        answers = iter(["app.js", "javascript"])
+        monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+
+        chat._handle_analyze_command()
+
+        assert "Error analyzing file" in capsys.readouterr().out
+        assert chat._copilot is None
+
+    def test_analyze_command_lists_issues(self, temp_project_dir, monkeypatch, capsys):
+        """Test issues are listed with their severity markers."""
+        (temp_project_dir / "app.js").write_text("componentWillMount() {}\n")
+        chat = ChatInterface(temp_project_dir)
+        chat._copilot = type('StubCopilot', (), {
+            'analyze_code_issues': lambda self, code, language: [
+                {'type': 'Deprecated', 'severity': 'ERROR', 'message': 'Old lifecycle', 'suggestion': 'Use effects'},
+                {'type': 'Style', 'severity': 'LOW', 'message': 'Unknown severity'},
+                {'message': 'No severity'},
+            ]
+        })()
+
+        answers = iter(["app.js", "javascript"])
+        monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+        chat._handle_analyze_command()
+        output = capsys.readouterr().out
+
+        assert "Found 3 potential issues:\n\n1. 🔴 Deprecated\n   Severity: ERROR\n   Old lifecycle\n" in output
+        assert "   💡 Suggestion: Use effects\n\n2. ⚪ Style\n   Severity: LOW\n" in output
+        assert "3. 🔵 Issue\n   Severity: Unknown\n   No severity\n\n" in output
+
+    def test_analyze_command_missing_file(self, temp_project_dir, monkeypatch, capsys):
+        """Test a missing file is reported without reaching the engine."""
+        chat = ChatInterface(temp_project_dir)
+        answers = iter(["missing.js", "javascript"])
+        monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+
+        chat._handle_analyze_command()
+
+        assert "File not found: missing.js" in capsys.readouterr().out
+        assert chat._copilot is None
+
+    def test_piped_session(self, temp_project_dir, monkeypatch, capsys):
+        """Test a session driven from piped input answers each line and stops at EOF."""
+        chat = ChatInterface(temp_project_dir)
+        chat._copilot = type('StubCopilot', (), {
+            'chat': lambda self, message, context=None: CopilotResponse(
+                response_id='r1',
+                message=f"echo {message}",
+                suggestions=['Write tests'],
+                code_examples=["\n".join(f"line {i}" for i in range(12))],
+                documentation_links=['https://example.com/docs'],
+                confidence=0.75,
+                context_used=[]
+            )
+        })()
+        monkeypatch.setattr('sys.stdin', io.StringIO("hello\n\n"))
+
+        chat.start_interactive_session()
+        output = capsys.readouterr().out
+
+        assert output.count("🧑 You: ") == 3
+        assert "🤖 Co-pilot (confidence: 75%):\necho hello\n\n💡 Suggestions:\n  1. Write tests\n" in output
+        assert "    line 9\n    ... (2 more lines)\n" in output
+        assert "  - https://example.com/docs\n" in output
@@ -0,0 +1,406 @@
+"""
+Test suite for the Migration Co-pilot engine.
+
+Tests intent detection, code issue rules, chat response caching,
+recommendation retrieval and conversation persistence.
+"""
+
+import pytest
+from pathlib import Path
+
+from code_migration.core.copilot import MigrationCopilot
+
+
+class TestMigrationCopilot:
+    """Test co-pilot engine behavior."""
+
+    @pytest.fixture
+    def temp_project_dir(self):
+        """Create a temporary project directory."""
+        from tempfile import TemporaryDirectory
+
+        with TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+
+    @pytest.fixture
+    def copilot(self, temp_project_dir):
+        """Create co-pilot counting knowledge retrievals."""
+        copilot = MigrationCopilot(temp_project_dir)
+        copilot.retrievals = 0
+        retrieve = copilot.rag_system.retrieve_relevant_context
+
+        def counting_retrieve(*args, **kwargs):
+            copilot.retrievals += 1
+            return retrieve(*args, **kwargs)
+
+        copilot.rag_system.retrieve_relevant_context = counting_retrieve
+        return copilot
+
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    @pytest.mark.parametrize("message,intent", [
+        ("Why does the build fail with this error?", 'troubleshoot'),
+        ("Can you explain and plan the migration?", 'explain'),
+        ("Please schedule the code migration", 'code_help'),
+        ("Is this safe?", 'security'),
+        ("Two errors remain after planning", 'troubleshoot'),
+        ("Should I upgrade?", 'recommend'),
+        ("Hello there", 'general'),
+    ])
+    def test_analyze_intent(self, copilot, monkeypatch, use_automaton, message, intent):
+        """Test the highest-priority intent wins with either keyword scanner."""
+        from code_migration.core.copilot import copilot_engine
+
+        if not use_automaton:
+            monkeypatch.setattr(copilot_engine, '_INTENT_AUTOMATON', None)
+        elif copilot_engine._INTENT_AUTOMATON is None:
+            pytest.skip("pyahocorasick not installed")
+
+        assert copilot._analyze_intent(message) == intent
+
+    def test_analyze_javascript_issues(self, copilot):
+        """Test class components and lifecycle methods are each reported once, in rule order."""
+        code = (
+            "class App extends React.Component {\n"
+            "  componentDidUpdate() { this.setState({ready: true}); }\n"
+            "  componentDidMount() { this.setState({ready: false}); }\n"
+            "}\n"
+        )
+
+        issues = copilot.analyze_code_issues(code, 'jsx')
+        rule_issues = [issue for issue in issues if issue['type'] != 'pattern_match']
+
+        assert [issue['type'] for issue in rule_issues] == [
+            'class_component', 'lifecycle_method', 'lifecycle_method', 'set_state'
+        ]
+        assert 'componentDidMount' in rule_issues[1]['message']
+        assert 'componentDidUpdate' in rule_issues[2]['message']
+
+    def test_analyze_python_issues(self, copilot):
+        """Test print statements are found even when print() calls are present."""
+        issues = copilot.analyze_code_issues('print "total"\nprint(x)\nhalf = x / 2\n', 'python')
+
+        assert [issue['type'] for issue in issues][:2] == ['python2_print', 'integer_division']
+        assert copilot.analyze_code_issues('print(x)\nprint (y)\n', 'python') == []
+
+    def test_troubleshoot_intent_in_chat(self, copilot):
+        """Test troubleshooting questions are answered through chat."""
+        response = copilot.chat("The build fails with an error")
+
+        assert response.message.startswith("I can help you troubleshoot")
+        assert response.suggestions[0] == "Check the error logs for more details"
+        assert response.documentation_links[0] == 'https://docs.code-migration.ai/troubleshooting'
+
+    def test_troubleshoot_issue(self, copilot):
+        """Test the full troubleshooting report includes steps and error details."""
+        response = copilot.troubleshoot_issue("Imports break", error_message="ModuleNotFoundError: foo")
+
+        assert response.message.startswith("I've analyzed your issue: Imports break")
+        assert "4. Review the migration logs for more details" in response.message
+        assert response.message.endswith("Error Details:\nModuleNotFoundError: foo")
+        assert response.confidence == 0.85
+
+        response.suggestions.append("mutated")
+        assert "mutated" not in copilot.troubleshoot_issue("Imports break").suggestions
+
+    def test_documentation_links(self, copilot):
+        """Test links come from the intent's table, falling back to the general ones."""
+        links = copilot._generate_documentation_links('security', [])
+
+        assert links == ['https://docs.code-migration.ai/security', 'https://docs.code-migration.ai/compliance']
+        assert copilot._generate_documentation_links('unknown', []) == (
+            copilot._generate_documentation_links('general', [])
+        )
+
+        links.clear()
+        assert copilot._generate_documentation_links('security', [])
+
+    def test_rephrased_question_reuses_response(self, copilot):
+        """Test a rephrasing with the same keywords skips retrieval."""
+        first = copilot.chat("Explain React hooks")
+        second = copilot.chat("explain the react hooks?")
+
+        assert copilot.retrievals == 1
+        assert second.message == first.message
+        assert second.context_used == first.context_used
+        assert len(copilot.conversation_history) >= 4
+
+    def test_cached_responses_do_not_share_lists(self, copilot):
+        """Test editing one response leaves later cache hits untouched."""
+        first = copilot.chat("Explain React hooks")
+        first.suggestions.append("mutated")
+        first.context_used.append("mutated")
+
+        second = copilot.chat("Explain React hooks")
+        second.documentation_links.clear()
+        third = copilot.chat("Explain React hooks")
+
+        assert copilot.retrievals == 1
+        assert "mutated" not in second.suggestions
+        assert "mutated" not in copilot.conversation_history[-1].context['knowledge_used']
+        assert third.documentation_links
+        assert second.context_used is not third.context_used
+
+    def test_near_duplicate_within_distance(self, copilot):
+        """Test keyword sets within the configured Jaccard distance share a response."""
+        copilot.response_cache_distance = 0.3
+        copilot.chat("Explain React hooks")
+        copilot.chat("Explain React hooks migration")
+
+        assert copilot.retrievals == 1
+
+        copilot.response_cache_distance = 0.05
+        copilot.chat("Explain React hooks migration timing")
+
+        assert copilot.retrievals == 2
+
+    def test_near_duplicate_picks_closest(self, copilot):
+        """Test the nearest same-intent entry answers, skipping ones too different in size."""
+        copilot.response_cache_distance = 0.3
+        copilot.chat("Explain React hooks migration")
+        copilot.chat("Explain React hooks migration timing strategy rollout")
+        copilot.chat("Plan React hooks migration timing")
+        assert copilot.retrievals == 3
+
+        copilot.chat("Explain React hooks migration timing")
+
+        assert copilot.retrievals == 3
+        # The reused entry is refreshed as most recently used
+        assert list(copilot._response_cache)[-1] == (
+            'explain', frozenset({'explain', 'react', 'hooks', 'migration'})
+        )
+
+    def test_messages_use_slots(self, copilot):
+        """Test messages and responses carry no per-instance dict."""
+        response = copilot.chat("Explain React hooks")
+
+        assert not hasattr(response, '__dict__')
+        assert not hasattr(copilot.conversation_history[-1], '__dict__')
+        assert copilot.chat("Explain React hooks").message == response.message
+
+    def test_turn_shares_one_timestamp(self, copilot):
+        """Test a turn's messages and response are stamped from one clock reading."""
+        response = copilot.chat("Explain React hooks")
+        user_msg, assistant_msg = copilot.conversation_history[-2:]
+
+        tag = user_msg.message_id[len("msg_"):]
+        assert assistant_msg.message_id == f"msg_{tag}_response"
+        assert response.response_id == f"resp_{tag}"
+        assert assistant_msg.timestamp == user_msg.timestamp
+
+    def test_different_question_misses(self, copilot):
+        """Test other keywords or another intent are answered afresh."""
+        copilot.chat("Explain React hooks")
+        copilot.chat("Explain Vue composition")
+        copilot.chat("Plan React hooks")
+
+        assert copilot.retrievals == 3
+
+    def test_index_change_invalidates_cache(self, copilot):
+        """Test responses cached before the RAG index changed are not reused."""
+        copilot.chat("Explain React hooks")
+        copilot.rag_system.add_document("React hooks replace lifecycle methods.", "notes", "documentation")
+        copilot.chat("Explain React hooks")
+
+        assert copilot.retrievals == 2
+
+    def test_recommendations_retrieve_in_one_batch(self, copilot):
+        """Test every recommendation gets context from a single batched retrieval."""
+        batches = []
+        retrieve_batch = copilot.rag_system.retrieve_relevant_context_batch
+
+        def recording_batch(queries, **kwargs):
+            batches.append(queries)
+            return retrieve_batch(queries, **kwargs)
+
+        copilot.rag_system.retrieve_relevant_context_batch = recording_batch
+        recommendations = copilot.get_migration_recommendations('react-hooks')
+
+        assert recommendations
+        assert len(batches) == 1
+        assert len(batches[0]) == len(recommendations)
+        assert all(len(rec['additional_context']) <= 3 for rec in recommendations)
+        assert copilot.retrievals == 0
+
+    def test_conversation_log_appends_and_reloads(self, temp_project_dir, copilot):
+        """Test each turn appends its messages and a new engine reloads them."""
+        log_file = temp_project_dir / '.migration-copilot.jsonl'
+
+        def message_lines():
+            return [line for line in log_file.read_text().splitlines() if '"message_id"' in line]
+
+        copilot.chat("Explain React hooks")
+        first_turn = message_lines()
+        copilot.chat("Explain Vue composition")
+
+        # First turn saves the system message too; later turns only add two
+        assert len(first_turn) == 3
+        assert len(message_lines()) == 5
+        # The repeated assistant reply is stored once
+        assert log_file.read_text().count("Let me explain this concept") == 1
+
+        with open(log_file, 'a') as f:
+            f.write('{"message_id": "truncat')
+
+        reloaded = MigrationCopilot(temp_project_dir)
+        contents = [m.content for m in reloaded.conversation_history]
+        assert "Explain Vue composition" in contents
+        assert contents.index("Explain React hooks") < contents.index("Explain Vue composition")
+
+    def test_conversation_duration(self, temp_project_dir):
+        """Test duration spans the first loaded message to the latest one."""
+        import json
+        from datetime import datetime
+
+        records = [
+            {'message_id': 'a', 'timestamp': '2026-01-01T10:00:00', 'role': 'user', 'content': 'hi'},
+            {'message_id': 'b', 'timestamp': 'yesterday', 'role': 'user', 'content': 'bad'},
+            {'message_id': 'c', 'timestamp': '2026-01-01T10:30:00', 'role': 'assistant', 'content': 'hello'},
+        ]
+        (temp_project_dir / '.migration-copilot.jsonl').write_text(
+            "".join(json.dumps(dict(record, context={}, metadata={})) + "\n" for record in records)
+        )
+
+        copilot = MigrationCopilot(temp_project_dir)
+        copilot._started = datetime(2026, 1, 1, 10, 45)
+
+        assert [m.message_id for m in copilot.conversation_history][:2] == ['a', 'c']
+        assert copilot.get_conversation_summary()['conversation_duration'] == 45
+
+    def test_append_after_torn_line(self, temp_project_dir, copilot):
+        """Test a record appended after a crash's partial line is still readable."""
+        log_file = temp_project_dir / '.migration-copilot.jsonl'
+        copilot.chat("Explain React hooks")
+        with open(log_file, 'a') as f:
+            f.write('{"message_id": "truncat')
+
+        resumed = MigrationCopilot(temp_project_dir)
+        resumed.chat("Plan the rollout")
+
+        saved = resumed.conversation_history
+        reloaded = MigrationCopilot(temp_project_dir).conversation_history
+        # Every saved message is read back, including the first one appended
+        assert [m.message_id for m in reloaded[:len(saved)]] == [m.message_id for m in saved]
+
+    def test_legacy_conversation_imported(self, temp_project_dir):
+        """Test a conversation saved as one JSON document is carried over once."""
+        import json
+
+        legacy = {'messages': [
+            {'message_id': 'a', 'timestamp': '2026-01-01T10:00:00', 'role': 'user',
+             'content': 'Old question', 'context': {}, 'metadata': {}},
+            {'message_id': 'b', 'timestamp': '2026-01-01T10:01:00', 'role': 'assistant',
+             'content': 'Old answer', 'context': {'intent': 'general'}, 'metadata': {'confidence': 0.7}},
+        ]}
+        (temp_project_dir / '.migration-copilot.json').write_text(json.dumps(legacy))
+
+        copilot = MigrationCopilot(temp_project_dir)
+        assert [m.content for m in copilot.conversation_history[:2]] == ['Old question', 'Old answer']
+        copilot.chat("Explain React hooks")
+
+        (temp_project_dir / '.migration-copilot.json').unlink()
+        contents = [m.content for m in MigrationCopilot(temp_project_dir).conversation_history]
+        assert contents[:2] == ['Old question', 'Old answer']
+        assert "Explain React hooks" in contents
+
+    def test_conversation_log_compacts(self, temp_project_dir, copilot, monkeypatch):
+        """Test the log is rewritten with recent messages once it grows too long."""
+        from code_migration.core.copilot import copilot_engine
+
+        monkeypatch.setattr(copilot_engine, 'CONVERSATION_HISTORY_LIMIT', 4)
+        monkeypatch.setattr(copilot_engine, 'CONVERSATION_COMPACT_LINES', 8)
+        for i in range(6):
+            copilot.chat(f"Explain topic{i}")
+
+        text = (temp_project_dir / '.migration-copilot.jsonl').read_text()
+        assert text.count('"message_id"') <= 8
+        assert "Explain topic0" not in text
+
+        contents = [m.content for m in MigrationCopilot(temp_project_dir).conversation_history]
+        assert "Explain topic5" in contents
+
+    def test_conversation_log_loaded_on_first_use(self, temp_project_dir, copilot, monkeypatch):
+        """Test the log is only read once the history is needed."""
+        copilot.chat("Explain React hooks")
+        loads = []
+        monkeypatch.setattr(MigrationCopilot, '_load_conversation_history', lambda self: loads.append(self))
+
+        fresh = MigrationCopilot(temp_project_dir)
+        fresh.analyze_code_issues('print "hi"\n', 'python')
+        fresh.get_migration_recommendations('react-hooks')
+        assert loads == []
+
+        fresh.get_conversation_summary()
+        fresh.get_conversation_summary()
+        assert loads == [fresh]
+
+    def test_clear_conversation_empties_log(self, temp_project_dir, copilot):
+        """Test clearing the conversation also clears the saved log."""
+        copilot.chat("Explain React hooks")
+        copilot.clear_conversation()
+
+        assert (temp_project_dir / '.migration-copilot.jsonl').read_text() == ""
+        assert MigrationCopilot(temp_project_dir).conversation_history[0].role == 'system'
+
+    def test_conversation_summary_totals(self, temp_project_dir, copilot):
+        """Test summary totals follow chats, reloads and clears."""
+        first = copilot.chat("Explain React hooks")
+        second = copilot.chat("Plan the rollout")
+
+        summary = copilot.get_conversation_summary()
+        assert summary['total_messages'] == 5
+        assert summary['user_messages'] == 2
+        assert summary['assistant_messages'] == 2
+        assert summary['topics_discussed'] == ['explain', 'planning']
+        assert summary['average_confidence'] == pytest.approx((first.confidence + second.confidence) / 2)
+
+        reloaded = MigrationCopilot(temp_project_dir).get_conversation_summary()
+        assert reloaded['total_messages'] == 6
+        assert reloaded['assistant_messages'] == 2
+        assert reloaded['average_confidence'] == summary['average_confidence']
+
+        copilot.clear_conversation()
+        cleared = copilot.get_conversation_summary()
+        assert cleared['user_messages'] == 0
+        assert cleared['topics_discussed'] == []
+        assert cleared['average_confidence'] == 0
+
+    def test_conversation_summary_after_direct_edits(self, copilot):
+        """Test summary totals are rebuilt when the history list is edited directly."""
+        copilot.chat("Explain React hooks")
+        copilot.conversation_history.clear()
+
+        cleared = copilot.get_conversation_summary()
+        assert cleared['total_messages'] == 0
+        assert cleared['user_messages'] == 0
+        assert cleared['assistant_messages'] == 0
+        assert cleared['average_confidence'] == 0
+
+        copilot.chat("Plan the rollout")
+        copilot.conversation_history[-1] = copilot.conversation_history[-2]
+
+        summary = copilot.get_conversation_summary()
+        assert summary['user_messages'] == 2
+        assert summary['assistant_messages'] == 0
+        assert summary['topics_discussed'] == []
+        assert summary['conversation_duration'] == 0
+
+    def test_assign_conversation_history(self, temp_project_dir, copilot):
+        """Test assigning the history replaces the summary and the saved log."""
+        copilot.chat("Explain React hooks")
+        kept = copilot.conversation_history[-2:]
+
+        copilot.conversation_history = list(kept)
+        summary = copilot.get_conversation_summary()
+        assert summary['total_messages'] == 2
+        assert summary['user_messages'] == 1
+
+        copilot.chat("Plan the rollout")
+        reloaded = MigrationCopilot(temp_project_dir).conversation_history
+        assert [m.content for m in reloaded[:3]] == ["Explain React hooks", kept[1].content, "Plan the rollout"]
+
+    def test_cache_disabled(self, temp_project_dir):
+        """Test a zero cache size answers every message afresh."""
+        copilot = MigrationCopilot(temp_project_dir, response_cache_size=0)
+        copilot.chat("Explain React hooks")
+
+        assert not copilot._response_cache
@@ -0,0 +1,41 @@
+"""
+Test suite for the RAG knowledge retrieval system.
+
+Tests single and batched context retrieval.
+"""
+
+import pytest
+from pathlib import Path
+
+from code_migration.core.copilot import RAGSystem
+
+
+class TestRAGSystem:
+    """Test knowledge retrieval."""
+
+    @pytest.fixture
+    def rag(self):
+        """Create RAG system with its built-in index in a temp directory."""
+        from tempfile import TemporaryDirectory
+
+        with TemporaryDirectory() as temp_dir:
+            yield RAGSystem(Path(temp_dir))
+
+    def test_retrieve_relevant_context(self, rag):
+        """Test retrieval returns matching chunk contents within the limit."""
+        # Short enough that every keyword is indexed
+        rag.add_document("Zustand stores replace Redux reducers with small hooks for shared state.", "notes", "documentation")
+
+        context = rag.retrieve_relevant_context("zustand reducers", limit=2)
+
+        assert 0 < len(context) <= 2
+        assert "Zustand stores replace Redux reducers with small hooks for shared state." in context
+
+    def test_batch_matches_single_queries(self, rag):
+        """Test batched retrieval returns the per-query results in order."""
+        queries = ["react hooks useState", "python print function", "react hooks useState", "nothing matches zzz"]
+
+        batch = rag.retrieve_relevant_context_batch(queries, limit=3)
+
+        assert batch == [rag.retrieve_relevant_context(query, limit=3) for query in queries]
+        assert batch[-1] == []
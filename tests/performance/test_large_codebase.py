@@ -651,6 +651,31 @@ class TestLargeCodebasePerformance:
             print(f"PII scan completed in {scan_time:.2f}s")
             print(f"Scanned {results['files_scanned']} files, found {results['total_findings']} PII instances")
     
+    @pytest.mark.timeout(120)
+    def test_pii_detector_parallel_scan(self, tmp_path):
+        """Compare serial and process-pool PII scans over the same files."""
+        pii_project = tmp_path / "pii_parallel_project"
+        pii_project.mkdir()
+        
+        num_files = 50
+        for i in range(num_files):
+            content = f'# Service {i}\nemail = "test_user_{i}@example.com"\nphone = "555-123-4567"\n' * 20
+            (pii_project / f"service_{i}.py").write_text(content)
+        
+        with PIIDetector(pii_project) as detector:
+            start_time = time.time()
+            serial = detector.scan_directory(file_extensions=['.py'], max_workers=1)
+            serial_time = time.time() - start_time
+            
+            start_time = time.time()
+            parallel = detector.scan_directory(file_extensions=['.py'], max_workers=os.cpu_count() or 1)
+            parallel_time = time.time() - start_time
+            
+            assert parallel['files_scanned'] == serial['files_scanned'] == num_files
+            assert parallel['total_findings'] == serial['total_findings']
+            
+            print(f"PII scan: serial {serial_time:.2f}s, parallel {parallel_time:.2f}s")
+    
     def test_concurrent_analysis(self, large_project):
         """Test concurrent analysis performance."""
         import concurrent.futures